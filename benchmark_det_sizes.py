@@ -0,0 +1,46 @@
+"""
+Check that adaptive detector sizes give the same embeddings as full-size detection.
+
+Usage:
+    python benchmark_det_sizes.py [sample_size]
+
+Embeds a sample of SCUT-FBP5500 faces with det_sizes=(640,) (what the saved
+models and embedding caches were built from) and with ADAPTIVE_DET_SIZES, then
+reports the cosine similarity between the two and the time each took. Only
+switch FaceProcesser's default once the similarities are ~1.
+"""
+
+import sys
+import numpy as np
+from face_processer import ADAPTIVE_DET_SIZES, FaceProcesser
+from kaggle_data import KaggleData
+
+SCUT_SAMPLE = 500
+
+
+if __name__ == "__main__":
+    sample_size = int(sys.argv[1]) if len(sys.argv) > 1 else SCUT_SAMPLE
+    paths = list(KaggleData().getSCUTData()["path"].sample(sample_size, random_state=0))
+
+    full = FaceProcesser(det_sizes=(640,))
+    full_embeddings, full_ok = full.get_embeddings_batch(paths, dataset="SCUT 640px")
+    full_seconds = full.batch_stats["seconds"]
+
+    adaptive = FaceProcesser(det_sizes=ADAPTIVE_DET_SIZES)
+    adaptive_embeddings, adaptive_ok = adaptive.get_embeddings_batch(paths, dataset="SCUT adaptive")
+    adaptive_seconds = adaptive.batch_stats["seconds"]
+
+    both = full_ok & adaptive_ok
+    similarities = np.sum(full_embeddings[both] * adaptive_embeddings[both], axis=1)
+
+    print("=" * 60)
+    print(f"ADAPTIVE VS 640px DETECTION ({len(paths)} SCUT images)")
+    print("=" * 60)
+    print(f"Embedded:   640px {int(full_ok.sum())}, adaptive {int(adaptive_ok.sum())}, both {int(both.sum())}")
+    if both.any():
+        print(f"Cosine:     mean {similarities.mean():.4f}, 1st pct {np.percentile(similarities, 1):.4f}, "
+              f"min {similarities.min():.4f}")
+        print(f"Below 0.99: {int((similarities < 0.99).sum())} images")
+    print(f"Time:       640px {full_seconds:.1f}s, adaptive {adaptive_seconds:.1f}s "
+          f"({full_seconds / adaptive_seconds:.2f}x)")
+    print("=" * 60)
@@ -0,0 +1,94 @@
+"""
+Benchmark FaceProcesser's largest-face-only mode against FaceAnalysis.get,
+which runs every loaded model on every detection before the largest face is kept.
+
+Usage:
+    python benchmark_face_modes.py [crowded_image ...]
+
+Runs on a sample of SCUT-FBP5500 faces (one face each) and, if given, on
+crowded photos (many faces, where the saving is largest). The repo ships no
+multi-face photos, so pass your own; any with fewer than two detected faces
+are left out of the crowded row.
+"""
+
+import sys
+import time
+import cv2
+import numpy as np
+from face_processer import FaceProcesser
+from kaggle_data import KaggleData
+
+SCUT_SAMPLE = 200
+MIN_CROWDED_FACES = 2
+
+
+def measure(processor: FaceProcesser, images, largest_face_only: bool):
+    """
+    Returns:
+        (ms per image, embeddings with None where no face was found)
+    """
+    processor.largest_face_only = largest_face_only
+    embeddings = []
+    start = time.perf_counter()
+    for img in images:
+        try:
+            embeddings.append(processor._get_embedding_from_bgr_image(img))
+        except ValueError:
+            embeddings.append(None)
+    return (time.perf_counter() - start) / len(images) * 1000, embeddings
+
+
+def count_faces(processor: FaceProcesser, img) -> int:
+    return len(processor.app.det_model.detect(img, max_num=0, metric="default")[0])
+
+
+def run(processor: FaceProcesser, name: str, images):
+    # Warm-up so ONNX session initialization isn't billed to the first mode
+    measure(processor, images[:5], largest_face_only=False)
+    detections = [count_faces(processor, img) for img in images]
+    all_ms, all_embeddings = measure(processor, images, largest_face_only=False)
+    largest_ms, largest_embeddings = measure(processor, images, largest_face_only=True)
+
+    # Both modes should embed the same face
+    similarities = [
+        float(np.dot(a, b)) for a, b in zip(all_embeddings, largest_embeddings)
+        if a is not None and b is not None
+    ]
+    print(f"{name:<10} {len(images):>6} {np.mean(detections):>10.1f} {all_ms:>12.1f} ms "
+          f"{largest_ms:>12.1f} ms {all_ms / largest_ms:>8.1f}x "
+          f"{min(similarities) if similarities else float('nan'):>10.4f}")
+
+
+if __name__ == "__main__":
+    crowded_paths = sys.argv[1:]
+
+    df_scut = KaggleData().getSCUTData()
+    scut_images = [cv2.imread(path) for path in df_scut["path"].sample(SCUT_SAMPLE, random_state=0)]
+
+    # Full-size detection only, so the comparison isolates the recognition savings;
+    # full-analysis so the all-faces mode pays for every model as before
+    processor = FaceProcesser(profile="full-analysis", det_sizes=(640,))
+
+    crowded_images = []
+    for path in crowded_paths:
+        img = cv2.imread(path)
+        if img is None:
+            print(f"Skipping {path}: could not read image")
+            continue
+        faces = count_faces(processor, img)
+        if faces < MIN_CROWDED_FACES:
+            print(f"Skipping {path}: {faces} face(s) detected, not a crowded photo")
+            continue
+        crowded_images.append(img)
+    print("=" * 80)
+    print("LARGEST-FACE-ONLY BENCHMARK (CPU)")
+    print("=" * 80)
+    print(f"{'Dataset':<10} {'Images':>6} {'Faces/img':>10} {'All faces':>15} {'Largest only':>15} "
+          f"{'Speedup':>9} {'Min cos':>10}")
+    print("-" * 80)
+    run(processor, "SCUT", scut_images)
+    if crowded_images:
+        run(processor, "Crowded", crowded_images)
+    else:
+        print("(no crowded photos measured; pass multi-face images as arguments)")
+    print("=" * 80)
@@ -0,0 +1,79 @@
+"""
+Benchmark FaceProcesser's model profiles: construction time, model load time
+(paid on the first image), memory and per-image latency.
+
+Usage:
+    python benchmark_face_profiles.py [profile ...]
+
+Each profile runs in a fresh process so its models are loaded from cold and
+its peak RSS isn't inflated by another profile's ONNX sessions. Both profiles
+embed through the same path (FaceAnalysis.get at 640px), so the latency gap is
+only the extra models the profile loads.
+"""
+
+import multiprocessing
+import resource
+import sys
+import time
+import cv2
+from face_processer import FaceProcesser, PROFILES
+from kaggle_data import KaggleData
+
+SCUT_SAMPLE = 200
+
+
+def rss_mib() -> float:
+    """Peak resident set size of this process (ru_maxrss is in KiB on Linux)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(profile: str, paths) -> dict:
+    images = [cv2.imread(path) for path in paths]
+    baseline_rss = rss_mib()
+
+    start = time.perf_counter()
+    processor = FaceProcesser(profile=profile, largest_face_only=False, det_sizes=(640,))
+    construct_s = time.perf_counter() - start
+
+    # First image triggers the model load; time it separately from steady state
+    start = time.perf_counter()
+    processor.app
+    load_s = time.perf_counter() - start
+    loaded_modules = sorted(processor.app.models)
+
+    start = time.perf_counter()
+    for img in images:
+        try:
+            processor._get_embedding_from_bgr_image(img)
+        except ValueError:
+            pass
+    per_image_ms = (time.perf_counter() - start) / len(images) * 1000
+
+    return {
+        "construct_ms": construct_s * 1000,
+        "load_s": load_s,
+        "rss_mib": rss_mib() - baseline_rss,
+        "per_image_ms": per_image_ms,
+        "modules": loaded_modules,
+    }
+
+
+if __name__ == "__main__":
+    profiles = sys.argv[1:] or list(PROFILES)
+    paths = list(KaggleData().getSCUTData()["path"].sample(SCUT_SAMPLE, random_state=0))
+
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for profile in profiles:
+        with context.Pool(1) as pool:
+            results[profile] = pool.apply(measure, (profile, paths))
+
+    print("=" * 80)
+    print(f"FACE PROCESSER PROFILES (CPU, {len(paths)} SCUT images)")
+    print("=" * 80)
+    print(f"{'Profile':<15} {'Construct':>10} {'Model load':>11} {'RSS':>10} {'Per image':>11}  Modules")
+    print("-" * 80)
+    for profile, r in results.items():
+        print(f"{profile:<15} {r['construct_ms']:>7.1f} ms {r['load_s']:>9.2f} s "
+              f"{r['rss_mib']:>6.0f} MiB {r['per_image_ms']:>8.1f} ms  {', '.join(r['modules'])}")
+    print("=" * 80)
@@ -0,0 +1,68 @@
+"""
+Benchmark full SpecificPlayerInfo validation against the projected landing parse
+used by collect_all_player_data.py (only SIMPLE_PLAYER_FIELDS and one season).
+
+Usage:
+    python benchmark_landing_parse.py [player_id ...]
+
+Landing payloads come through the HTTP cache, so repeated runs stay offline.
+"""
+
+import sys
+import time
+import tracemalloc
+from nhle_github import NhleGithub, project_landing
+from models import SpecificPlayerInfo
+from collect_all_player_data import SIMPLE_PLAYER_FIELDS, CURRENT_SEASON
+
+DEFAULT_PLAYER_IDS = [8478402, 8479318, 8471724, 8478407, 8477407]
+ITERATIONS = 200
+
+
+def measure(parse, payloads):
+    """
+    Returns:
+        (CPU seconds per payload, peak traced memory in KB while parsing every payload once)
+    """
+    # CPU time without tracemalloc, which would slow both modes down
+    start = time.process_time()
+    for _ in range(ITERATIONS):
+        for payload in payloads:
+            parse(payload)
+    cpu = (time.process_time() - start) / (ITERATIONS * len(payloads))
+
+    tracemalloc.start()
+    parsed = [parse(payload) for payload in payloads]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return cpu, peak / 1024
+
+
+if __name__ == "__main__":
+    player_ids = [int(arg) for arg in sys.argv[1:]] or DEFAULT_PLAYER_IDS
+
+    nhle = NhleGithub()
+    print(f"Loading {len(player_ids)} landing payloads...")
+    payloads = [nhle._get_json(nhle._landing_url(player_id), "landing") for player_id in player_ids]
+
+    results = {
+        "full validation": measure(lambda p: SpecificPlayerInfo(**p), payloads),
+        "projection": measure(
+            lambda p: project_landing(p, SIMPLE_PLAYER_FIELDS, CURRENT_SEASON), payloads
+        ),
+    }
+
+    print("=" * 60)
+    print(f"LANDING PARSE BENCHMARK ({ITERATIONS} iterations x {len(payloads)} payloads)")
+    print("=" * 60)
+    print(f"{'Mode':<20} {'CPU / payload':<18} {'Peak memory':<15}")
+    print("-" * 60)
+    for mode, (cpu, peak_kb) in results.items():
+        print(f"{mode:<20} {cpu * 1e6:>10.1f} us      {peak_kb:>10.1f} KB")
+    print("-" * 60)
+
+    full_cpu, full_peak = results["full validation"]
+    proj_cpu, proj_peak = results["projection"]
+    print(f"Speedup: {full_cpu / proj_cpu:.1f}x CPU, {full_peak / proj_peak:.1f}x less peak memory")
+    print("=" * 60)
@@ -0,0 +1,120 @@
+"""
+Simulate years of daily roster fetches for one team and measure the size of
+the RosterArchive against storing every fetch as pretty-printed JSON, and the
+time to rebuild the roster for a random date.
+
+Usage:
+    python benchmark_roster_archive.py [years]
+
+The simulated roster has 23 players with full bio fields. Each day there is a
+small chance of a call-up, a send-down or a trade and of a sweater number
+change, and each season start turns over a few players; the random seed is
+fixed so runs are repeatable.
+"""
+
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from models import Name, Player, TeamRoster
+from roster_archive import RosterArchive
+
+DEFAULT_YEARS = 10
+LOOKUPS = 500
+ROSTER_SIZE = {"forwards": 14, "defensemen": 7, "goalies": 2}
+FIRST_NAMES = ["Auston", "Mitch", "William", "John", "Morgan", "Joseph", "Max", "Matthew", "Jake", "Simon"]
+LAST_NAMES = ["Matthews", "Marner", "Nylander", "Tavares", "Rielly", "Woll", "Domi", "Knies", "McCabe", "Benoit"]
+
+
+def make_player(rng: random.Random, player_id: int, group: str, season: int) -> Player:
+    return Player(
+        id=player_id,
+        headshot=f"https://assets.nhle.com/mugs/nhl/{season}/TOR/{player_id}.png",
+        firstName=Name(default=rng.choice(FIRST_NAMES)),
+        lastName=Name(default=rng.choice(LAST_NAMES)),
+        sweaterNumber=rng.randint(2, 98),
+        positionCode={"forwards": rng.choice("CLR"), "defensemen": "D", "goalies": "G"}[group],
+        shootsCatches=rng.choice("LR"),
+        heightInInches=rng.randint(69, 78),
+        weightInPounds=rng.randint(170, 230),
+        heightInCentimeters=rng.randint(175, 198),
+        weightInKilograms=rng.randint(77, 104),
+        birthDate=f"{rng.randint(1988, 2005)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        birthCity=Name(default="Toronto"),
+        birthCountry=rng.choice(["CAN", "USA", "SWE", "FIN"]),
+        birthStateProvince=Name(default="Ontario"),
+    )
+
+
+def simulate(years: int):
+    """Yields (ISO date, TeamRoster) for every day of the simulated seasons"""
+    rng = random.Random(0)
+    next_id = 8470000
+    day = date(2015, 9, 1)
+    season = 20152016
+    groups = {}
+    for group, size in ROSTER_SIZE.items():
+        groups[group] = [make_player(rng, next_id + i, group, season) for i in range(size)]
+        next_id += size
+
+    for _ in range(years * 365):
+        if day.month == 9 and day.day == 1:
+            # New season: new headshot URLs for everyone, a few players turned over
+            season = day.year * 10000 + day.year + 1
+            for group, players in groups.items():
+                for i, player in enumerate(players):
+                    if rng.random() < 0.2:
+                        players[i] = make_player(rng, next_id, group, season)
+                        next_id += 1
+                    else:
+                        players[i] = player.model_copy(update={
+                            "headshot": f"https://assets.nhle.com/mugs/nhl/{season}/TOR/{player.id}.png"
+                        })
+        if rng.random() < 0.05:
+            # Call-up, send-down or trade: one player replaced
+            group = rng.choice(list(groups))
+            groups[group][rng.randrange(len(groups[group]))] = make_player(rng, next_id, group, season)
+            next_id += 1
+        if rng.random() < 0.01:
+            group = rng.choice(list(groups))
+            i = rng.randrange(len(groups[group]))
+            groups[group][i] = groups[group][i].model_copy(update={"sweaterNumber": rng.randint(2, 98)})
+
+        yield day.isoformat(), TeamRoster(**{group: list(players) for group, players in groups.items()})
+        day += timedelta(days=1)
+
+
+if __name__ == "__main__":
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_YEARS
+
+    with tempfile.TemporaryDirectory() as archive_dir:
+        archive = RosterArchive(archive_dir)
+        raw_bytes = 0
+        dates = []
+        start = time.perf_counter()
+        for on_date, roster in simulate(years):
+            raw_bytes += len(json.dumps(roster.model_dump(mode="json"), indent=2).encode("utf-8"))
+            archive.record("TOR", roster, on_date)
+            dates.append(on_date)
+        record_seconds = time.perf_counter() - start
+
+        # Lookups from a fresh instance, so nothing is served from memory
+        reader = RosterArchive(archive_dir)
+        rng = random.Random(1)
+        start = time.perf_counter()
+        for _ in range(LOOKUPS):
+            reader.roster_at("TOR", rng.choice(dates))
+        lookup_ms = (time.perf_counter() - start) / LOOKUPS * 1000
+
+        archive_bytes = archive.size_bytes()
+
+    print("=" * 60)
+    print(f"ROSTER ARCHIVE: {years} years of daily fetches ({len(dates)} rosters, one team)")
+    print("=" * 60)
+    print(f"Pretty-printed JSON: {raw_bytes / 2**20:8.1f} MiB")
+    print(f"Archive:             {archive_bytes / 1024:8.1f} KiB ({raw_bytes / archive_bytes:.0f}x smaller)")
+    print(f"Recording:           {record_seconds / len(dates) * 1000:8.2f} ms per fetch")
+    print(f"roster_at:           {lookup_ms:8.2f} ms per lookup")
+    print("=" * 60)
@@ -0,0 +1,81 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+
+class CheckpointJournal:
+    """
+    Append-only JSON-lines journal of completed work, keyed by player id.
+
+    Every finished player is appended (and flushed) as soon as it completes,
+    so a run that is killed part-way loses at most the line being written.
+    A resumed run loads the journal, skips the ids already in it and replays
+    their stored data instead of fetching them again.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Journal file (created on first append)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._tail_checked = False
+
+    def _drop_torn_tail(self):
+        """Cut off a partial last line left by a crash mid-write (lock held)"""
+        self._tail_checked = True
+        try:
+            with open(self.path, "rb+") as f:
+                data = f.read()
+                end = data.rfind(b"\n") + 1
+                if end < len(data):
+                    # Otherwise the next append would be glued onto the fragment
+                    f.truncate(end)
+        except FileNotFoundError:
+            pass
+
+    def load(self) -> dict[int, Any]:
+        """
+        Read every completed entry from the journal.
+
+        Returns:
+            dict mapping player id to the data recorded for it (last write wins)
+        """
+        completed: dict[int, Any] = {}
+        with self._lock:
+            self._drop_torn_tail()
+        if not self.path.exists():
+            return completed
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Corrupt line; everything around it is intact
+                    continue
+                completed[record["playerId"]] = record["data"]
+        return completed
+
+    def append(self, player_id: int, data: Any):
+        """Record player_id as completed with its data, durably"""
+        line = json.dumps({"playerId": player_id, "data": data}, ensure_ascii=False)
+        with self._lock:
+            if not self._tail_checked:
+                self._drop_torn_tail()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def reset(self):
+        """Start a fresh journal (used when not resuming)"""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
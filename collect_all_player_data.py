@@ -1,12 +1,37 @@
 
-# Get the large list from attractiveness_analysis.py
-from typing import List, cast
-import json
-import time
+from typing import List, Optional, Set, cast
+import argparse
 from pathlib import Path
-from players.attractiveness_analysis import attractive_players_data
-from nhle_github import NhleGithub, SimplePlayer
-from models import PlayerAttractiveAnalysis, SpecificPlayerInfo, SimpleSpecificPlayerData, SeasonStats
+from nhle_github import NhleGithub, SimplePlayer, CURRENT_SEASON as CURRENT_SEASON_ID
+from models import PlayerAttractiveAnalysis, SpecificPlayerInfo, SimpleSpecificPlayerData, SeasonStats, BulkPlayerSeason
+from http_client import get_http_client
+from http_cache import get_http_cache
+from rate_limiter import fetch_all_rate_limited
+from checkpoint_journal import CheckpointJournal
+from player_store import PlayerStore
+
+# Landing page request budget; the limiter halves it on 429/5xx and recovers gradually
+REQUESTS_PER_SECOND = 8.0
+MAX_CONCURRENCY = 8
+
+# Landing fields used by convert_to_simple_player_data; the rest of the payload isn't validated
+SIMPLE_PLAYER_FIELDS = (
+    "playerId",
+    "isActive",
+    "currentTeamAbbrev",
+    "position",
+    "birthCountry",
+    "shootsCatches",
+    "birthDate",
+    "seasonTotals",
+)
+CURRENT_SEASON = int(CURRENT_SEASON_ID)
+
+# Every fetched player is appended here so a crashed run can be resumed
+JOURNAL_FILE = Path(__file__).parent / "players" / "collect-journal.jsonl"
+# Partial refetches (player_ids given) journal separately, so they never wipe a
+# pending --resume journal of a full collect run
+PARTIAL_JOURNAL_FILE = Path(__file__).parent / "players" / "collect-journal-partial.jsonl"
 
 def convert_to_simple_player_data(
     specific_info: SpecificPlayerInfo, 
@@ -22,11 +47,11 @@ def convert_to_simple_player_data(
     Returns:
         SimpleSpecificPlayerData: Simplified player data with attractiveness info
     """
-    # Search for current season (20252026) in seasonTotals
+    # Search for current season (CURRENT_SEASON) in seasonTotals
     this_season_stats = None
     if specific_info.seasonTotals:
         for season_total in specific_info.seasonTotals:
-            if season_total.season == 20252026:
+            if season_total.season == CURRENT_SEASON:
                 # Convert SeasonTotal to SeasonStats
                 this_season_stats = SeasonStats(
                     goals=season_total.goals,
@@ -55,64 +80,184 @@ def convert_to_simple_player_data(
         thisSeasonTotals=this_season_stats
     )
 
-def get_attractive_players_with_stats() -> List[SimpleSpecificPlayerData]:
-    # Convert the imported data from dicts to PlayerAttractiveAnalysis objects
-    # Need to convert string names to Name objects
-    players_with_attractive_scores: List[PlayerAttractiveAnalysis] = []
-    for player_dict in attractive_players_data:
-        # Convert firstName and lastName strings to Name objects
-        player_data = player_dict.copy()
-        player_data['player']['firstName'] = {'default': player_data['player']['firstName']}
-        player_data['player']['lastName'] = {'default': player_data['player']['lastName']}
-        players_with_attractive_scores.append(PlayerAttractiveAnalysis(**player_data))
+def convert_bulk_to_simple_player_data(
+    bulk: BulkPlayerSeason,
+    player_analysis: PlayerAttractiveAnalysis
+) -> SimpleSpecificPlayerData:
+    """
+    Convert a row from NhleGithub.get_bulk_season_stats to SimpleSpecificPlayerData
+    
+    Args:
+        bulk: Bio and season totals from the stats REST reports
+        player_analysis: Player attractiveness analysis data
+        
+    Returns:
+        SimpleSpecificPlayerData: Simplified player data with attractiveness info
+    """
+    return SimpleSpecificPlayerData(
+        rank=player_analysis.rank,
+        player=player_analysis.player,
+        ridgeAttractivenessScore=player_analysis.ridgeAttractivenessScore,
+        playerId=bulk.playerId,
+        # Every ranked player comes from a current roster and has games this season
+        isActive=True,
+        currentTeamAbbrev=bulk.currentTeamAbbrev,
+        position=bulk.position,
+        birthCountry=bulk.birthCountry,
+        shootsCatches=bulk.shootsCatches,
+        birthDate=bulk.birthDate,
+        thisSeasonTotals=bulk.seasonStats
+    )
+
+def get_attractive_players_with_stats(
+    resume: bool = False,
+    player_ids: Optional[Set[int]] = None,
+    use_bulk: bool = True,
+) -> List[SimpleSpecificPlayerData]:
+    """
+    Fetch season stats for every ranked player.
+
+    Args:
+        resume: Skip players already recorded in the checkpoint journal by a
+                previous (crashed or killed) run and replay their data instead
+        player_ids: Only fetch these players (e.g. the ones a roster sync found changed)
+        use_bulk: Take stats from the paged stats REST reports and only fetch
+                  landing pages for players missing from them
+
+    Returns:
+        List[SimpleSpecificPlayerData]: Players with stats, in rank order
+    """
+    # Ranked players written by full_league_script.py
+    with PlayerStore() as store:
+        players_with_attractive_scores = store.load_attractiveness_analyses()
+    if not players_with_attractive_scores:
+        raise RuntimeError("No attractiveness scores in the player store. Run full_league_script.py first.")
+    # One landing page per player, even if the ranking lists someone twice
+    seen_ids = set()
+    players_with_attractive_scores = [
+        pa for pa in players_with_attractive_scores
+        if not (pa.player.id in seen_ids or seen_ids.add(pa.player.id))
+    ]
+    if player_ids is not None:
+        players_with_attractive_scores = [
+            pa for pa in players_with_attractive_scores if pa.player.id in player_ids
+        ]
 
     nhle = NhleGithub()
-    players_stats_list: List[SimpleSpecificPlayerData] = []
+    journal_file = JOURNAL_FILE if player_ids is None else PARTIAL_JOURNAL_FILE
+    journal = CheckpointJournal(journal_file)
+    if resume:
+        completed = journal.load()
+    else:
+        journal.reset()
+        completed = {}
 
-    print(f"Fetching stats for {len(players_with_attractive_scores)} players...")
-    
-    for i, player_analysis in enumerate(players_with_attractive_scores, 1):
-        player_id = player_analysis.player.id
-        try:
-            # Fetch player stats from nhle_github
-            specific_info = nhle.get_player_stats(player_id)
-            # Convert to simplified format with attractiveness data
-            simple_data = convert_to_simple_player_data(specific_info, player_analysis)
-            players_stats_list.append(simple_data)
-            
-            if i % 10 == 0:
-                print(f"  Processed {i}/{len(players_with_attractive_scores)} players")
-            
-            # Wait for 1 second between requests to avoid rate limiting
-            time.sleep(1)
+    if completed:
+        print(f"Resuming: {len(completed)} players replayed from {journal_file}")
 
+    # A few paged bulk requests cover almost everyone who has played this season
+    from_bulk: dict[int, SimpleSpecificPlayerData] = {}
+    if use_bulk:
+        try:
+            bulk = nhle.get_bulk_season_stats(CURRENT_SEASON)
+            from_bulk = {
+                pa.player.id: convert_bulk_to_simple_player_data(bulk[pa.player.id], pa)
+                for pa in players_with_attractive_scores
+                if pa.player.id in bulk and pa.player.id not in completed
+            }
+            print(f"Bulk stats covered {len(from_bulk)} players")
         except Exception as e:
-            print(f"  Error fetching stats for player ID {player_id}: {e}")
+            print(f"  Bulk stats unavailable, falling back to landing pages: {e}")
+
+    pending = [
+        pa for pa in players_with_attractive_scores
+        if pa.player.id not in completed and pa.player.id not in from_bulk
+    ]
+    print(f"Fetching landing pages for {len(pending)} players...")
+    
+    def fetch(player_analysis: PlayerAttractiveAnalysis) -> SimpleSpecificPlayerData:
+        # Fetch player stats from nhle_github
+        specific_info = nhle.get_player_stats(
+            player_analysis.player.id, fields=SIMPLE_PLAYER_FIELDS, season=CURRENT_SEASON
+        )
+        # Convert to simplified format with attractiveness data
+        simple_data = convert_to_simple_player_data(specific_info, player_analysis)
+        journal.append(player_analysis.player.id, simple_data.model_dump(exclude_none=True))
+        return simple_data
+
+    def report_progress(completed: int, total: int):
+        if completed % 10 == 0:
+            print(f"  Processed {completed}/{total} players")
+
+    # Parallel, rate-limited fetch; results come back in rank order
+    results = fetch_all_rate_limited(
+        pending,
+        fetch,
+        requests_per_second=REQUESTS_PER_SECOND,
+        max_concurrency=MAX_CONCURRENCY,
+        needs_token=lambda pa: not nhle.is_player_stats_cached(pa.player.id),
+        on_error=lambda pa, e: print(f"  Error fetching stats for player ID {pa.player.id}: {e}"),
+        on_progress=report_progress,
+    )
+    fetched = {pa.player.id: r for pa, r in zip(pending, results) if r is not None}
+
+    # Second, gentler pass for players that failed during a brownout instead of dropping them
+    failed = [pa for pa, r in zip(pending, results) if r is None]
+    if failed:
+        print(f"Retrying {len(failed)} failed players at a reduced rate...")
+        retry_results = fetch_all_rate_limited(
+            failed,
+            fetch,
+            requests_per_second=REQUESTS_PER_SECOND / 4,
+            max_concurrency=2,
+            on_error=lambda pa, e: print(f"  Still failing for player ID {pa.player.id}: {e}"),
+        )
+        fetched.update({pa.player.id: r for pa, r in zip(failed, retry_results) if r is not None})
+        still_failed = len(failed) - sum(1 for r in retry_results if r is not None)
+        if still_failed:
+            print(f"  {still_failed} players still missing; run again with --resume to fetch only those")
+
+    # Merge journaled, bulk and landing-page players back into rank order
+    players_stats_list: List[SimpleSpecificPlayerData] = []
+    for player_analysis in players_with_attractive_scores:
+        player_id = player_analysis.player.id
+        if player_id in completed:
+            players_stats_list.append(SimpleSpecificPlayerData(**completed[player_id]))
+        elif player_id in from_bulk:
+            players_stats_list.append(from_bulk[player_id])
+        elif player_id in fetched:
+            players_stats_list.append(fetched[player_id])
     
     return players_stats_list
 
-# Main function to test, write the results to a file called players/attractive_players_with_stats.json
+# Main function to test, write the results to the player store (players/players.db)
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Collect season stats for ranked NHL players")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue a crashed/killed run from the checkpoint journal",
+    )
+    parser.add_argument(
+        "--no-bulk",
+        action="store_true",
+        help="skip the bulk stats reports and fetch every player's landing page",
+    )
+    args = parser.parse_args()
+
     print("Starting to collect player data...")
     
     # Get all players with stats
-    players_data = get_attractive_players_with_stats()
+    players_data = get_attractive_players_with_stats(resume=args.resume, use_bulk=not args.no_bulk)
     
     print(f"\nSuccessfully collected data for {len(players_data)} players")
     
-    # Create output directory
-    output_dir = Path("players")
-    output_dir.mkdir(exist_ok=True)
-    
-    # Write to JSON file
-    output_file = output_dir / "attractive_players_with_stats.json"
-    
-    # Convert to JSON-serializable format
-    output_data = [player.model_dump(exclude_none=True) for player in players_data]
-    
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    # Write to the player store
+    with PlayerStore() as store:
+        store.upsert_player_stats(players_data, CURRENT_SEASON)
     
-    print(f"Data written to: {output_file}")
+    print(f"Data written to: {store.db_file}")
+    get_http_client().print_stats()
+    get_http_cache().print_stats()
     print("Done!")
 
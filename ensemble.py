@@ -99,18 +99,14 @@ else:
     else:
         # Generate embeddings
         print(f"\nGenerating embeddings from combined dataset (this may take a while)...")
-        embeddings = []
-        scores = []
-        
-        for i in range(len(df_combined)):
-            try:
-                embedding = processor.get_embedding_from_path(df_combined.loc[i, "path"])
-                embeddings.append(embedding)
-                scores.append(df_combined.loc[i, "score"])
-                if (i + 1) % 100 == 0:
-                    print(f"  Processed {i + 1}/{len(df_combined)} images")
-            except Exception as e:
-                print(f"Error on image {i}: {e}")
+        # Detection per image, recognition batched per chunk of aligned faces
+        batch, ok = processor.get_embeddings_batch(
+            list(df_combined["path"]),
+            on_error=lambda i, e: print(f"Error on image {i}: {e}"),
+            dataset="SCUT",
+        )
+        embeddings = list(batch[ok])
+        scores = list(df_combined["score"][ok])
         
         # Save to cache
         print(f"\nSaving embeddings to cache: {CACHE_FILE}")
@@ -1,21 +1,123 @@
+import threading
+import time
 import cv2
 import numpy as np
-import requests
 from pathlib import Path
-from typing import Union
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 from insightface.app import FaceAnalysis
+from insightface.utils import face_align
+from http_client import get_http_client
+from request_coalescer import SingleFlight
+
+# Anything get_embeddings_batch can read: a BGR array, encoded image bytes, or a file path
+ImageInput = Union[np.ndarray, bytes, str, Path]
+
+EMBEDDING_DIM = 512
+
+# Full-size detection only. The saved models and embedding caches were built from
+# 640px detections, so smaller sizes stay opt-in until benchmark_det_sizes.py
+# shows their embeddings match
+DEFAULT_DET_SIZES = (640,)
+# Detector input sizes tried in order; tightly framed headshots rarely need more than the first
+ADAPTIVE_DET_SIZES = (160, 320, 640)
+# Below the largest size, a detection only counts if it is at least this confident
+ACCEPT_DET_SCORE = 0.5
+
+# Which buffalo_l modules each profile loads (None = all of them), and whether
+# embeddings take the largest-face-only path or the full FaceAnalysis.get path
+PROFILES = {
+    "embed-only": {"modules": ["detection", "recognition"], "largest_face_only": True},
+    "full-analysis": {"modules": None, "largest_face_only": False},
+}
+
+
+def _largest_box(bboxes: np.ndarray) -> int:
+    """Index of the largest-area box (the same pick as detect(metric="max"))"""
+    areas = (bboxes[:, 2] - bboxes[:, 0]) * (bboxes[:, 3] - bboxes[:, 1])
+    return int(np.argmax(areas))
 
 
 class FaceProcesser:
-    def __init__(self):
-        """Initialize the FaceAnalysis model (ArcFace)"""
-        self.app = FaceAnalysis(name="buffalo_l")
-        self.app.prepare(ctx_id=-1, det_size=(640, 640), det_thresh=0.1)
+    def __init__(
+        self,
+        profile: str = "embed-only",
+        largest_face_only: Optional[bool] = None,
+        det_sizes: Sequence[int] = DEFAULT_DET_SIZES,
+        accept_score: float = ACCEPT_DET_SCORE,
+    ):
+        """
+        Configure the FaceAnalysis models (ArcFace). Nothing is loaded until the
+        first image is processed.
+        
+        Args:
+            profile: "embed-only" loads just the detector and recognizer (all the
+                     embedding needs); "full-analysis" also loads the 2D/3D landmark
+                     and gender-age models for analyze()
+            largest_face_only: Take the largest box straight from the detector and run
+                               alignment + recognition on that face alone (default: the
+                               profile's setting). With False,
+                               FaceAnalysis.get runs every loaded model on every detection
+                               (same embedding, much more work on crowded or low-threshold images).
+            det_sizes: Square detector input sizes, tried smallest first and escalated
+                       only when no face is found. The default (640,) detects at full
+                       size only; ADAPTIVE_DET_SIZES starts at 160. The
+                       FaceAnalysis.get path always uses the largest size.
+            accept_score: Minimum detection score of the largest box for accepting it
+                          below the largest size, so low-confidence hits still escalate
+        """
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown profile {profile!r}, expected one of {', '.join(PROFILES)}")
+        self.profile = profile
+        self.modules = PROFILES[profile]["modules"]
+        if largest_face_only is None:
+            largest_face_only = PROFILES[profile]["largest_face_only"]
+        self.largest_face_only = largest_face_only
+        self.det_sizes = tuple(sorted(det_sizes))
+        self.accept_score = accept_score
+        self._app: Optional[FaceAnalysis] = None
+        self._load_lock = threading.Lock()
+        # Per dataset: how many images were detected at each size, and how many had no face at all
+        self.detection_stats: Dict[str, Dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+        # Each headshot URL is downloaded and embedded once, even if several callers ask for it
+        self._url_embeddings = SingleFlight()
+        # Throughput of the last get_embeddings_batch call
+        self.batch_stats = {}
+    
+    @property
+    def app(self) -> FaceAnalysis:
+        """The profile's FaceAnalysis, loaded (ONNX sessions and all) on first use"""
+        if self._app is None:
+            with self._load_lock:
+                if self._app is None:
+                    app = FaceAnalysis(name="buffalo_l", allowed_modules=self.modules)
+                    app.prepare(ctx_id=-1, det_size=(self.det_sizes[-1], self.det_sizes[-1]), det_thresh=0.1)
+                    self._app = app
+        return self._app
+    
+    def analyze(self, image: ImageInput) -> list:
+        """
+        Run every model loaded by the profile on every detected face.
+        
+        Args:
+            image: BGR array, encoded image bytes, or image file path
+            
+        Returns:
+            insightface Face objects (bbox, kps, embedding, and with the
+            "full-analysis" profile landmarks, gender and age)
+        """
+        return self.app.get(self._load_bgr(image))
     
     def _get_embedding_from_bgr_image(self, img: np.ndarray) -> np.ndarray:
         if img is None or not isinstance(img, np.ndarray) or img.size == 0:
             raise ValueError("Invalid image array provided (img is None/empty).")
         
+        if self.largest_face_only:
+            bboxes, kpss = self._detect_adaptive(img)
+            crop = self._align_largest_face(img, bboxes, kpss)
+            emb = self.app.models["recognition"].get_feat([crop])[0]
+            return (emb / np.linalg.norm(emb)).astype(np.float32)
+        
         faces = self.app.get(img)
         if len(faces) == 0:
             raise ValueError("No face detected in the image.")
@@ -50,8 +152,15 @@ class FaceProcesser:
             ValueError: If no face detected in image
             requests.exceptions.RequestException: If URL fetch fails
         """
-        # Download image from URL
-        response = requests.get(image_url, timeout=timeout)
+        embedding = self._url_embeddings.do(
+            image_url, lambda: self._download_and_embed(image_url, timeout)
+        )
+        # Callers get their own copy so the shared result can't be modified
+        return embedding.copy()
+    
+    def _download_and_embed(self, image_url: str, timeout: float) -> np.ndarray:
+        # Download image from URL (pooled keep-alive connection to the assets host)
+        response = get_http_client().get(image_url, timeout=timeout)
         response.raise_for_status()
         
         # Load image directly into memory
@@ -63,6 +172,21 @@ class FaceProcesser:
         
         return self._get_embedding_from_bgr_image(img)
     
+    def get_embedding_from_bytes(self, image_bytes: bytes) -> np.ndarray:
+        """
+        Extract a face embedding from encoded image bytes (e.g. from HeadshotStore).
+        
+        Args:
+            image_bytes: PNG/JPEG file contents
+            
+        Returns:
+            np.ndarray: Face embedding (512-dimensional vector)
+        """
+        img = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR)
+        if img is None:
+            raise ValueError("Could not decode image bytes")
+        return self._get_embedding_from_bgr_image(img)
+    
     def get_embedding_from_path(self, image_path: Union[str, Path]) -> np.ndarray:
         """
         Load a local image file from disk and extract face embedding.
@@ -87,3 +211,158 @@ class FaceProcesser:
             raise ValueError(f"Could not read/decode image from path: {p}")
         
         return self._get_embedding_from_bgr_image(img)
+    
+    def _load_bgr(self, image: ImageInput) -> np.ndarray:
+        if isinstance(image, np.ndarray):
+            img = image
+        elif isinstance(image, (bytes, bytearray, memoryview)):
+            img = cv2.imdecode(np.frombuffer(image, np.uint8), cv2.IMREAD_COLOR)
+        else:
+            img = cv2.imread(str(image), cv2.IMREAD_COLOR)
+        if img is None or img.size == 0:
+            raise ValueError("Could not read/decode image.")
+        return img
+    
+    def _align_largest_face(self, img: np.ndarray, bboxes: np.ndarray, kpss: Optional[np.ndarray]) -> np.ndarray:
+        """Align the largest detected face to the recognizer's 112x112 input"""
+        if bboxes.shape[0] == 0 or kpss is None:
+            raise ValueError("No face detected in the image.")
+        rec_model = self.app.models["recognition"]
+        return face_align.norm_crop(img, landmark=kpss[_largest_box(bboxes)], image_size=rec_model.input_size[0])
+    
+    def _record_detection(self, dataset: str, det_size: Optional[int]):
+        with self._stats_lock:
+            counts = self.detection_stats.setdefault(dataset, {})
+            key = str(det_size) if det_size is not None else "miss"
+            counts[key] = counts.get(key, 0) + 1
+    
+    def _accepts(self, bboxes: np.ndarray, det_size: int) -> bool:
+        if bboxes.shape[0] == 0:
+            return False
+        # Judge the box that gets embedded, not the best-scoring one
+        return det_size == self.det_sizes[-1] or float(bboxes[_largest_box(bboxes), 4]) >= self.accept_score
+    
+    def _detect_adaptive(self, img: np.ndarray, dataset: str = "default") -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Largest face at the smallest detector size that finds one"""
+        for det_size in self.det_sizes:
+            bboxes, kpss = self.app.det_model.detect(
+                img, input_size=(det_size, det_size), max_num=1, metric="max"
+            )
+            if self._accepts(bboxes, det_size):
+                self._record_detection(dataset, det_size)
+                return bboxes, kpss
+        self._record_detection(dataset, None)
+        return bboxes, kpss
+    
+    def print_detection_stats(self):
+        """Print which detector size succeeded, per dataset"""
+        for dataset, counts in self.detection_stats.items():
+            total = sum(counts.values())
+            parts = [
+                f"{size}px: {counts[str(size)]} ({counts[str(size)] / total * 100:.0f}%)"
+                for size in self.det_sizes if str(size) in counts
+            ]
+            parts.append(f"no face: {counts.get('miss', 0)}")
+            print(f"Detection sizes for {dataset}: " + ", ".join(parts))
+    
+    def get_embeddings_batch(
+        self,
+        images: Sequence[ImageInput],
+        chunk_size: int = 32,
+        on_error: Optional[Callable[[int, Exception], None]] = None,
+        report: bool = True,
+        dataset: str = "default",
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Embed many images, running ArcFace once per chunk instead of once per image.
+        
+        Faces are detected one image at a time, starting at the smallest of det_sizes
+        and escalating only the images with no face found. The largest face per image
+        is kept as in the single-image path, aligned to 112x112, stacked, and
+        recognized in one ONNX call per chunk.
+        
+        Args:
+            images: BGR arrays, encoded image bytes, or image file paths
+            chunk_size: Aligned faces per recognition call
+            on_error: Called with (index, exception) for an image that couldn't be embedded
+            report: Print throughput (images/sec) and detection sizes when done
+            dataset: Name the detection size statistics are kept under (e.g. "SCUT", "NHL")
+            
+        Returns:
+            (embeddings, ok): an (N, 512) float32 array of L2-normalized embeddings
+            (zero rows where ok is False) and an (N,) bool status mask
+        """
+        if len(images) == 0:
+            # Nothing to embed: keep the models unloaded
+            return np.zeros((0, EMBEDDING_DIM), dtype=np.float32), np.zeros(0, dtype=bool)
+        
+        start = time.perf_counter()
+        rec_model = self.app.models["recognition"]
+        embeddings = np.zeros((len(images), EMBEDDING_DIM), dtype=np.float32)
+        ok = np.zeros(len(images), dtype=bool)
+        
+        for chunk_start in range(0, len(images), chunk_size):
+            loaded = {}
+            for i in range(chunk_start, min(chunk_start + chunk_size, len(images))):
+                try:
+                    loaded[i] = self._load_bgr(images[i])
+                except Exception as e:
+                    if on_error is not None:
+                        on_error(i, e)
+            
+            # Detection runs per image: buffalo_l's detector (det_10g) has no batch dimension
+            detections = {}
+            pending = list(loaded)
+            det = self.app.det_model
+            for det_size in self.det_sizes:
+                if not pending:
+                    break
+                missed = []
+                for i in pending:
+                    bboxes, kpss = det.detect(loaded[i], input_size=(det_size, det_size), max_num=0, metric="default")
+                    if self._accepts(bboxes, det_size):
+                        detections[i] = (bboxes, kpss)
+                        self._record_detection(dataset, det_size)
+                    else:
+                        missed.append(i)
+                pending = missed
+            for i in pending:
+                detections[i] = (np.zeros((0, 5), dtype=np.float32), None)
+                self._record_detection(dataset, None)
+            
+            crops, indices = [], []
+            for i in loaded:
+                try:
+                    crops.append(self._align_largest_face(loaded[i], *detections[i]))
+                    indices.append(i)
+                except Exception as e:
+                    if on_error is not None:
+                        on_error(i, e)
+            if not crops:
+                continue
+            
+            try:
+                feats = rec_model.get_feat(crops).astype(np.float32)
+            except Exception as e:
+                # One bad chunk fails its own images, not the whole batch
+                if on_error is not None:
+                    for i in indices:
+                        on_error(i, e)
+                continue
+            embeddings[indices] = feats / np.linalg.norm(feats, axis=1, keepdims=True)
+            ok[indices] = True
+        
+        elapsed = time.perf_counter() - start
+        self.batch_stats = {
+            "images": len(images),
+            "embedded": int(ok.sum()),
+            "seconds": elapsed,
+            "imagesPerSec": len(images) / elapsed if elapsed > 0 else 0.0,
+        }
+        if report:
+            print(
+                f"Embedded {self.batch_stats['embedded']}/{len(images)} images in {elapsed:.1f}s "
+                f"({self.batch_stats['imagesPerSec']:.1f} images/sec)"
+            )
+            self.print_detection_stats()
+        return embeddings, ok
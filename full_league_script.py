@@ -1,18 +1,37 @@
 
+import argparse
 import joblib
 import json
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 from face_processer import FaceProcesser
-from nhle_github import NhleGithub, allActiveTeams
-from models import PlayerAttractiveAnalysis, SimplePlayer
+from nhle_github import NhleGithub, fetch_all_rosters, unique_players
+from league_sources import LEAGUE_SOURCES, get_league_source
+from models import PlayerAttractiveAnalysis, RosterEntry, SimplePlayer
+from http_client import get_http_client
+from http_cache import get_http_cache
+from player_store import PlayerStore
+from roster_sync import diff_rosters, players_to_refetch, players_to_rescore, print_diff, roster_entries
+from roster_archive import RosterArchive
+from headshot_store import HeadshotStore
 
 # Use the male-only trained model for NHL players (SVR with GridSearchCV optimization)
 CACHE_DIR = Path("cached-models")
 MODEL_FILE = CACHE_DIR / "beauty_score_model_male.pkl"
 SCALER_FILE = CACHE_DIR / "beauty_score_model_male_scaler.pkl"
 
-def main():
+def main(sync: bool = False, sources: Optional[List[str]] = None, force: bool = False):
+    """
+    Score every NHL player's headshot and store the ranked results.
+    
+    Args:
+        sync: Diff today's rosters against the last stored snapshot and only
+              re-embed/re-score/re-fetch the players that changed, instead of
+              rebuilding the whole league
+        sources: League sources to pull rosters from (see league_sources.LEAGUE_SOURCES),
+                 e.g. ["nhl", "nhl-prospects"]
+        force: Re-embed every headshot, even those unchanged since they were last scored
+    """
     # Step 1: Check if the model and scaler exist
     if not MODEL_FILE.exists():
         raise FileNotFoundError(
@@ -37,34 +56,144 @@ def main():
     
     # Initialize FaceProcesser and NhleGithub
     processor = FaceProcesser()
-    nhle = NhleGithub()
+    sources = sources or ["nhl"]
+    clients = [NhleGithub(source=get_league_source(name)) for name in sources]
     
     # Step 2 & 3: Get all players from all teams
-    print(f"Fetching players from all {len(allActiveTeams)} NHL teams...")
+    all_team_codes = {client.source.name: client.source.team_codes(int(client.season)) for client in clients}
+    print(f"Fetching rosters for {sum(map(len, all_team_codes.values()))} teams from {', '.join(sources)}...")
     all_players: List[SimplePlayer] = []
+    players_by_team: Dict[str, List[SimplePlayer]] = {}
+    current_snapshot: Dict[int, RosterEntry] = {}
+    # (source, team code) pairs whose roster couldn't be fetched
+    failed_teams: Set[Tuple[str, str]] = set()
     
-    for team_code in allActiveTeams:
-        try:
-            print(f"  Fetching {team_code}...")
-            team_players = nhle.get_simplifiedPlayers(team_code)
-            # Filter out players without headshots
-            team_players = [p for p in team_players if p.headshot and p.headshot.strip()]
+    # Every source's rosters are fetched in parallel; a failed team is reported and skipped
+    rosters_by_source = fetch_all_rosters(
+        clients,
+        on_error=lambda source, team_code, e: print(f"  Error fetching {source} {team_code}: {e}"),
+    )
+    archive = RosterArchive()
+    for client in clients:
+        source = client.source.name
+        rosters = rosters_by_source[source]
+        # One more try for teams that failed, after the parallel burst has settled
+        for team_code in [t for t in all_team_codes[source] if t not in rosters]:
+            try:
+                rosters[team_code] = client.get_players_on_team(team_code)
+                print(f"  Recovered {source} {team_code} on retry")
+            except Exception as e:
+                print(f"  Error fetching {source} {team_code} again, skipping: {e}")
+                failed_teams.add((source, team_code))
+        
+        source_players_by_team: Dict[str, List[SimplePlayer]] = {}
+        for team_code, roster in rosters.items():
+            # Every NHL fetch goes into the delta-encoded roster history (unchanged rosters add nothing)
+            if source == "nhl":
+                archive.record(team_code, roster)
+            team_players = client.simplify_roster(roster)
             all_players.extend(team_players)
-        except Exception as e:
-            print(f"  Error fetching {team_code}: {e}")
+            # Prospects are grouped under their NHL organization
+            players_by_team.setdefault(team_code, []).extend(team_players)
+            source_players_by_team[team_code] = team_players
+            print(f"  {source} {team_code}: {len(team_players)} players")
+        current_snapshot.update(roster_entries(source_players_by_team, source))
+    
+    # A player listed on more than one roster is embedded and scored once
+    all_players = unique_players(all_players)
     
     print(f"\nTotal players fetched: {len(all_players)}\n")
     
+    # Step 3b: In sync mode, only process players whose roster entry changed
+    with PlayerStore() as store:
+        previous_snapshot = store.load_roster_snapshot()
+        existing_analyses = store.load_attractiveness_analyses()
+    
+    players_to_process = all_players
+    kept_analyses: List[PlayerAttractiveAnalysis] = []
+    refetch_ids = None
+    
+    if sync and previous_snapshot and existing_analyses:
+        # Keep last snapshot's players for rosters that failed to load, so they don't look removed
+        for player_id, entry in previous_snapshot.items():
+            if (entry.source, entry.team) in failed_teams and player_id not in current_snapshot:
+                current_snapshot[player_id] = entry
+        
+        diff = diff_rosters(previous_snapshot, current_snapshot)
+        print_diff(diff)
+        
+        # Changed players, plus anyone on a roster who has no stored score yet
+        scored_ids = {a.player.id for a in existing_analyses}
+        rescore_ids = players_to_rescore(diff) | {p.id for p in all_players if p.id not in scored_ids}
+        players_to_process = [p for p in all_players if p.id in rescore_ids]
+        kept_analyses = [
+            a for a in existing_analyses
+            if a.player.id in current_snapshot and a.player.id not in rescore_ids
+        ]
+        refetch_ids = players_to_refetch(diff)
+        print(f"Sync: re-scoring {len(players_to_process)} players, keeping {len(kept_analyses)} stored scores\n")
+    elif sync:
+        print("Sync: no previous roster snapshot, running a full league rebuild\n")
+    
+    # Step 3c: Mirror headshots locally (HEAD/ETag revalidation, content hashes). A player
+    # whose image bytes match the ones their stored score came from keeps that score.
+    headshots = HeadshotStore()
+    season = int(clients[0].season)
+    mirrored = headshots.mirror(
+        ((p.id, season, p.headshot) for p in players_to_process),
+        on_error=lambda player_id, e: print(f"  Error downloading headshot for player ID {player_id}: {e}"),
+    )
+    headshots.print_stats()
+    if not force:
+        scored = {a.player.id: a for a in existing_analyses}
+        unchanged_ids = {
+            p.id for p in players_to_process
+            if p.id in scored and p.id in mirrored and headshots.processed_sha(p.id) == mirrored[p.id][1]
+        }
+        kept_analyses.extend(
+            scored[p.id].model_copy(update={"player": p}) for p in players_to_process if p.id in unchanged_ids
+        )
+        players_to_process = [p for p in players_to_process if p.id not in unchanged_ids]
+        print(f"Headshots: {len(players_to_process)} new or changed, {len(unchanged_ids)} unchanged since last scored\n")
+    
     # Step 4: Process each player and predict attractiveness
-    player_analyses: List[PlayerAttractiveAnalysis] = []
+    player_analyses: List[PlayerAttractiveAnalysis] = list(kept_analyses)
     processing_errors = []
+    processed_shas: Dict[int, str] = {}
     
     print("Processing player headshots and predicting attractiveness scores...")
     print(f"Using optimized SVR model (Test MSE: 0.0958)\n")
-    for i, player in enumerate(all_players):
+    # Identical images (same sha256) are embedded once, with batched recognition calls
+    shas = sorted({mirrored[p.id][1] for p in players_to_process if p.id in mirrored})
+    sha_errors: Dict[str, Exception] = {}
+    sha_embeddings = {}
+    # Nothing new to embed (e.g. a sync with no changes): don't load the face models at all
+    if shas:
+        batch, ok = processor.get_embeddings_batch(
+            [headshots.read(sha256) for sha256 in shas],
+            on_error=lambda i, e: sha_errors.__setitem__(shas[i], e),
+            dataset="NHL headshots",
+        )
+        sha_embeddings = {sha256: batch[i] for i, sha256 in enumerate(shas) if ok[i]}
+    
+    def embed(player: SimplePlayer):
+        try:
+            if player.id in mirrored:
+                sha256 = mirrored[player.id][1]
+                if sha256 in sha_embeddings:
+                    return sha_embeddings[sha256]
+                return sha_errors.get(sha256, ValueError(f"No embedding for headshot {sha256}"))
+            # Not mirrored (download failed above): one more try straight from the URL
+            return processor.get_embedding_from_url(player.headshot)
+        except Exception as e:
+            return e
+    
+    embeddings = [embed(player) for player in players_to_process]
+    
+    for i, (player, embedding) in enumerate(zip(players_to_process, embeddings)):
         try:
-            # Get embedding from headshot URL
-            embedding = processor.get_embedding_from_url(player.headshot)
+            if isinstance(embedding, Exception):
+                raise embedding
             
             # Scale the embedding and predict attractiveness score
             embedding_scaled = scaler.transform(embedding.reshape(1, -1))
@@ -77,9 +206,11 @@ def main():
                 ridgeAttractivenessScore=float(score)
             )
             player_analyses.append(analysis)
+            if player.id in mirrored:
+                processed_shas[player.id] = mirrored[player.id][1]
             
             if (i + 1) % 50 == 0:
-                print(f"  Processed {i + 1}/{len(all_players)} players")
+                print(f"  Processed {i + 1}/{len(players_to_process)} players")
                 
         except Exception as e:
             error_info = {
@@ -93,7 +224,7 @@ def main():
             processing_errors.append(error_info)
             print(f"  Error processing {player.firstName.default} {player.lastName.default}: {e}")
     
-    print(f"\nSuccessfully processed {len(player_analyses)} players\n")
+    print(f"\nSuccessfully processed {len(player_analyses) - len(kept_analyses)} players\n")
     
     # Step 5: Sort players by attractiveness (descending)
     player_analyses.sort(key=lambda x: x.ridgeAttractivenessScore, reverse=True)
@@ -114,33 +245,31 @@ def main():
     print("="*60)
     print()
     
-    # Step 7: Write full list to JSON file
+    # Step 7: Write full list to the player store
     output_dir = Path("players")
     output_dir.mkdir(exist_ok=True)
     
-    output_file = output_dir / "attractiveness_analysis.json"
-    
-    # Convert to JSON-serializable format with simplified names
-    output_data = []
-    for analysis in player_analyses:
-        data = {
-            "rank": analysis.rank,
-            "player": {
-                "id": analysis.player.id,
-                "headshot": analysis.player.headshot,
-                "firstName": analysis.player.firstName.default,
-                "lastName": analysis.player.lastName.default
-            },
-            "ridgeAttractivenessScore": analysis.ridgeAttractivenessScore
-        }
-        output_data.append(data)
-    
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    with PlayerStore() as store:
+        # Team comes from the roster each player was fetched from
+        for team_code, team_players in players_by_team.items():
+            store.upsert_players(team_players, team=team_code)
+        store.replace_scores(player_analyses)
+        store.save_roster_snapshot(current_snapshot.values())
+    # Only after the scores are stored, so a crashed run re-embeds these next time
+    headshots.mark_processed(processed_shas)
     
-    print(f"Full analysis saved to: {output_file}")
+    print(f"Full analysis saved to: {store.db_file}")
     print(f"Total players analyzed: {len(player_analyses)}")
     
+    # Step 8 (sync only): re-fetch landing pages for new and traded players
+    if refetch_ids:
+        from collect_all_player_data import get_attractive_players_with_stats, CURRENT_SEASON
+        
+        print(f"\nRe-fetching landing pages for {len(refetch_ids)} new/traded players...")
+        refreshed = get_attractive_players_with_stats(player_ids=refetch_ids)
+        with PlayerStore() as store:
+            store.upsert_player_stats(refreshed, CURRENT_SEASON)
+    
     # Write processing errors to JSON file
     if processing_errors:
         errors_file = output_dir / "processing-errors.json"
@@ -148,7 +277,27 @@ def main():
             json.dump(processing_errors, f, indent=2, ensure_ascii=False)
         print(f"Processing errors saved to: {errors_file}")
         print(f"Total errors: {len(processing_errors)}")
+    
+    get_http_client().print_stats()
+    get_http_cache().print_stats()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Score every NHL player's headshot")
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="only process players added, traded or with a new headshot since the last run",
+    )
+    parser.add_argument(
+        "--sources",
+        default="nhl",
+        help=f"comma-separated league sources to score ({', '.join(LEAGUE_SOURCES)})",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="re-embed every headshot, even those unchanged since they were last scored",
+    )
+    args = parser.parse_args()
+    main(sync=args.sync, sources=args.sources.split(","), force=args.force)
 
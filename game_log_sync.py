@@ -0,0 +1,262 @@
+"""
+Append new games from each scored player's game log to the player store, and
+keep attractiveness-vs-performance correlations over each player's last N games
+up to date as those games arrive.
+
+    python game_log_sync.py --window 10
+"""
+
+import argparse
+import math
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from nhle_github import NhleGithub, CURRENT_SEASON
+from models import GameLog
+from player_store import PlayerStore
+from rate_limiter import fetch_all_rate_limited
+
+# Same request budget as collect_all_player_data.py's landing fetches
+REQUESTS_PER_SECOND = 8.0
+MAX_CONCURRENCY = 8
+
+METRICS = ("goals", "points", "pim")
+
+
+def _metric(game: GameLog, metric: str) -> int:
+    value = getattr(game, metric)
+    if value is None and metric == "points":
+        # Goalie logs carry goals and assists but no points
+        value = (game.goals or 0) + (game.assists or 0)
+    return value or 0
+
+
+def sync_game_logs(
+    nhle: NhleGithub,
+    store: PlayerStore,
+    player_ids: Sequence[int],
+    season: int,
+) -> List[Tuple[int, GameLog]]:
+    """
+    Fetch every player's game log and store only the games newer than the last sync.
+
+    Args:
+        nhle: API client (its cache answers unchanged logs with a 304)
+        store: Player store holding previously synced games
+        player_ids: Players to sync
+        season: Season id such as 20252026
+
+    Returns:
+        (player_id, GameLog) for each newly stored game, oldest first (same-day
+        games that were re-offered but already stored are not included)
+    """
+    last_dates = store.latest_game_dates(season)
+
+    def fetch(player_id: int) -> List[GameLog]:
+        return nhle.get_player_game_log(player_id, season)
+
+    results = fetch_all_rate_limited(
+        player_ids,
+        fetch,
+        requests_per_second=REQUESTS_PER_SECOND,
+        max_concurrency=MAX_CONCURRENCY,
+        needs_token=lambda player_id: not nhle.is_game_log_cached(player_id, season),
+        on_error=lambda player_id, e: print(f"  Error fetching game log for player ID {player_id}: {e}"),
+    )
+
+    new_games: List[Tuple[int, GameLog]] = []
+    for player_id, games in zip(player_ids, results):
+        if games is None:
+            continue
+        last_date = last_dates.get(player_id, "")
+        # Same-day games are re-offered; the store drops any it already has
+        new_games.extend((player_id, g) for g in games if g.gameDate >= last_date)
+
+    added = store.append_game_logs(season, new_games)
+    added.sort(key=lambda pg: (pg[1].gameDate, pg[1].gameId))
+    print(f"Stored {len(added)} new games for {len(player_ids)} players")
+    return added
+
+
+class RollingWindowCorrelation:
+    """
+    Pearson correlation between attractiveness score and per-game averages of
+    goals, points and PIM over each player's last `window` games.
+
+    Every player contributes one (score, average) point. When a game arrives only
+    that player's window changes, so their old point is subtracted from the
+    running sums (n, Σx, Σy, Σx², Σy², Σxy) and the new one added: O(1) per game
+    instead of a full recompute over every player and game. state() and
+    from_state() carry the sums and windows between runs.
+    """
+
+    def __init__(self, scores: Dict[int, float], window: int = 10, metrics: Sequence[str] = METRICS):
+        """
+        Args:
+            scores: Attractiveness score per player id; other players' games are ignored
+            window: Number of most recent games per player
+            metrics: GameLog fields to correlate against
+        """
+        self.scores = scores
+        self.window = window
+        self.metrics = tuple(metrics)
+        # Per player: (gameId, metric values) for the games in the window, oldest first
+        self._games: Dict[int, deque] = {}
+        self._window_sums: Dict[int, List[int]] = {}
+        # Score each player's current point was added with
+        self._player_scores: Dict[int, float] = {}
+        # Per metric: [n, Σx, Σy, Σx², Σy², Σxy]
+        self._sums = {metric: [0.0] * 6 for metric in self.metrics}
+
+    def state(self) -> dict:
+        """JSON-serializable running sums and windows, for from_state() in a later run"""
+        return {
+            "window": self.window,
+            "metrics": list(self.metrics),
+            "sums": self._sums,
+            "players": {
+                str(player_id): {
+                    "score": self._player_scores[player_id],
+                    "games": [[game_id, values] for game_id, values in games],
+                    "windowSums": self._window_sums[player_id],
+                }
+                for player_id, games in self._games.items()
+            },
+        }
+
+    @classmethod
+    def from_state(cls, scores: Dict[int, float], state: dict) -> "RollingWindowCorrelation":
+        """
+        Restore an engine saved with state(). Players whose score changed since
+        (or who are no longer scored) have their point moved (or removed) in O(1).
+        """
+        engine = cls(scores, state["window"], state["metrics"])
+        engine._sums = {metric: list(sums) for metric, sums in state["sums"].items()}
+        for key, player in state["players"].items():
+            player_id = int(key)
+            engine._games[player_id] = deque((game_id, values) for game_id, values in player["games"])
+            engine._window_sums[player_id] = list(player["windowSums"])
+            engine._player_scores[player_id] = player["score"]
+        for player_id in list(engine._games):
+            old_x, new_x = engine._player_scores[player_id], scores.get(player_id)
+            if new_x == old_x:
+                continue
+            point = engine._point(player_id)
+            engine._apply(old_x, point, -1)
+            if new_x is None:
+                del engine._games[player_id], engine._window_sums[player_id], engine._player_scores[player_id]
+            else:
+                engine._apply(new_x, point, +1)
+                engine._player_scores[player_id] = new_x
+        return engine
+
+    def _point(self, player_id: int) -> Optional[List[float]]:
+        games = self._games.get(player_id)
+        if not games:
+            return None
+        return [total / len(games) for total in self._window_sums[player_id]]
+
+    def _apply(self, x: float, ys: Optional[List[float]], sign: int):
+        if ys is None:
+            return
+        for metric, y in zip(self.metrics, ys):
+            sums = self._sums[metric]
+            sums[0] += sign
+            sums[1] += sign * x
+            sums[2] += sign * y
+            sums[3] += sign * x * x
+            sums[4] += sign * y * y
+            sums[5] += sign * x * y
+
+    def add_game(self, player_id: int, game: GameLog):
+        """Slide a player's window forward by one game (games must arrive oldest first)"""
+        x = self.scores.get(player_id)
+        if x is None:
+            return
+        games = self._games.setdefault(player_id, deque())
+        if any(game_id == game.gameId for game_id, _ in games):
+            return
+        window_sums = self._window_sums.setdefault(player_id, [0] * len(self.metrics))
+        self._player_scores[player_id] = x
+
+        old_point = self._point(player_id)
+        values = [_metric(game, metric) for metric in self.metrics]
+        games.append((game.gameId, values))
+        for i, value in enumerate(values):
+            window_sums[i] += value
+        if len(games) > self.window:
+            _, dropped = games.popleft()
+            for i, value in enumerate(dropped):
+                window_sums[i] -= value
+
+        self._apply(x, old_point, -1)
+        self._apply(x, self._point(player_id), +1)
+
+    def add_games(self, games: Iterable[Tuple[int, GameLog]]):
+        for player_id, game in games:
+            self.add_game(player_id, game)
+
+    def correlations(self) -> Dict[str, Optional[float]]:
+        """Correlation per metric, or None with fewer than 3 players or no variance"""
+        result: Dict[str, Optional[float]] = {}
+        for metric, (n, sx, sy, sxx, syy, sxy) in self._sums.items():
+            var_x = n * sxx - sx * sx
+            var_y = n * syy - sy * sy
+            if n < 3 or var_x <= 0 or var_y <= 0:
+                result[metric] = None
+                continue
+            result[metric] = (n * sxy - sx * sy) / math.sqrt(var_x * var_y)
+        return result
+
+    @property
+    def players(self) -> int:
+        return len(self._games)
+
+
+def main(window: int = 10, season: int = int(CURRENT_SEASON)):
+    nhle = NhleGithub()
+    with PlayerStore() as store:
+        analyses = store.load_attractiveness_analyses()
+        if not analyses:
+            print("No scored players in the store; run full_league_script.py first")
+            return
+        scores = {pa.player.id: pa.ridgeAttractivenessScore for pa in analyses}
+
+        saved = store.load_rolling_correlation(season, window)
+        if saved is not None:
+            engine = RollingWindowCorrelation.from_state(scores, saved[0])
+            last_rowid = saved[1]
+        else:
+            # First run for this season and window: seed once from the stored games
+            last_rowid = store.max_game_log_rowid()
+            engine = RollingWindowCorrelation(scores, window)
+            for player_id, games in store.load_recent_game_logs(season, window).items():
+                for game in games:
+                    engine.add_game(player_id, game)
+        before = engine.correlations()
+
+        sync_game_logs(nhle, store, list(scores), season)
+        # Every game stored since the saved state, including any a crashed run stored
+        # without folding in, slides the windows forward
+        new_games, last_rowid = store.load_game_logs_after(season, last_rowid)
+        engine.add_games(new_games)
+        store.save_rolling_correlation(season, window, engine.state(), last_rowid)
+        after = engine.correlations()
+
+    print("\n" + "=" * 60)
+    print(f"ATTRACTIVENESS VS LAST {window} GAMES ({engine.players} players)")
+    print("=" * 60)
+    for metric in engine.metrics:
+        old, new = before[metric], after[metric]
+        old_text = f"{old:+.4f}" if old is not None else "N/A"
+        new_text = f"{new:+.4f}" if new is not None else "N/A"
+        print(f"{metric:8s} {new_text}  (before sync: {old_text})")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sync game logs and update rolling-window correlations")
+    parser.add_argument("--window", type=int, default=10, help="games per player in the rolling window")
+    parser.add_argument("--season", type=int, default=int(CURRENT_SEASON), help="season id, e.g. 20252026")
+    args = parser.parse_args()
+
+    main(args.window, args.season)
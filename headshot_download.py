@@ -1,77 +1,37 @@
-import requests
-import json
-import random
-from pathlib import Path
-from nhle_github import NhleGithub, allActiveTeams
+from nhle_github import NhleGithub, unique_players
+from headshot_store import HeadshotStore
+from http_client import get_http_client
 
-# Configuration
-HEADSHOTS_DIR = Path("headshots")
-HEADSHOTS_DIR.mkdir(exist_ok=True)
-
-# Initialize NHL API
+# Mirror every current headshot into the content-addressed store under headshots/
 print("Fetching NHL player data...")
 nhle = NhleGithub()
+season = int(nhle.season)
 
 # Collect all players from all teams
 all_players = []
-for team_code in allActiveTeams:
-    try:
-        simple_players = nhle.get_simplifiedPlayers(team_code)
-        all_players.extend(simple_players)
-        print(f"  {team_code}: {len(simple_players)} players")
-    except Exception as e:
-        print(f"  {team_code}: Error - {e}")
-
+rosters = nhle.gat_all_players_on_all_teams(
+    on_error=lambda team_code, e: print(f"  {team_code}: Error - {e}")
+)
+for team_code, roster in rosters.items():
+    simple_players = nhle.simplify_roster(roster)
+    all_players.extend(simple_players)
+    print(f"  {team_code}: {len(simple_players)} players")
+
+all_players = unique_players(all_players)
 print(f"\nTotal players found: {len(all_players)}")
+print(f"Mirroring {len(all_players)} headshots...\n")
 
-# Sample 100 random players
-sample_size = min(100, len(all_players))
-sampled_players = random.sample(all_players, sample_size)
-
-print(f"Downloading {len(sampled_players)} random player headshots...\n")
-
-downloaded = 0
-failed = 0
-skipped = 0
-
-for i, player in enumerate(sampled_players, 1):
-    first_name = player.firstName.get('default', player.firstName) if hasattr(player.firstName, 'get') else player.firstName
-    last_name = player.lastName.get('default', player.lastName) if hasattr(player.lastName, 'get') else player.lastName
-    headshot_url = player.headshot
-    player_id = player.id
-    
-    if not headshot_url or not player_id:
-        print(f"[{i}/{len(sampled_players)}] Skipping {first_name} {last_name} - missing data")
-        skipped += 1
-        continue
-    
-    # Create filename based on player ID
-    filename = HEADSHOTS_DIR / f"{player_id}.png"
-    
-    # Skip if already downloaded
-    if filename.exists():
-        print(f"[{i}/{len(sampled_players)}] Already have {first_name} {last_name}")
-        skipped += 1
-        continue
-    
-    # Download headshot
-    try:
-        response = requests.get(headshot_url, timeout=10)
-        response.raise_for_status()
-        
-        with open(filename, 'wb') as f:
-            f.write(response.content)
-        
-        print(f"[{i}/{len(sampled_players)}] ✓ Downloaded {first_name} {last_name}")
-        downloaded += 1
-    except Exception as e:
-        print(f"[{i}/{len(sampled_players)}] ✗ Failed to download {first_name} {last_name}: {e}")
-        failed += 1
+store = HeadshotStore()
+names = {player.id: f"{player.firstName.default} {player.lastName.default}" for player in all_players}
+stored = store.mirror(
+    ((player.id, season, player.headshot) for player in all_players),
+    on_error=lambda player_id, e: print(f"  ✗ Failed to download {names[player_id]}: {e}"),
+)
 
 print(f"\n{'='*60}")
 print(f"Download complete!")
-print(f"  Downloaded: {downloaded}")
-print(f"  Skipped (already exist): {skipped}")
-print(f"  Failed: {failed}")
-print(f"  Total in headshots folder: {len(list(HEADSHOTS_DIR.glob('*.png')))}")
+print(f"  Stored: {len(stored)}/{len(all_players)}")
+store.print_stats()
+print(f"  Manifest: {store.manifest_file}")
 print(f"{'='*60}")
+get_http_client().print_stats()
@@ -0,0 +1,223 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from http_client import HttpClient, get_http_client
+
+DEFAULT_STORE_DIR = Path(__file__).parent / "headshots"
+
+
+class HeadshotStore:
+    """
+    Content-addressed local mirror of player headshots.
+
+    Image bytes are stored once per sha256 under blobs/ab/abcdef....png, so a
+    mug reused across seasons or teams is kept once. manifest.json maps
+    player id -> season -> {url, sha256, etag, lastModified, contentLength,
+    fetchedAt}, so later stages can read local bytes instead of the network.
+
+    Already-mirrored headshots are revalidated with a HEAD request: a matching
+    ETag (or Last-Modified + Content-Length) means unchanged without a download.
+    The manifest also records which image each player was last processed from
+    (e.g. embedded and scored), so consumers only redo players whose bytes moved.
+    """
+
+    def __init__(self, store_dir: Path = DEFAULT_STORE_DIR, http_client: Optional[HttpClient] = None):
+        """
+        Args:
+            store_dir: Directory holding blobs/ and manifest.json
+            http_client: Client for image downloads (default: shared client)
+        """
+        self.store_dir = Path(store_dir)
+        self.blob_dir = self.store_dir / "blobs"
+        self.manifest_file = self.store_dir / "manifest.json"
+        self.http = http_client or get_http_client()
+        self._lock = threading.Lock()
+        self.stats = {"new": 0, "changed": 0, "unchanged": 0, "downloaded": 0, "deduplicated": 0, "failed": 0}
+
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        except FileNotFoundError:
+            self.manifest = {"players": {}}
+        self.manifest.setdefault("processed", {})
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.blob_dir / sha256[:2] / f"{sha256}.png"
+
+    def put(self, data: bytes) -> str:
+        """Store image bytes (if not already stored) and return their sha256"""
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(sha256)
+        if path.exists():
+            with self._lock:
+                self.stats["deduplicated"] += 1
+            return sha256
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return sha256
+
+    def read(self, sha256: str) -> bytes:
+        with open(self.blob_path(sha256), "rb") as f:
+            return f.read()
+
+    def lookup(self, player_id: int, season: int) -> Optional[dict]:
+        """Manifest entry for a player's headshot in a season, if mirrored"""
+        with self._lock:
+            return self.manifest["players"].get(str(player_id), {}).get(str(season))
+
+    def read_headshot(self, player_id: int, season: int) -> Optional[bytes]:
+        """Local bytes of a player's headshot for a season, or None if not mirrored"""
+        entry = self.lookup(player_id, season)
+        if entry is None or not self.blob_path(entry["sha256"]).exists():
+            return None
+        return self.read(entry["sha256"])
+
+    def _record(self, player_id: int, season: int, entry: dict):
+        with self._lock:
+            self.manifest["players"].setdefault(str(player_id), {})[str(season)] = entry
+
+    def _latest_entry(self, player_id: int) -> Optional[dict]:
+        with self._lock:
+            seasons = self.manifest["players"].get(str(player_id), {})
+            return seasons[max(seasons)] if seasons else None
+
+    def _is_unchanged(self, entry: dict, url: str, timeout: float) -> bool:
+        """HEAD the URL and compare its validators with the stored entry"""
+        if entry["url"] != url or not self.blob_path(entry["sha256"]).exists():
+            return False
+        try:
+            response = self.http.head(url, timeout=timeout)
+        except Exception:
+            return False
+        if response.status_code != 200:
+            return False
+        etag = response.headers.get("ETag")
+        if etag and entry.get("etag"):
+            return etag == entry["etag"]
+        last_modified = response.headers.get("Last-Modified")
+        content_length = response.headers.get("Content-Length")
+        return (
+            content_length is not None
+            and int(content_length) == entry.get("contentLength")
+            and last_modified == entry.get("lastModified")
+        )
+
+    def _download(self, player_id: int, season: int, url: str, timeout: float) -> str:
+        response = self.http.get(url, timeout=timeout)
+        response.raise_for_status()
+        sha256 = self.put(response.content)
+        self._record(player_id, season, {
+            "url": url,
+            "sha256": sha256,
+            "etag": response.headers.get("ETag"),
+            "lastModified": response.headers.get("Last-Modified"),
+            "contentLength": len(response.content),
+            "fetchedAt": time.time(),
+        })
+        with self._lock:
+            self.stats["downloaded"] += 1
+        return sha256
+
+    def fetch(self, player_id: int, season: int, url: str, timeout: float = 15.0) -> Tuple[str, str]:
+        """
+        Mirror one headshot, downloading only if it is new or its validators changed.
+
+        Returns:
+            (status, sha256) where status is "new" (no earlier image for the
+            player), "changed" (different bytes than the last mirrored image)
+            or "unchanged"
+        """
+        entry = self.lookup(player_id, season)
+        if entry is not None and self._is_unchanged(entry, url, timeout):
+            status, sha256 = "unchanged", entry["sha256"]
+        else:
+            previous = entry or self._latest_entry(player_id)
+            sha256 = self._download(player_id, season, url, timeout)
+            if previous is None:
+                status = "new"
+            else:
+                # A new season's URL (or a re-upload) with the same bytes is still unchanged
+                status = "unchanged" if previous["sha256"] == sha256 else "changed"
+        with self._lock:
+            self.stats[status] += 1
+        return status, sha256
+
+    def processed_sha(self, player_id: int) -> Optional[str]:
+        """sha256 of the image the player was last processed from, if any"""
+        with self._lock:
+            return self.manifest["processed"].get(str(player_id))
+
+    def mark_processed(self, shas: Dict[int, str]):
+        """Record which image each player was processed from, and save the manifest"""
+        with self._lock:
+            self.manifest["processed"].update({str(player_id): sha for player_id, sha in shas.items()})
+        self.save_manifest()
+
+    def mirror(
+        self,
+        headshots: Iterable[Tuple[int, int, str]],
+        max_workers: int = 16,
+        on_error: Optional[Callable[[int, Exception], None]] = None,
+    ) -> Dict[int, Tuple[str, str]]:
+        """
+        Mirror (or revalidate) many headshots with a thread pool, then save the manifest.
+
+        Args:
+            headshots: (player_id, season, url) triples
+            max_workers: Downloads in flight at once
+            on_error: Called with (player_id, exception) for a failed download
+
+        Returns:
+            dict mapping player id to (status, sha256) for every headshot now stored
+        """
+        headshots = list(headshots)
+
+        def fetch_one(item: Tuple[int, int, str]) -> Optional[Tuple[str, str]]:
+            player_id, season, url = item
+            try:
+                return self.fetch(player_id, season, url)
+            except Exception as e:
+                with self._lock:
+                    self.stats["failed"] += 1
+                if on_error is not None:
+                    on_error(player_id, e)
+                return None
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(fetch_one, headshots))
+        finally:
+            self.save_manifest()
+
+        return {
+            player_id: result
+            for (player_id, _, _), result in zip(headshots, results)
+            if result is not None
+        }
+
+    def save_manifest(self):
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_file.with_suffix(".tmp")
+        with self._lock:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.manifest, f)
+        os.replace(tmp_path, self.manifest_file)
+
+    def print_stats(self):
+        blobs = list(self.blob_dir.glob("*/*.png")) if self.blob_dir.exists() else []
+        total_bytes = sum(path.stat().st_size for path in blobs)
+        print(
+            f"Headshot store: {self.stats['new']} new, {self.stats['changed']} changed, "
+            f"{self.stats['unchanged']} unchanged ({self.stats['downloaded']} downloaded, "
+            f"{self.stats['deduplicated']} duplicate images), {self.stats['failed']} failed; "
+            f"{len(blobs)} unique images ({total_bytes / 2**20:.1f} MiB) for "
+            f"{len(self.manifest['players'])} players"
+        )
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from http_client import HttpClient
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / "nhle" / "http-cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+# Eviction frees space down to this fraction of max_bytes, so a full cache
+# isn't rescanned on every following write
+EVICT_TO_FRACTION = 0.9
+
+
+class HttpCache:
+    """
+    Persistent on-disk cache for JSON GET responses.
+
+    Each URL is stored as one file: a one-line JSON header (URL, ETag,
+    Last-Modified, storedAt) followed by the body, so freshness checks read
+    only the header. Within the TTL an entry is served straight from
+    disk; after that it is revalidated with a conditional GET, so an unchanged
+    resource costs a 304 instead of a full download. The file mtime doubles as
+    the last-access time, and once the cache grows past max_bytes the least
+    recently used entries are evicted until it is back under 90% of it.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Directory holding the cache entries
+            max_bytes: Size cap for the whole cache directory
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._total_bytes = sum(p.stat().st_size for p in self.cache_dir.glob("*.json"))
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0}
+
+    def _count(self, stat: str):
+        with self._stats_lock:
+            self.stats[stat] += 1
+
+    def _entry_path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def _read(self, url: str, with_body: bool = True) -> Optional[dict]:
+        path = self._entry_path(url)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.loads(f.readline())
+                # Entries written before the header line hold the body in the same object
+                if with_body and "body" not in entry:
+                    entry["body"] = json.loads(f.read())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        # A hash collision would be astronomically unlikely, but never serve the wrong URL
+        return entry if entry.get("url") == url else None
+
+    def _touch(self, url: str):
+        try:
+            os.utime(self._entry_path(url))
+        except FileNotFoundError:
+            pass
+
+    def _write(self, url: str, entry: dict):
+        path = self._entry_path(url)
+        header = {key: value for key, value in entry.items() if key != "body"}
+        data = (
+            json.dumps(header, ensure_ascii=False) + "\n" + json.dumps(entry["body"], ensure_ascii=False)
+        ).encode("utf-8")
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+
+        with self._lock:
+            old_size = path.stat().st_size if path.exists() else 0
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._total_bytes += len(data) - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache is under the low-water mark (lock held)"""
+        entries = []
+        for p in self.cache_dir.glob("*.json"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICT_TO_FRACTION
+        for _, size, p in entries:
+            if total <= target:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+        self._total_bytes = total
+
+    def is_fresh(self, http: HttpClient, url: str, ttl: float) -> bool:
+        """True if url would be served from disk without any network request (reads only the header)"""
+        entry = self._read(http.resolve(url), with_body=False)
+        return entry is not None and time.time() - entry["storedAt"] < ttl
+
+    def fetch_json(self, http: HttpClient, url: str, ttl: float) -> Any:
+        """
+        Return the JSON body for url, from disk when possible.
+
+        Args:
+            http: Client used for the network request on a miss or stale entry
+            url: URL to fetch
+            ttl: Seconds an entry is served without contacting the server
+
+        Returns:
+            Parsed JSON body
+
+        Raises:
+            requests.exceptions.HTTPError: If the server returns an error status
+        """
+        # Key by the URL actually requested, so stand-in and live responses never mix
+        url = http.resolve(url)
+        entry = self._read(url)
+        now = time.time()
+
+        if entry is not None and now - entry["storedAt"] < ttl:
+            self._touch(url)
+            self._count("hits")
+            return entry["body"]
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("lastModified"):
+                headers["If-Modified-Since"] = entry["lastModified"]
+
+        response = http.get(url, headers=headers)
+
+        if response.status_code == 304 and entry is not None:
+            # Unchanged on the server: restart the TTL and keep the stored body
+            entry["storedAt"] = now
+            self._write(url, entry)
+            self._count("revalidated")
+            return entry["body"]
+
+        response.raise_for_status()
+        body = response.json()
+        self._write(url, {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "lastModified": response.headers.get("Last-Modified"),
+            "storedAt": now,
+            "body": body,
+        })
+        self._count("misses")
+        return body
+
+    def clear(self):
+        with self._lock:
+            for p in self.cache_dir.glob("*.json"):
+                p.unlink(missing_ok=True)
+            self._total_bytes = 0
+
+    def print_stats(self):
+        """Print how many lookups were local hits, 304 revalidations or full downloads"""
+        total = sum(self.stats.values())
+        if total == 0:
+            return
+        print(
+            f"HTTP cache: {self.stats['hits']} local hits, "
+            f"{self.stats['revalidated']} revalidated (304), "
+            f"{self.stats['misses']} downloaded "
+            f"({self._total_bytes / (1024 * 1024):.1f} MB on disk)"
+        )
+
+
+_shared_cache: Optional[HttpCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> HttpCache:
+    """Return the process-wide HttpCache, creating it with defaults on first use"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = HttpCache()
+        return _shared_cache
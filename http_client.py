@@ -0,0 +1,290 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from resilience import RETRYABLE_STATUS_CODES, CircuitBreaker, RetryBudget, backoff_delay, retry_after_seconds
+
+# Canonical NHL origins; each gets its own keep-alive connection pool
+API_BASE_URL = "https://api-web.nhle.com"
+ASSETS_BASE_URL = "https://assets.nhle.com"
+STATS_BASE_URL = "https://api.nhle.com"
+
+# Per-thread override of max_retries, set by client_retries_disabled()
+_retry_override = threading.local()
+
+
+@contextmanager
+def client_retries_disabled() -> Iterator[None]:
+    """
+    Send every HttpClient request made on this thread inside the block exactly
+    once, handing transient failures straight back to the caller. For callers
+    that own retries themselves (e.g. rate_limiter), so a throttled request
+    isn't retried both in the client and in the caller.
+    """
+    previous = getattr(_retry_override, "max_retries", None)
+    _retry_override.max_retries = 0
+    try:
+        yield
+    finally:
+        _retry_override.max_retries = previous
+
+
+class HttpClient:
+    """
+    Shared requests.Session with one keep-alive connection pool per NHL host.
+
+    Every fetcher (rosters, landing pages, headshots) goes through the same
+    client, so the ~1600 requests of a league refresh reuse a handful of
+    TCP+TLS connections instead of opening a new one each time.
+
+    Each canonical origin can be pointed elsewhere (e.g. the local stand-in in
+    nhle_standin_server.py) via api_base_url/assets_base_url or the
+    NHLE_API_BASE_URL/NHLE_ASSETS_BASE_URL/NHLE_STATS_BASE_URL environment variables. Callers keep
+    using the real NHL URLs (including headshot URLs from roster payloads) and
+    the client rewrites them.
+
+    Transient failures (connection errors, timeouts, 429 and 5xx) are retried
+    with jittered exponential backoff, limited by a client-wide RetryBudget,
+    and each host has a CircuitBreaker that pauses traffic to it while its
+    error rate is spiking. Callers with their own retry loop turn the client's
+    retries off with max_retries=0 or client_retries_disabled().
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = 32,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 15.0,
+        api_base_url: Optional[str] = None,
+        assets_base_url: Optional[str] = None,
+        stats_base_url: Optional[str] = None,
+        max_retries: int = 3,
+        retry_budget: Optional[RetryBudget] = None,
+    ):
+        """
+        Args:
+            pool_maxsize: Max open connections kept per host (also caps concurrency per host)
+            connect_timeout: Seconds to wait for a TCP/TLS connection
+            read_timeout: Seconds to wait for response data
+            api_base_url: Replacement for https://api-web.nhle.com (default: $NHLE_API_BASE_URL)
+            assets_base_url: Replacement for https://assets.nhle.com (default: $NHLE_ASSETS_BASE_URL)
+            stats_base_url: Replacement for https://api.nhle.com (default: $NHLE_STATS_BASE_URL)
+            max_retries: Retries per request for transient failures (if the budget allows)
+            retry_budget: Shared retry budget (default: 20% of requests plus a small reserve)
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.retry_budget = retry_budget or RetryBudget()
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self.retry_stats = {"retries": 0, "budgetExhausted": 0}
+        self._stats_lock = threading.Lock()
+        self.session = requests.Session()
+        self.adapters: dict[str, HTTPAdapter] = {}
+
+        # canonical origin -> where requests for it are actually sent
+        self.base_urls = {
+            API_BASE_URL: (api_base_url or os.environ.get("NHLE_API_BASE_URL") or API_BASE_URL).rstrip("/"),
+            ASSETS_BASE_URL: (assets_base_url or os.environ.get("NHLE_ASSETS_BASE_URL") or ASSETS_BASE_URL).rstrip("/"),
+            STATS_BASE_URL: (stats_base_url or os.environ.get("NHLE_STATS_BASE_URL") or STATS_BASE_URL).rstrip("/"),
+        }
+
+        for base_url in self.base_urls.values():
+            host = urlsplit(base_url).netloc
+            if host in self.adapters:
+                continue
+            # pool_block makes extra threads wait for a free connection
+            # instead of opening throwaway ones that are never reused
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, pool_block=True)
+            self.session.mount(f"{urlsplit(base_url).scheme}://{host}/", adapter)
+            self.adapters[host] = adapter
+            self.breakers[host] = CircuitBreaker()
+
+    def resolve(self, url: str) -> str:
+        """Rewrite a canonical NHL URL to the configured base URL (no-op by default)"""
+        for canonical, base_url in self.base_urls.items():
+            if base_url != canonical and url.startswith(canonical + "/"):
+                return base_url + url[len(canonical):]
+        return url
+
+    def get(
+        self,
+        url: str,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        GET a URL through the shared session.
+
+        Args:
+            url: URL to fetch
+            timeout: Read timeout in seconds (defaults to the client's read_timeout)
+            max_retries: Retries for this request (defaults to the client's max_retries,
+                         or 0 inside client_retries_disabled())
+            **kwargs: Passed through to requests.Session.get (headers, params, ...)
+
+        Returns:
+            requests.Response (raise_for_status is left to the caller)
+        """
+        return self._request("GET", url, timeout, max_retries, **kwargs)
+
+    def head(
+        self,
+        url: str,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """HEAD a URL through the shared session (same retries and breaker as get)"""
+        kwargs.setdefault("allow_redirects", True)
+        return self._request("HEAD", url, timeout, max_retries, **kwargs)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[float],
+        max_retries: Optional[int],
+        **kwargs,
+    ) -> requests.Response:
+        if max_retries is None:
+            max_retries = getattr(_retry_override, "max_retries", None)
+        if max_retries is None:
+            max_retries = self.max_retries
+        if timeout is not None:
+            kwargs["timeout"] = (self.timeout[0], timeout)
+        else:
+            kwargs.setdefault("timeout", self.timeout)
+
+        url = self.resolve(url)
+        host = urlsplit(url).netloc
+        with self._stats_lock:
+            breaker = self.breakers.setdefault(host, CircuitBreaker())
+        self.retry_budget.record_request()
+
+        attempt = 0
+        while True:
+            probe = breaker.wait_until_allowed()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                breaker.record(False, probe)
+                if not self._can_retry(attempt, max_retries):
+                    raise
+                time.sleep(backoff_delay(attempt))
+                attempt += 1
+                continue
+            except BaseException:
+                # Not a sign of host trouble, but a probe must still release its slot
+                if probe:
+                    breaker.record(False, probe)
+                raise
+
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                breaker.record(True, probe)
+                return response
+
+            breaker.record(False, probe)
+            if not self._can_retry(attempt, max_retries):
+                return response
+            delay = max(backoff_delay(attempt), retry_after_seconds(response) or 0.0)
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _can_retry(self, attempt: int, max_retries: int) -> bool:
+        if attempt >= max_retries:
+            return False
+        if not self.retry_budget.try_spend():
+            with self._stats_lock:
+                self.retry_stats["budgetExhausted"] += 1
+            return False
+        with self._stats_lock:
+            self.retry_stats["retries"] += 1
+        return True
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Connection reuse statistics per host.
+
+        Returns:
+            dict mapping host to {"requests", "connections", "reused"}, where
+            connections is how many new TCP connections were opened and reused
+            is how many requests went over an already-open connection
+        """
+        stats = {}
+        for host, adapter in self.adapters.items():
+            num_requests = 0
+            num_connections = 0
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                num_requests += pool.num_requests
+                num_connections += pool.num_connections
+            stats[host] = {
+                "requests": num_requests,
+                "connections": num_connections,
+                "reused": max(num_requests - num_connections, 0),
+            }
+        return stats
+
+    def print_stats(self):
+        """Print connection reuse statistics per host, plus retry/breaker activity"""
+        self.print_resilience_stats()
+        print("HTTP connection reuse:")
+        for host, host_stats in self.get_stats().items():
+            if host_stats["requests"] == 0:
+                continue
+            reuse_pct = host_stats["reused"] / host_stats["requests"] * 100
+            print(
+                f"  {host}: {host_stats['requests']} requests over "
+                f"{host_stats['connections']} connections ({reuse_pct:.1f}% reused)"
+            )
+
+    def print_resilience_stats(self):
+        """Print retry and circuit breaker activity"""
+        opened = {host: b.times_opened for host, b in self.breakers.items() if b.times_opened}
+        if not self.retry_stats["retries"] and not self.retry_stats["budgetExhausted"] and not opened:
+            return
+        print(
+            f"HTTP retries: {self.retry_stats['retries']} "
+            f"({self.retry_stats['budgetExhausted']} skipped, retry budget exhausted)"
+        )
+        for host, times in opened.items():
+            print(f"  Circuit breaker for {host} opened {times} times")
+
+    def close(self):
+        self.session.close()
+
+
+_shared_client: Optional[HttpClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide HttpClient, creating it with defaults on first use"""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
+
+
+def configure_http_client(**kwargs) -> HttpClient:
+    """
+    Replace the process-wide HttpClient with one built from kwargs.
+    Call before any fetching starts (e.g. at the top of a script).
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+        _shared_client = HttpClient(**kwargs)
+        return _shared_client
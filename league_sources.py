@@ -0,0 +1,174 @@
+"""
+League sources: where a league's rosters, player details and headshots come from.
+
+NhleGithub does the fetching (shared HTTP client, on-disk cache, request
+coalescing, parallel roster fetches); a source only says which teams exist,
+which URLs to hit and how to read the responses. Adding a league means adding
+a LeagueSource subclass and registering it in LEAGUE_SOURCES.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+from models import Player, TeamRoster
+
+API_URL = "https://api-web.nhle.com/v1"
+STATS_REST_URL = "https://api.nhle.com/stats/rest/en"
+
+allActiveTeams = [
+    "ANA",  # Anaheim Ducks
+    "BOS",  # Boston Bruins
+    "BUF",  # Buffalo Sabres
+    "CAR",  # Carolina Hurricanes
+    "CBJ",  # Columbus Blue Jackets
+    "CGY",  # Calgary Flames
+    "CHI",  # Chicago Blackhawks
+    "COL",  # Colorado Avalanche
+    "DAL",  # Dallas Stars
+    "DET",  # Detroit Red Wings
+    "EDM",  # Edmonton Oilers
+    "FLA",  # Florida Panthers
+    "LAK",  # Los Angeles Kings
+    "MIN",  # Minnesota Wild
+    "MTL",  # Montreal Canadiens
+    "NJD",  # New Jersey Devils
+    "NSH",  # Nashville Predators
+    "NYI",  # New York Islanders
+    "NYR",  # New York Rangers
+    "OTT",  # Ottawa Senators
+    "PHI",  # Philadelphia Flyers
+    "PIT",  # Pittsburgh Penguins
+    "SEA",  # Seattle Kraken
+    "SJS",  # San Jose Sharks
+    "STL",  # St. Louis Blues
+    "TBL",  # Tampa Bay Lightning
+    "TOR",  # Toronto Maple Leafs
+    "UTA",  # Utah Hockey Club (formerly Arizona)
+    "VAN",  # Vancouver Canucks
+    "VGK",  # Vegas Golden Knights
+    "WPG",  # Winnipeg Jets
+    "WSH",  # Washington Capitals
+]
+
+CURRENT_SEASON = "20252026"
+
+# Franchise changes, as (team code, first season, last season) with None = open-ended
+TEAM_SEASON_RANGES = [
+    ("ARI", None, 20232024),      # Arizona Coyotes, relocated to Utah
+    ("UTA", 20242025, None),
+    ("SEA", 20212022, None),      # Seattle expansion
+    ("VGK", 20172018, None),      # Vegas expansion
+]
+
+
+def teams_for_season(season: int) -> list[str]:
+    """Team codes that iced a roster in the given season (e.g. 20152016)"""
+    teams = set(allActiveTeams)
+    for team_code, first, last in TEAM_SEASON_RANGES:
+        if (first is None or season >= first) and (last is None or season <= last):
+            teams.add(team_code)
+        else:
+            teams.discard(team_code)
+    return sorted(teams)
+
+
+class LeagueSource(ABC):
+    """Base class for a league's roster, player-detail and headshot resolvers"""
+
+    name = ""
+
+    @abstractmethod
+    def team_codes(self, season: int) -> List[str]:
+        """Teams whose rosters make up the league in the given season"""
+
+    @abstractmethod
+    def roster_url(self, team_code: str, season: int) -> str:
+        pass
+
+    def parse_roster(self, payload: dict) -> TeamRoster:
+        return TeamRoster(**payload)
+
+    @abstractmethod
+    def player_detail_url(self, player_id: int) -> str:
+        pass
+
+    @abstractmethod
+    def game_log_url(self, player_id: int, season: int, game_type: int) -> str:
+        """Game-by-game log of a player for a season (game_type 2 = regular season, 3 = playoffs)"""
+
+    @abstractmethod
+    def stats_report_url(self, report: str, query: str) -> str:
+        """One page of a paged season stats report (e.g. "skater/summary") with the encoded query"""
+
+    def headshot_url(self, player: Player) -> str:
+        """Headshot to score for a roster player, or "" to skip the player"""
+        return (player.headshot or "").strip()
+
+
+class NhlSource(LeagueSource):
+    """NHL rosters from /v1/roster/{team}/{season}"""
+
+    name = "nhl"
+
+    def team_codes(self, season: int) -> List[str]:
+        return teams_for_season(season)
+
+    # https://api-web.nhle.com/v1/roster/TOR/20252026
+    def roster_url(self, team_code: str, season: int) -> str:
+        return f"{API_URL}/roster/{team_code}/{season}"
+
+    # https://api-web.nhle.com/v1/player/8478402/landing
+    def player_detail_url(self, player_id: int) -> str:
+        return f"{API_URL}/player/{player_id}/landing"
+
+    # https://api-web.nhle.com/v1/player/8478402/game-log/20252026/2
+    def game_log_url(self, player_id: int, season: int, game_type: int) -> str:
+        return f"{API_URL}/player/{player_id}/game-log/{season}/{game_type}"
+
+    # https://api.nhle.com/stats/rest/en/skater/summary?...
+    def stats_report_url(self, report: str, query: str) -> str:
+        return f"{STATS_REST_URL}/{report}?{query}"
+
+
+class NhlProspectsSource(NhlSource):
+    """
+    Each NHL organization's prospects (AHL, junior, college and European
+    players whose rights it holds) from /v1/prospects/{team}. Prospects have
+    NHL player ids, so player details come from the same landing endpoint.
+    """
+
+    name = "nhl-prospects"
+
+    # https://api-web.nhle.com/v1/prospects/TOR (always the current prospect pool)
+    def roster_url(self, team_code: str, season: int) -> str:
+        return f"{API_URL}/prospects/{team_code}"
+
+    def parse_roster(self, payload: dict) -> TeamRoster:
+        # Prospect entries are often missing bio fields; drop those instead of the whole team
+        groups = {}
+        for group in ("forwards", "defensemen", "goalies"):
+            players = []
+            for entry in payload.get(group, []):
+                try:
+                    players.append(Player(**entry))
+                except Exception as e:
+                    print(f"    Skipping prospect {entry.get('id')}: {e}")
+            groups[group] = players
+        return TeamRoster(**groups)
+
+    def headshot_url(self, player: Player) -> str:
+        headshot = super().headshot_url(player)
+        # Unsigned prospects get a generic silhouette, which says nothing about the player
+        if "/default-" in headshot:
+            return ""
+        return headshot
+
+
+LEAGUE_SOURCES = {source.name: source for source in (NhlSource, NhlProspectsSource)}
+
+
+def get_league_source(name: str) -> LeagueSource:
+    """Instantiate a registered source by name (e.g. "nhl", "nhl-prospects")"""
+    try:
+        return LEAGUE_SOURCES[name]()
+    except KeyError:
+        raise ValueError(f"Unknown league source {name!r}, expected one of {', '.join(LEAGUE_SOURCES)}")
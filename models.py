@@ -197,3 +197,42 @@ class SimpleSpecificPlayerData(PlayerAttractiveAnalysis):
     shootsCatches: str
     birthDate: str
     thisSeasonTotals: Optional[SeasonStats] = None
+
+
+class RosterEntry(BaseModel):
+    id: int
+    team: str
+    headshot: str
+    firstName: str
+    lastName: str
+    source: str = "nhl"  # league source the roster came from (see league_sources)
+
+
+class RosterTrade(BaseModel):
+    player: RosterEntry
+    fromTeam: str
+    toTeam: str
+
+
+class HeadshotChange(BaseModel):
+    player: RosterEntry
+    oldHeadshot: str
+    newHeadshot: str
+
+
+class RosterDiff(BaseModel):
+    added: List[RosterEntry] = []
+    removed: List[RosterEntry] = []
+    traded: List[RosterTrade] = []
+    headshotChanged: List[HeadshotChange] = []
+
+
+class BulkPlayerSeason(BaseModel):
+    """One player's bio and season totals, joined from the stats REST summary and bios reports"""
+    playerId: int
+    position: str
+    birthCountry: str
+    birthDate: str
+    shootsCatches: str
+    currentTeamAbbrev: Optional[str] = None
+    seasonStats: SeasonStats
@@ -1,67 +1,132 @@
-import requests
-from pathlib import Path
-import json
-from models import SimplePlayer, TeamRoster, SpecificPlayerInfo
-
-allActiveTeams = [
-    "ANA",  # Anaheim Ducks
-    "BOS",  # Boston Bruins
-    "BUF",  # Buffalo Sabres
-    "CAR",  # Carolina Hurricanes
-    "CBJ",  # Columbus Blue Jackets
-    "CGY",  # Calgary Flames
-    "CHI",  # Chicago Blackhawks
-    "COL",  # Colorado Avalanche
-    "DAL",  # Dallas Stars
-    "DET",  # Detroit Red Wings
-    "EDM",  # Edmonton Oilers
-    "FLA",  # Florida Panthers
-    "LAK",  # Los Angeles Kings
-    "MIN",  # Minnesota Wild
-    "MTL",  # Montreal Canadiens
-    "NJD",  # New Jersey Devils
-    "NSH",  # Nashville Predators
-    "NYI",  # New York Islanders
-    "NYR",  # New York Rangers
-    "OTT",  # Ottawa Senators
-    "PHI",  # Philadelphia Flyers
-    "PIT",  # Pittsburgh Penguins
-    "SEA",  # Seattle Kraken
-    "SJS",  # San Jose Sharks
-    "STL",  # St. Louis Blues
-    "TBL",  # Tampa Bay Lightning
-    "TOR",  # Toronto Maple Leafs
-    "UTA",  # Utah Hockey Club (formerly Arizona)
-    "VAN",  # Vancouver Canucks
-    "VGK",  # Vegas Golden Knights
-    "WPG",  # Winnipeg Jets
-    "WSH",  # Washington Capitals
-]
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Iterable, Optional
+from urllib.parse import urlencode
+from pydantic import BaseModel, create_model
+from http_client import HttpClient, get_http_client
+from http_cache import HttpCache, get_http_cache
+from standings import LiveStandings
+from league_sources import LeagueSource, NhlSource, allActiveTeams, CURRENT_SEASON, teams_for_season  # re-exported
+from request_coalescer import SingleFlight
+from models import SimplePlayer, TeamRoster, SpecificPlayerInfo, BulkPlayerSeason, SeasonStats, GameLog
+
+# Seconds a cached response is served without revalidating against the API
+CACHE_TTLS = {
+    "roster": 6 * 60 * 60,   # rosters change a few times a week at most
+    "landing": 60 * 60,      # season totals move after every game day
+    "stats-summary": 60 * 60,
+    "standings": 15 * 60,    # standings only move when games finish
+    "game-log": 60 * 60,
+}
+
+# Rows per page of the stats REST reports joined by get_bulk_season_stats
+STATS_PAGE_SIZE = 100
 
 class NhleGithub:
-    def __init__(self):
-        self.season = "20252026"
-        self.base_url = "https://api-web.nhle.com/v1/roster"
+    def __init__(
+        self,
+        http_client: Optional[HttpClient] = None,
+        cache: Optional[HttpCache] = None,
+        use_cache: bool = True,
+        season: str = CURRENT_SEASON,
+        source: Optional[LeagueSource] = None,
+    ):
+        self.season = season
+        # Which league's teams, URLs and headshots this client works with
+        self.source = source or NhlSource()
+        self.http = http_client or get_http_client()
+        # Roster and landing responses go through the on-disk conditional cache
+        self.cache = (cache or get_http_cache()) if use_cache else None
+        # Coalesce concurrent requests for a URL only: memoizing would pin every raw payload
+        # (e.g. ~800 landing pages) for the client's lifetime; HttpCache covers repeats
+        self._requests = SingleFlight(memoize=False)
+        # Live standings (through the HTTP cache unless disabled), served from memory between refreshes
+        self.standings = LiveStandings(self.http, self.cache, ttl=CACHE_TTLS["standings"])
+
+    def _get_json(self, url: str, endpoint: str):
+        # Concurrent requests for the same URL share one fetch
+        return self._requests.do(url, lambda: self._fetch_json(url, endpoint))
+
+    def _fetch_json(self, url: str, endpoint: str):
+        if self.cache is not None:
+            return self.cache.fetch_json(self.http, url, CACHE_TTLS[endpoint])
+        response = self.http.get(url)
+        response.raise_for_status()
+        return response.json()
+
+    def gat_all_players_on_all_teams(
+        self,
+        max_concurrency: Optional[int] = None,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+        team_codes: Optional[list[str]] = None,
+    ) -> dict[str, TeamRoster]:
+        """
+        Fetch every roster of the source's teams for this season (or team_codes) in parallel.
+
+        Args:
+            max_concurrency: Max rosters in flight at once (None = all teams at once)
+            on_error: Called with (team_code, exception) for a failed team, which is
+                      then left out of the result. If None, the first error is raised.
+            team_codes: Teams to fetch instead of the source's team list
+
+        Returns:
+            dict mapping team code to TeamRoster, in team order
+        """
+        return asyncio.run(
+            self.gat_all_players_on_all_teams_async(max_concurrency, on_error, team_codes)
+        )
+
+    async def gat_all_players_on_all_teams_async(
+        self,
+        max_concurrency: Optional[int] = None,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+        team_codes: Optional[list[str]] = None,
+    ) -> dict[str, TeamRoster]:
+        """Async version of gat_all_players_on_all_teams, for callers already in a loop"""
+        team_codes = team_codes or self.source.team_codes(int(self.season))
+        workers = max_concurrency or len(team_codes)
+        semaphore = asyncio.Semaphore(workers)
+        loop = asyncio.get_running_loop()
+
+        # Dedicated pool so the default executor's size doesn't cap concurrency
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            async def fetch(team_code: str) -> Optional[TeamRoster]:
+                async with semaphore:
+                    try:
+                        return await loop.run_in_executor(
+                            executor, self.get_players_on_team, team_code
+                        )
+                    except Exception as e:
+                        if on_error is None:
+                            raise
+                        on_error(team_code, e)
+                        return None
+
+            rosters = await asyncio.gather(*(fetch(team_code) for team_code in team_codes))
 
-    def gat_all_players_on_all_teams(self) -> dict[str, TeamRoster]:
-        all_teams_rosters = {}
-        for team_code in allActiveTeams:
-            roster = self.get_players_on_team(team_code)
-            all_teams_rosters[team_code] = roster
-        return all_teams_rosters
+        return {
+            team_code: roster
+            for team_code, roster in zip(team_codes, rosters)
+            if roster is not None
+        }
 
     # Return SimplePlayer list from TeamRoster
     def get_simplifiedPlayers(self, team_code: str) -> list[SimplePlayer]:
-        roster = self.get_players_on_team(team_code)
+        return self.simplify_roster(self.get_players_on_team(team_code))
+
+    # Same as get_simplifiedPlayers, for a roster that was already fetched
+    def simplify_roster(self, roster: TeamRoster) -> list[SimplePlayer]:
         simple_players = []
         for player in roster.forwards + roster.defensemen + roster.goalies:
             # Skip players without valid headshots
-            if not player.headshot or not player.headshot.strip():
+            headshot = self.source.headshot_url(player)
+            if not headshot:
                 continue
             try:
                 simple_player = SimplePlayer(
                     id=player.id,
-                    headshot=player.headshot,
+                    headshot=headshot,
                     firstName=player.firstName,
                     lastName=player.lastName,
                 )
@@ -72,27 +137,151 @@ class NhleGithub:
                 continue
         return simple_players
 
-    # https://api-web.nhle.com/v1/roster/TOR/20252026
+    # https://api-web.nhle.com/v1/roster/TOR/20252026 (for the NHL source)
     def get_players_on_team(self, team_code: str) -> TeamRoster:
-        url = f"{self.base_url}/{team_code}/{self.season}"
-        response = requests.get(url)
-        response.raise_for_status()
+        url = self.source.roster_url(team_code, int(self.season))
         
         # Validate and parse the response
-        roster = TeamRoster(**response.json())
+        roster = self.source.parse_roster(self._get_json(url, "roster"))
         return roster
 
     # Get specific player stats
     # https://api-web.nhle.com/v1/player/8478402/landing
-    def get_player_stats(self, player_id: int) -> SpecificPlayerInfo:
-        url = f"https://api-web.nhle.com/v1/player/{player_id}/landing"
-        response = requests.get(url)
-        response.raise_for_status()
-        return SpecificPlayerInfo(**response.json())
+    def get_player_stats(
+        self,
+        player_id: int,
+        fields: Optional[Iterable[str]] = None,
+        season: Optional[int] = None,
+    ) -> SpecificPlayerInfo:
+        """
+        Fetch a player's landing page.
+
+        Args:
+            player_id: NHL player id
+            fields: If given, only these SpecificPlayerInfo fields are validated and
+                    set on the result; the rest of the payload (badges, last5Games,
+                    career totals, ...) is skipped. Unset fields keep their defaults,
+                    and required fields that were not requested are absent.
+            season: With fields, keep only the seasonTotals rows for this season
+                    (e.g. 20252026) instead of validating the whole career
+
+        Returns:
+            SpecificPlayerInfo (fully validated, or a projection when fields is given)
+        """
+        payload = self._get_json(self._landing_url(player_id), "landing")
+        if fields is None:
+            return SpecificPlayerInfo(**payload)
+        return project_landing(payload, fields, season)
+
+    def _landing_url(self, player_id: int) -> str:
+        return self.source.player_detail_url(player_id)
+
+    # Get a player's game-by-game log for a season
+    # https://api-web.nhle.com/v1/player/8478402/game-log/20252026/2
+    def get_player_game_log(
+        self,
+        player_id: int,
+        season: Optional[int] = None,
+        game_type: int = 2,
+    ) -> list[GameLog]:
+        """
+        Args:
+            player_id: NHL player id
+            season: Season id such as 20252026 (defaults to self.season)
+            game_type: 2 for regular season, 3 for playoffs
+
+        Returns:
+            GameLog entries, oldest game first
+        """
+        season = season or int(self.season)
+        payload = self._get_json(self._game_log_url(player_id, season, game_type), "game-log")
+        # The endpoint lists newest games first and leaves gameTypeId implied by the URL
+        games = [GameLog(**{"gameTypeId": game_type, **game}) for game in payload.get("gameLog", [])]
+        games.sort(key=lambda game: (game.gameDate, game.gameId))
+        return games
+
+    def _game_log_url(self, player_id: int, season: int, game_type: int = 2) -> str:
+        return self.source.game_log_url(player_id, season, game_type)
+
+    def is_game_log_cached(self, player_id: int, season: Optional[int] = None) -> bool:
+        if self.cache is None:
+            return False
+        url = self._game_log_url(player_id, season or int(self.season))
+        return self.cache.is_fresh(self.http, url, CACHE_TTLS["game-log"])
+
+    # True if get_player_stats would be answered from the local cache without a request
+    def is_player_stats_cached(self, player_id: int) -> bool:
+        if self.cache is None:
+            return False
+        return self.cache.is_fresh(self.http, self._landing_url(player_id), CACHE_TTLS["landing"])
     
+    def _get_stats_report(self, report: str, season: int) -> list[dict]:
+        """
+        Every row of a stats REST report (e.g. "skater/summary") for one regular season.
+        The first page reports the total, the remaining pages are fetched in parallel.
+        """
+        def page_url(start: int) -> str:
+            query = urlencode({
+                "isAggregate": "false",
+                "isGame": "false",
+                "sort": '[{"property":"playerId","direction":"ASC"}]',
+                "start": start,
+                "limit": STATS_PAGE_SIZE,
+                "cayenneExp": f"gameTypeId=2 and seasonId={season}",
+            })
+            return self.source.stats_report_url(report, query)
+
+        first_page = self._get_json(page_url(0), "stats-summary")
+        rows = list(first_page.get("data", []))
+        starts = range(STATS_PAGE_SIZE, first_page.get("total", 0), STATS_PAGE_SIZE)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for page in executor.map(lambda start: self._get_json(page_url(start), "stats-summary"), starts):
+                rows.extend(page.get("data", []))
+        return rows
+
+    def get_bulk_season_stats(self, season: Optional[int] = None) -> dict[int, BulkPlayerSeason]:
+        """
+        Season totals and bio fields for every skater and goalie, from a few paged
+        stats REST requests instead of one landing page per player.
+
+        Args:
+            season: Season id such as 20252026 (defaults to self.season)
+
+        Returns:
+            dict mapping player id to BulkPlayerSeason. Players missing from either
+            the summary or the bios report are left out, so callers can fall back
+            to get_player_stats for them.
+        """
+        season = season or int(self.season)
+        players: dict[int, BulkPlayerSeason] = {}
+
+        for player_type in ("skater", "goalie"):
+            summaries = {row["playerId"]: row for row in self._get_stats_report(f"{player_type}/summary", season)}
+            bios = {row["playerId"]: row for row in self._get_stats_report(f"{player_type}/bios", season)}
+
+            for player_id, summary in summaries.items():
+                bio = bios.get(player_id)
+                if bio is None:
+                    continue
+                try:
+                    players[player_id] = BulkPlayerSeason(
+                        playerId=player_id,
+                        position=bio.get("positionCode") or ("G" if player_type == "goalie" else ""),
+                        birthCountry=bio["birthCountryCode"],
+                        birthDate=bio["birthDate"],
+                        shootsCatches=bio.get("shootsCatches") or bio.get("catches"),
+                        currentTeamAbbrev=bio.get("currentTeamAbbrev"),
+                        seasonStats=_season_stats_from_summary(summary, player_type),
+                    )
+                except Exception as e:
+                    # Incomplete bio rows are left to the landing-page fallback
+                    print(f"    Skipping bulk stats for player {player_id}: {e}")
+        return players
+
     def get_num_wins_for_team(self, team_code: str) -> float:
         """
-        Get the points percentage for a specific team from league-standings.json.
+        Get the points percentage for a specific team from the live standings.
         
         Args:
             team_code: Three-letter team code (e.g., 'TOR')
@@ -100,26 +289,130 @@ class NhleGithub:
         Returns:
             Points percentage as a float (e.g., 0.625 for 62.5%)
         """
-        # Load standings data from JSON file
-        standings_file = Path(__file__).parent / "nhle" / "league-standings.json"
+        return self.standings.get_field(team_code, "pointPctg", 0.0)
+
+    def get_team_standing(self, team_code: str) -> Optional[dict]:
+        """
+        Get every standings field for a team (wins, losses, points, goalDifferential, ...).
         
-        try:
-            with open(standings_file, 'r') as f:
-                standings_data = json.load(f)
-            
-            # Search through standings for the team
-            for standing in standings_data.get("standings", []):
-                if standing.get("teamAbbrev", {}).get("default") == team_code or \
-                   standing.get("teamAbbrev") == team_code:
-                    return standing.get("pointPctg", 0.0)
+        Args:
+            team_code: Three-letter team code (e.g., 'TOR')
             
-            return 0.0
-        except FileNotFoundError:
-            print(f"Warning: league-standings.json not found at {standings_file}")
-            return 0.0
-        except Exception as e:
-            print(f"Error reading league standings: {e}")
-            return 0.0
+        Returns:
+            The team's standings row, or None if the team isn't in the standings
+        """
+        return self.standings.get(team_code)
+
+
+def _format_toi(seconds: Optional[float]) -> Optional[str]:
+    if seconds is None:
+        return None
+    seconds = int(round(seconds))
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+def _season_stats_from_summary(summary: dict, player_type: str) -> SeasonStats:
+    # Skater summaries report TOI per game; goalie summaries report the season total
+    games_played = summary.get("gamesPlayed")
+    if player_type == "skater":
+        avg_toi_seconds = summary.get("timeOnIcePerGame")
+    elif summary.get("timeOnIce") is not None and games_played:
+        avg_toi_seconds = summary["timeOnIce"] / games_played
+    else:
+        avg_toi_seconds = None
+
+    return SeasonStats(
+        goals=summary.get("goals"),
+        assists=summary.get("assists"),
+        points=summary.get("points"),
+        pim=summary.get("penaltyMinutes"),
+        plusMinus=summary.get("plusMinus"),
+        gamesPlayed=games_played,
+        avgToi=_format_toi(avg_toi_seconds),
+    )
+
+
+@lru_cache(maxsize=None)
+def _landing_projection_model(fields: frozenset[str]) -> type[BaseModel]:
+    # Subset of SpecificPlayerInfo with the same types/defaults, built once per field set
+    return create_model(
+        "SpecificPlayerInfoProjection",
+        **{name: (SpecificPlayerInfo.model_fields[name].annotation, SpecificPlayerInfo.model_fields[name])
+           for name in fields},
+    )
+
+
+def project_landing(payload: dict, fields: Iterable[str], season: Optional[int] = None) -> SpecificPlayerInfo:
+    """
+    Validate only the requested fields of a landing payload.
+
+    Args:
+        payload: Raw /player/{id}/landing JSON
+        fields: SpecificPlayerInfo field names to keep
+        season: If given, seasonTotals is cut down to rows for this season before validation
+
+    Returns:
+        SpecificPlayerInfo built with model_construct from the validated subset
+    """
+    fields = frozenset(fields)
+    unknown = fields - SpecificPlayerInfo.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown SpecificPlayerInfo fields: {sorted(unknown)}")
+
+    subset = {name: payload[name] for name in fields if name in payload}
+    if season is not None and subset.get("seasonTotals"):
+        subset["seasonTotals"] = [row for row in subset["seasonTotals"] if row.get("season") == season]
+
+    projection = _landing_projection_model(fields)(**subset)
+    return SpecificPlayerInfo.model_construct(
+        _fields_set=projection.model_fields_set,
+        **{name: getattr(projection, name) for name in fields},
+    )
+
+
+def fetch_all_rosters(
+    clients: Iterable[NhleGithub],
+    on_error: Optional[Callable[[str, str, Exception], None]] = None,
+) -> dict[str, dict[str, TeamRoster]]:
+    """
+    Fetch every team of every client's league source at once, in one event loop,
+    so extra leagues add parallel requests rather than another serial pass.
+
+    Args:
+        clients: One NhleGithub per league source
+        on_error: Called with (source name, team_code, exception) for a failed team,
+                  which is then left out. If None, the first error is raised.
+
+    Returns:
+        dict mapping source name to {team code: TeamRoster}
+    """
+    clients = list(clients)
+
+    def team_error_handler(client: NhleGithub) -> Optional[Callable[[str, Exception], None]]:
+        if on_error is None:
+            return None
+        return lambda team_code, e: on_error(client.source.name, team_code, e)
+
+    async def fetch_all():
+        return await asyncio.gather(*(
+            client.gat_all_players_on_all_teams_async(on_error=team_error_handler(client))
+            for client in clients
+        ))
+
+    results = asyncio.run(fetch_all())
+    return {client.source.name: rosters for client, rosters in zip(clients, results)}
+
+
+def unique_players(players: Iterable[SimplePlayer]) -> list[SimplePlayer]:
+    """Drop repeat entries for the same player id (e.g. listed on two rosters), keeping the first"""
+    seen = set()
+    unique = []
+    for player in players:
+        if player.id in seen:
+            continue
+        seen.add(player.id)
+        unique.append(player)
+    return unique
 
 
 # Main function, print how many teams are there
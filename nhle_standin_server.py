@@ -0,0 +1,228 @@
+"""
+Local record/replay stand-in for api-web.nhle.com, api.nhle.com (stats REST)
+and assets.nhle.com.
+
+Serves rosters, landing pages, standings and headshot PNGs from recorded
+fixtures so the ingestion pipeline can be benchmarked and stress-tested with
+no network, optionally with injected latency, 5xx errors and 429s.
+
+    # Record fixtures by proxying the real API while running the pipeline once
+    python nhle_standin_server.py --record
+
+    # Replay them offline with some trouble mixed in
+    python nhle_standin_server.py --latency-ms 80 --jitter-ms 40 --error-rate 0.02 --throttle-rate 0.05
+
+    # Point the pipeline at it
+    export NHLE_API_BASE_URL=http://127.0.0.1:8765/api
+    export NHLE_ASSETS_BASE_URL=http://127.0.0.1:8765/assets
+    export NHLE_STATS_BASE_URL=http://127.0.0.1:8765/stats
+    python full_league_script.py
+"""
+
+import argparse
+import hashlib
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from http_client import API_BASE_URL, ASSETS_BASE_URL, STATS_BASE_URL, HttpClient
+
+DEFAULT_FIXTURES_DIR = Path(__file__).parent / "fixtures" / "nhle"
+
+# URL prefix on the stand-in -> real origin it stands in for
+UPSTREAMS = {
+    "api": API_BASE_URL,
+    "assets": ASSETS_BASE_URL,
+    "stats": STATS_BASE_URL,
+}
+
+CONTENT_TYPES = {
+    ".json": "application/json",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+}
+
+
+class StandinConfig:
+    def __init__(
+        self,
+        fixtures_dir: Path = DEFAULT_FIXTURES_DIR,
+        record: bool = False,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+    ):
+        """
+        Args:
+            fixtures_dir: Where recorded responses live (fixtures_dir/api/..., fixtures_dir/assets/...)
+            record: Proxy fixture misses to the real NHL hosts and save them
+            latency_ms: Delay added to every response
+            jitter_ms: Random extra delay in [0, jitter_ms]
+            error_rate: Fraction of requests answered with 503
+            throttle_rate: Fraction of requests answered with 429 + Retry-After
+            retry_after: Retry-After seconds sent with injected 429s
+        """
+        self.fixtures_dir = Path(fixtures_dir)
+        self.record = record
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+
+
+def fixture_path(fixtures_dir: Path, prefix: str, path: str, query: str) -> Path:
+    """
+    Map a request to its fixture file, e.g.
+    /api/v1/roster/TOR/20252026 -> fixtures_dir/api/v1/roster/TOR/20252026.json
+    """
+    relative = path.strip("/")
+    if query:
+        relative += "__" + hashlib.sha1(query.encode("utf-8")).hexdigest()[:12]
+    if Path(relative).suffix not in CONTENT_TYPES:
+        relative += ".json"
+    return fixtures_dir / prefix / relative
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    config: StandinConfig
+    upstream: HttpClient
+    stats: dict[str, int]
+    stats_lock: threading.Lock
+
+    def _count(self, stat: str):
+        with self.stats_lock:
+            self.stats[stat] = self.stats.get(stat, 0) + 1
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "application/json", headers: dict = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _load_or_record(self, prefix: str, path: str, query: str):
+        fixture = fixture_path(self.config.fixtures_dir, prefix, path, query)
+        if fixture.exists():
+            return fixture
+
+        if not self.config.record:
+            return None
+
+        url = f"{UPSTREAMS[prefix]}{path}" + (f"?{query}" if query else "")
+        response = self.upstream.get(url)
+        if response.status_code != 200:
+            return None
+        fixture.parent.mkdir(parents=True, exist_ok=True)
+        fixture.write_bytes(response.content)
+        self._count("recorded")
+        return fixture
+
+    def _handle(self):
+        split = urlsplit(self.path)
+        prefix, _, rest = split.path.lstrip("/").partition("/")
+        if prefix not in UPSTREAMS:
+            self._count("not_found")
+            self._send(404, b'{"error": "unknown prefix"}')
+            return
+
+        delay_ms = self.config.latency_ms + random.uniform(0, self.config.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        roll = random.random()
+        if roll < self.config.throttle_rate:
+            self._count("throttled")
+            self._send(429, b'{"error": "rate limited"}', headers={"Retry-After": str(self.config.retry_after)})
+            return
+        if roll < self.config.throttle_rate + self.config.error_rate:
+            self._count("errors")
+            self._send(503, b'{"error": "injected failure"}')
+            return
+
+        fixture = self._load_or_record(prefix, "/" + rest, split.query)
+        if fixture is None:
+            self._count("not_found")
+            self._send(404, b'{"error": "no fixture recorded"}')
+            return
+
+        body = fixture.read_bytes()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self._count("not_modified")
+            self._send(304, headers={"ETag": etag})
+            return
+
+        self._count("served")
+        content_type = CONTENT_TYPES.get(fixture.suffix, "application/octet-stream")
+        self._send(200, body, content_type, headers={"ETag": etag})
+
+    def do_GET(self):
+        self._handle()
+
+    def do_HEAD(self):
+        self._handle()
+
+    def log_message(self, format, *args):
+        # One line per request would drown out the pipeline's own output
+        pass
+
+
+def make_server(host: str, port: int, config: StandinConfig) -> ThreadingHTTPServer:
+    """Build (but don't start) a stand-in server; handy for running it in a background thread"""
+    handler = type("ConfiguredStandinHandler", (StandinHandler,), {
+        "config": config,
+        # Always talk to the real hosts when recording, whatever NHLE_*_BASE_URL says
+        "upstream": HttpClient(
+            api_base_url=API_BASE_URL, assets_base_url=ASSETS_BASE_URL, stats_base_url=STATS_BASE_URL
+        ),
+        "stats": {},
+        "stats_lock": threading.Lock(),
+    })
+    return ThreadingHTTPServer((host, port), handler)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline stand-in for the NHL API and headshot CDN")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES_DIR)
+    parser.add_argument("--record", action="store_true", help="proxy misses to the real API and save them")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1)
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        fixtures_dir=args.fixtures,
+        record=args.record,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+    )
+    server = make_server(args.host, args.port, config)
+    base = f"http://{args.host}:{args.port}"
+
+    print(f"NHL stand-in listening on {base} ({'recording' if args.record else 'replay'} mode)")
+    print(f"  export NHLE_API_BASE_URL={base}/api")
+    print(f"  export NHLE_ASSETS_BASE_URL={base}/assets")
+    print(f"  export NHLE_STATS_BASE_URL={base}/stats")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Request summary: {server.RequestHandlerClass.stats}")
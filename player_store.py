@@ -0,0 +1,728 @@
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional
+from models import BulkPlayerSeason, GameLog, Name, PlayerAttractiveAnalysis, RosterEntry, SeasonStats, SimplePlayer, SimpleSpecificPlayerData
+
+PLAYERS_DIR = Path(__file__).parent / "players"
+DEFAULT_DB_FILE = PLAYERS_DIR / "players.db"
+
+# Legacy JSON artifacts, imported the first time a store is created
+LEGACY_ANALYSIS_FILE = PLAYERS_DIR / "attractiveness_analysis.json"
+LEGACY_STATS_FILE = PLAYERS_DIR / "attractive_players_with_stats.json"
+LEGACY_SEASON = 20252026
+
+DEFAULT_MODEL = "svr"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    headshot TEXT,
+    team TEXT,
+    position TEXT,
+    birth_country TEXT,
+    birth_date TEXT,
+    shoots_catches TEXT,
+    is_active INTEGER,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_players_team ON players(team);
+CREATE INDEX IF NOT EXISTS idx_players_country ON players(birth_country);
+CREATE INDEX IF NOT EXISTS idx_players_position ON players(position);
+
+CREATE TABLE IF NOT EXISTS seasons (
+    season INTEGER PRIMARY KEY,
+    complete INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS scores (
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    model TEXT NOT NULL,
+    score REAL NOT NULL,
+    rank INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (player_id, model)
+);
+CREATE INDEX IF NOT EXISTS idx_scores_model_rank ON scores(model, rank);
+
+CREATE TABLE IF NOT EXISTS season_stats (
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    season INTEGER NOT NULL,
+    goals INTEGER,
+    assists INTEGER,
+    points INTEGER,
+    pim INTEGER,
+    plus_minus INTEGER,
+    games_played INTEGER,
+    avg_toi TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (player_id, season)
+);
+CREATE INDEX IF NOT EXISTS idx_season_stats_season ON season_stats(season);
+
+-- Last league-wide roster fetch, used to diff the next sync against
+CREATE TABLE IF NOT EXISTS roster_snapshot (
+    player_id INTEGER PRIMARY KEY,
+    team TEXT NOT NULL,
+    headshot TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    captured_at REAL NOT NULL,
+    source TEXT NOT NULL DEFAULT 'nhl'
+);
+
+-- Who was on which roster in each season, with that season's headshot (and its score, if computed)
+CREATE TABLE IF NOT EXISTS season_rosters (
+    season INTEGER NOT NULL,
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    team TEXT NOT NULL,
+    headshot TEXT NOT NULL,
+    score REAL,
+    PRIMARY KEY (season, player_id)
+);
+CREATE INDEX IF NOT EXISTS idx_season_rosters_team ON season_rosters(season, team);
+
+-- One row per player per game, appended by game_log_sync.py
+CREATE TABLE IF NOT EXISTS game_logs (
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    game_id INTEGER NOT NULL,
+    season INTEGER NOT NULL,
+    game_type INTEGER NOT NULL,
+    game_date TEXT NOT NULL,
+    team TEXT NOT NULL,
+    opponent TEXT NOT NULL,
+    home_road TEXT NOT NULL,
+    goals INTEGER,
+    assists INTEGER,
+    points INTEGER,
+    pim INTEGER,
+    plus_minus INTEGER,
+    shots INTEGER,
+    toi TEXT,
+    PRIMARY KEY (player_id, game_id)
+);
+CREATE INDEX IF NOT EXISTS idx_game_logs_season_date ON game_logs(season, player_id, game_date);
+
+-- Running sums of game_log_sync.RollingWindowCorrelation per season and window size (JSON),
+-- covering every game_logs row up to last_rowid
+CREATE TABLE IF NOT EXISTS rolling_correlations (
+    season INTEGER NOT NULL,
+    window_size INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    last_rowid INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (season, window_size)
+);
+"""
+
+
+class PlayerStore:
+    """
+    SQLite store for players, seasons, attractiveness scores and season stats.
+
+    Replaces the JSON artifacts under players/ as the hand-off between
+    full_league_script.py (scores), collect_all_player_data.py (stats),
+    ranking_script.py and predict_test_images.py. Writes are bulk upserts;
+    reads are indexed queries instead of re-parsing whole files.
+    """
+
+    def __init__(self, db_file: Path = DEFAULT_DB_FILE):
+        """
+        Args:
+            db_file: SQLite database file; created (and seeded from the legacy
+                     JSON files in players/, if present) on first use
+        """
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self.db_file.exists()
+
+        # One connection shared by worker threads, serialized by the lock
+        self.conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+        self._lock = threading.Lock()
+
+        if is_new and LEGACY_ANALYSIS_FILE.exists():
+            self.import_legacy_json()
+
+    def _migrate(self):
+        """Add columns introduced after a database was created"""
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(roster_snapshot)")}
+        if "source" not in columns:
+            with self.conn:
+                self.conn.execute("ALTER TABLE roster_snapshot ADD COLUMN source TEXT NOT NULL DEFAULT 'nhl'")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---- writes ----
+
+    def upsert_players(self, players: Iterable[SimplePlayer], team: Optional[str] = None):
+        """Bulk upsert roster-level player info (name, headshot, and team if given)"""
+        with self._lock, self.conn:
+            self._upsert_players(players, team)
+
+    def _upsert_players(self, players: Iterable[SimplePlayer], team: Optional[str] = None):
+        # Lock and transaction held by the caller
+        now = time.time()
+        rows = [
+            (p.id, p.firstName.default, p.lastName.default, p.headshot, team, now)
+            for p in players
+        ]
+        self.conn.executemany(
+            """
+            INSERT INTO players (id, first_name, last_name, headshot, team, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                first_name = excluded.first_name,
+                last_name = excluded.last_name,
+                headshot = excluded.headshot,
+                team = COALESCE(excluded.team, players.team),
+                updated_at = excluded.updated_at
+            """,
+            rows,
+        )
+
+    def upsert_scores(self, analyses: Iterable[PlayerAttractiveAnalysis], model: str = DEFAULT_MODEL):
+        """Bulk upsert attractiveness scores and ranks (and the players they belong to)"""
+        with self._lock, self.conn:
+            self._upsert_scores(list(analyses), model)
+
+    def _upsert_scores(self, analyses: List[PlayerAttractiveAnalysis], model: str):
+        # Lock and transaction held by the caller
+        self._upsert_players(a.player for a in analyses)
+        now = time.time()
+        self.conn.executemany(
+            """
+            INSERT INTO scores (player_id, model, score, rank, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(player_id, model) DO UPDATE SET
+                score = excluded.score,
+                rank = excluded.rank,
+                updated_at = excluded.updated_at
+            """,
+            [(a.player.id, model, a.ridgeAttractivenessScore, a.rank, now) for a in analyses],
+        )
+
+    def replace_scores(self, analyses: Iterable[PlayerAttractiveAnalysis], model: str = DEFAULT_MODEL):
+        """Replace every score for model in one transaction, e.g. after a full league re-rank"""
+        analyses = list(analyses)
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM scores WHERE model = ?", (model,))
+            self._upsert_scores(analyses, model)
+
+    def upsert_player_stats(self, players: Iterable[SimpleSpecificPlayerData], season: int):
+        """Bulk upsert landing-page bio fields and one season's totals"""
+        players = list(players)
+        now = time.time()
+        bio_rows = []
+        stats_rows = []
+        for p in players:
+            bio_rows.append((
+                p.playerId, p.player.firstName.default, p.player.lastName.default, p.player.headshot,
+                p.currentTeamAbbrev, p.position, p.birthCountry, p.birthDate, p.shootsCatches,
+                int(p.isActive), now,
+            ))
+            if p.thisSeasonTotals is not None:
+                t = p.thisSeasonTotals
+                stats_rows.append((
+                    p.playerId, season, t.goals, t.assists, t.points, t.pim, t.plusMinus,
+                    t.gamesPlayed, t.avgToi, now,
+                ))
+
+        with self._lock, self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO players (id, first_name, last_name, headshot, team, position,
+                                     birth_country, birth_date, shoots_catches, is_active, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    team = excluded.team,
+                    position = excluded.position,
+                    birth_country = excluded.birth_country,
+                    birth_date = excluded.birth_date,
+                    shoots_catches = excluded.shoots_catches,
+                    is_active = excluded.is_active,
+                    updated_at = excluded.updated_at
+                """,
+                bio_rows,
+            )
+            self.conn.executemany(
+                """
+                INSERT INTO season_stats (player_id, season, goals, assists, points, pim,
+                                          plus_minus, games_played, avg_toi, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(player_id, season) DO UPDATE SET
+                    goals = excluded.goals,
+                    assists = excluded.assists,
+                    points = excluded.points,
+                    pim = excluded.pim,
+                    plus_minus = excluded.plus_minus,
+                    games_played = excluded.games_played,
+                    avg_toi = excluded.avg_toi,
+                    updated_at = excluded.updated_at
+                """,
+                stats_rows,
+            )
+
+    def mark_season(self, season: int, complete: bool):
+        with self._lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO seasons (season, complete, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(season) DO UPDATE SET
+                    complete = excluded.complete,
+                    updated_at = excluded.updated_at
+                """,
+                (season, int(complete), time.time()),
+            )
+
+    def delete_scores(self, player_ids: Iterable[int], model: str = DEFAULT_MODEL):
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "DELETE FROM scores WHERE player_id = ? AND model = ?",
+                [(player_id, model) for player_id in player_ids],
+            )
+
+    def save_roster_snapshot(self, entries: Iterable[RosterEntry]):
+        """Replace the stored roster snapshot with entries"""
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM roster_snapshot")
+            self.conn.executemany(
+                """
+                INSERT INTO roster_snapshot (player_id, team, headshot, first_name, last_name, captured_at, source)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [(e.id, e.team, e.headshot, e.firstName, e.lastName, now, e.source) for e in entries],
+            )
+
+    def upsert_season_roster(self, season: int, entries: Iterable[RosterEntry]):
+        """Bulk upsert one season's roster membership (keeps any score already computed)"""
+        entries = list(entries)
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO players (id, first_name, last_name, headshot, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO NOTHING
+                """,
+                [(e.id, e.firstName, e.lastName, e.headshot, now) for e in entries],
+            )
+            self.conn.executemany(
+                """
+                INSERT INTO season_rosters (season, player_id, team, headshot)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(season, player_id) DO UPDATE SET
+                    team = excluded.team,
+                    score = CASE WHEN season_rosters.headshot = excluded.headshot
+                                 THEN season_rosters.score END,
+                    headshot = excluded.headshot
+                """,
+                [(season, e.id, e.team, e.headshot) for e in entries],
+            )
+
+    def upsert_bulk_season(self, season: int, players: dict[int, BulkPlayerSeason]):
+        """
+        Bulk upsert bio fields and season totals from NhleGithub.get_bulk_season_stats.
+        Only players already in the store are touched (bulk rows carry no names).
+        """
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                """
+                UPDATE players SET
+                    position = COALESCE(position, ?),
+                    birth_country = COALESCE(birth_country, ?),
+                    birth_date = COALESCE(birth_date, ?),
+                    shoots_catches = COALESCE(shoots_catches, ?)
+                WHERE id = ?
+                """,
+                [
+                    (b.position, b.birthCountry, b.birthDate, b.shootsCatches, player_id)
+                    for player_id, b in players.items()
+                ],
+            )
+            self.conn.executemany(
+                """
+                INSERT INTO season_stats (player_id, season, goals, assists, points, pim,
+                                          plus_minus, games_played, avg_toi, updated_at)
+                SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+                WHERE EXISTS (SELECT 1 FROM players WHERE id = ?)
+                ON CONFLICT(player_id, season) DO UPDATE SET
+                    goals = excluded.goals,
+                    assists = excluded.assists,
+                    points = excluded.points,
+                    pim = excluded.pim,
+                    plus_minus = excluded.plus_minus,
+                    games_played = excluded.games_played,
+                    avg_toi = excluded.avg_toi,
+                    updated_at = excluded.updated_at
+                """,
+                [
+                    (player_id, season, b.seasonStats.goals, b.seasonStats.assists, b.seasonStats.points,
+                     b.seasonStats.pim, b.seasonStats.plusMinus, b.seasonStats.gamesPlayed,
+                     b.seasonStats.avgToi, now, player_id)
+                    for player_id, b in players.items()
+                ],
+            )
+
+    def set_season_scores(self, season: int, scores: dict[int, float]):
+        """Record attractiveness scores for the headshots in one season's rosters"""
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "UPDATE season_rosters SET score = ? WHERE season = ? AND player_id = ?",
+                [(score, season, player_id) for player_id, score in scores.items()],
+            )
+
+    def append_game_logs(self, season: int, games: Iterable[tuple[int, GameLog]]) -> List[tuple[int, GameLog]]:
+        """
+        Insert (player_id, GameLog) pairs, skipping games already stored.
+
+        Returns:
+            The (player_id, GameLog) pairs actually added
+        """
+        added = []
+        with self._lock, self.conn:
+            for player_id, g in games:
+                cursor = self.conn.execute(
+                    """
+                    INSERT INTO game_logs (player_id, game_id, season, game_type, game_date, team, opponent,
+                                           home_road, goals, assists, points, pim, plus_minus, shots, toi)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(player_id, game_id) DO NOTHING
+                    """,
+                    (player_id, g.gameId, season, g.gameTypeId, g.gameDate, g.teamAbbrev, g.opponentAbbrev,
+                     g.homeRoadFlag, g.goals, g.assists, g.points, g.pim, g.plusMinus, g.shots, g.toi),
+                )
+                if cursor.rowcount == 1:
+                    added.append((player_id, g))
+        return added
+
+    def save_rolling_correlation(self, season: int, window: int, state: dict, last_rowid: int):
+        """Store RollingWindowCorrelation.state() covering game_logs rows up to last_rowid"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO rolling_correlations (season, window_size, state, last_rowid, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(season, window_size) DO UPDATE SET
+                    state = excluded.state,
+                    last_rowid = excluded.last_rowid,
+                    updated_at = excluded.updated_at
+                """,
+                (season, window, json.dumps(state), last_rowid, time.time()),
+            )
+
+    # ---- reads ----
+
+    def _query(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def completed_seasons(self) -> set[int]:
+        return {row["season"] for row in self._query("SELECT season FROM seasons WHERE complete = 1")}
+
+    def load_roster_snapshot(self) -> dict[int, RosterEntry]:
+        """Last saved league roster, keyed by player id (empty before the first sync)"""
+        return {
+            row["player_id"]: RosterEntry(
+                id=row["player_id"],
+                team=row["team"],
+                headshot=row["headshot"],
+                firstName=row["first_name"],
+                lastName=row["last_name"],
+                source=row["source"],
+            )
+            for row in self._query("SELECT * FROM roster_snapshot")
+        }
+
+    def latest_game_dates(self, season: int) -> dict[int, str]:
+        """Date of each player's most recent stored game in a season"""
+        rows = self._query(
+            "SELECT player_id, MAX(game_date) AS last_date FROM game_logs WHERE season = ? GROUP BY player_id",
+            (season,),
+        )
+        return {row["player_id"]: row["last_date"] for row in rows}
+
+    def load_rolling_correlation(self, season: int, window: int) -> Optional[tuple[dict, int]]:
+        """(state, last_rowid) saved by save_rolling_correlation, or None"""
+        rows = self._query(
+            "SELECT state, last_rowid FROM rolling_correlations WHERE season = ? AND window_size = ?",
+            (season, window),
+        )
+        return (json.loads(rows[0]["state"]), rows[0]["last_rowid"]) if rows else None
+
+    def max_game_log_rowid(self) -> int:
+        return self._query("SELECT COALESCE(MAX(rowid), 0) AS last_rowid FROM game_logs")[0]["last_rowid"]
+
+    def load_game_logs_after(self, season: int, rowid: int) -> tuple[List[tuple[int, GameLog]], int]:
+        """
+        Games stored after rowid (rowids only grow: game_logs is append-only).
+
+        Returns:
+            ((player_id, GameLog) pairs oldest game first, highest rowid seen)
+        """
+        rows = self._query(
+            """
+            SELECT rowid AS row_id, * FROM game_logs
+            WHERE rowid > ? AND season = ?
+            ORDER BY game_date, game_id
+            """,
+            (rowid, season),
+        )
+        last_rowid = max([rowid] + [row["row_id"] for row in rows])
+        return [(row["player_id"], _game_log(row)) for row in rows], last_rowid
+
+    def load_recent_game_logs(self, season: int, last_n: int) -> dict[int, List[GameLog]]:
+        """Each player's last_n stored games in a season, oldest first"""
+        rows = self._query(
+            """
+            SELECT * FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY player_id ORDER BY game_date DESC, game_id DESC
+                ) AS recency
+                FROM game_logs WHERE season = ?
+            )
+            WHERE recency <= ?
+            ORDER BY player_id, game_date, game_id
+            """,
+            (season, last_n),
+        )
+        games: dict[int, List[GameLog]] = {}
+        for row in rows:
+            games.setdefault(row["player_id"], []).append(_game_log(row))
+        return games
+
+    def load_attractiveness_analyses(self, model: str = DEFAULT_MODEL) -> List[PlayerAttractiveAnalysis]:
+        """All scored players for model, in rank order"""
+        rows = self._query(
+            """
+            SELECT p.id, p.first_name, p.last_name, p.headshot, s.score, s.rank
+            FROM scores s JOIN players p ON p.id = s.player_id
+            WHERE s.model = ?
+            ORDER BY s.rank
+            """,
+            (model,),
+        )
+        return [
+            PlayerAttractiveAnalysis(
+                rank=row["rank"],
+                player=_simple_player(row),
+                ridgeAttractivenessScore=row["score"],
+            )
+            for row in rows
+        ]
+
+    def load_players_with_stats(
+        self,
+        season: int,
+        model: str = DEFAULT_MODEL,
+        team: Optional[str] = None,
+        country: Optional[str] = None,
+        position: Optional[str] = None,
+    ) -> List[SimpleSpecificPlayerData]:
+        """
+        Scored players whose landing-page data has been collected, in rank order.
+
+        Args:
+            season: Season whose totals fill thisSeasonTotals (e.g. 20252026)
+            model: Score model name
+            team, country, position: Optional filters (indexed)
+
+        Returns:
+            List[SimpleSpecificPlayerData]
+        """
+        sql = """
+            SELECT p.*, s.score, s.rank,
+                   st.goals, st.assists, st.points, st.pim, st.plus_minus, st.games_played, st.avg_toi,
+                   st.player_id AS stats_player_id
+            FROM scores s
+            JOIN players p ON p.id = s.player_id
+            LEFT JOIN season_stats st ON st.player_id = p.id AND st.season = ?
+            WHERE s.model = ? AND p.position IS NOT NULL
+        """
+        params: list = [season, model]
+        for column, value in (("p.team", team), ("p.birth_country", country), ("p.position", position)):
+            if value is not None:
+                sql += f" AND {column} = ?"
+                params.append(value)
+        sql += " ORDER BY s.rank"
+
+        players = []
+        for row in self._query(sql, tuple(params)):
+            season_totals = None
+            if row["stats_player_id"] is not None:
+                season_totals = SeasonStats(
+                    goals=row["goals"],
+                    assists=row["assists"],
+                    points=row["points"],
+                    pim=row["pim"],
+                    plusMinus=row["plus_minus"],
+                    gamesPlayed=row["games_played"],
+                    avgToi=row["avg_toi"],
+                )
+            players.append(SimpleSpecificPlayerData(
+                rank=row["rank"],
+                player=_simple_player(row),
+                ridgeAttractivenessScore=row["score"],
+                playerId=row["id"],
+                isActive=bool(row["is_active"]),
+                currentTeamAbbrev=row["team"],
+                position=row["position"],
+                birthCountry=row["birth_country"],
+                shootsCatches=row["shoots_catches"],
+                birthDate=row["birth_date"],
+                thisSeasonTotals=season_totals,
+            ))
+        return players
+
+    def load_season_roster(self, season: int, unscored_only: bool = False) -> List[RosterEntry]:
+        sql = """
+            SELECT r.*, p.first_name, p.last_name
+            FROM season_rosters r JOIN players p ON p.id = r.player_id
+            WHERE r.season = ?
+        """
+        if unscored_only:
+            sql += " AND r.score IS NULL"
+        return [
+            RosterEntry(
+                id=row["player_id"],
+                team=row["team"],
+                headshot=row["headshot"],
+                firstName=row["first_name"],
+                lastName=row["last_name"],
+            )
+            for row in self._query(sql, (season,))
+        ]
+
+    def load_historical_players(self, seasons: Optional[Iterable[int]] = None) -> list[dict]:
+        """
+        Historical player table: one row per player-season with team, headshot score
+        and season totals, ordered by season then score.
+
+        Args:
+            seasons: Restrict to these seasons (default: all stored seasons)
+        """
+        sql = """
+            SELECT r.season, r.player_id, p.first_name, p.last_name, r.team, r.headshot, r.score,
+                   p.position, p.birth_country,
+                   st.goals, st.assists, st.points, st.pim, st.plus_minus, st.games_played, st.avg_toi
+            FROM season_rosters r
+            JOIN players p ON p.id = r.player_id
+            LEFT JOIN season_stats st ON st.player_id = r.player_id AND st.season = r.season
+        """
+        params: tuple = ()
+        if seasons is not None:
+            seasons = list(seasons)
+            sql += f" WHERE r.season IN ({', '.join('?' for _ in seasons)})"
+            params = tuple(seasons)
+        sql += " ORDER BY r.season, r.score DESC"
+        return [dict(row) for row in self._query(sql, params)]
+
+    # ---- legacy JSON ----
+
+    def import_legacy_json(self):
+        """Seed the store from players/attractiveness_analysis.json and attractive_players_with_stats.json"""
+        if LEGACY_ANALYSIS_FILE.exists():
+            with open(LEGACY_ANALYSIS_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            analyses = []
+            for player_dict in data:
+                player = dict(player_dict["player"])
+                player["firstName"] = {"default": player["firstName"]}
+                player["lastName"] = {"default": player["lastName"]}
+                analyses.append(PlayerAttractiveAnalysis(**{**player_dict, "player": player}))
+            self.upsert_scores(analyses)
+            print(f"Imported {len(analyses)} scores from {LEGACY_ANALYSIS_FILE}")
+
+        if LEGACY_STATS_FILE.exists():
+            with open(LEGACY_STATS_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            players = [SimpleSpecificPlayerData(**player_dict) for player_dict in data]
+            self.upsert_player_stats(players, LEGACY_SEASON)
+            print(f"Imported {len(players)} players with stats from {LEGACY_STATS_FILE}")
+
+    def export_legacy_json(self, season: int = LEGACY_SEASON, model: str = DEFAULT_MODEL):
+        """Regenerate the JSON files under players/ (used by the blog) from the store"""
+        analyses = self.load_attractiveness_analyses(model)
+        output_data = [
+            {
+                "rank": a.rank,
+                "player": {
+                    "id": a.player.id,
+                    "headshot": a.player.headshot,
+                    "firstName": a.player.firstName.default,
+                    "lastName": a.player.lastName.default,
+                },
+                "ridgeAttractivenessScore": a.ridgeAttractivenessScore,
+            }
+            for a in analyses
+        ]
+        with open(LEGACY_ANALYSIS_FILE, "w", encoding="utf-8") as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+        players = self.load_players_with_stats(season, model)
+        with open(LEGACY_STATS_FILE, "w", encoding="utf-8") as f:
+            json.dump([p.model_dump(exclude_none=True) for p in players], f, indent=2, ensure_ascii=False)
+
+        print(f"Exported {len(analyses)} scores to {LEGACY_ANALYSIS_FILE}")
+        print(f"Exported {len(players)} players with stats to {LEGACY_STATS_FILE}")
+
+
+def _simple_player(row: sqlite3.Row) -> SimplePlayer:
+    return SimplePlayer(
+        id=row["id"],
+        headshot=row["headshot"] or "",
+        firstName=Name(default=row["first_name"]),
+        lastName=Name(default=row["last_name"]),
+    )
+
+
+def _game_log(row: sqlite3.Row) -> GameLog:
+    return GameLog(
+        gameId=row["game_id"],
+        gameTypeId=row["game_type"],
+        gameDate=row["game_date"],
+        teamAbbrev=row["team"],
+        opponentAbbrev=row["opponent"],
+        homeRoadFlag=row["home_road"],
+        goals=row["goals"],
+        assists=row["assists"],
+        points=row["points"],
+        pim=row["pim"],
+        plusMinus=row["plus_minus"],
+        shots=row["shots"],
+        toi=row["toi"],
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the SQLite player store")
+    parser.add_argument("--import-json", action="store_true", help="(re)import the legacy JSON files")
+    parser.add_argument("--export-json", action="store_true", help="regenerate the legacy JSON files")
+    args = parser.parse_args()
+
+    with PlayerStore() as store:
+        if args.import_json:
+            store.import_legacy_json()
+        if args.export_json:
+            store.export_legacy_json()
+        print(f"Scored players: {len(store.load_attractiveness_analyses())}")
+        print(f"Players with {LEGACY_SEASON} stats: {len(store.load_players_with_stats(LEGACY_SEASON))}")
+
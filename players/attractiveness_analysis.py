@@ -1,8062 +0,0 @@
-attractive_players_data =[
-  {
-    "rank": 1,
-    "player": {
-      "id": 8478407,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8478407.png",
-      "firstName": "Vince",
-      "lastName": "Dunn"
-    },
-    "ridgeAttractivenessScore": 3.980285406112671
-  },
-  {
-    "rank": 2,
-    "player": {
-      "id": 8483553,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8483553.png",
-      "firstName": "Marc",
-      "lastName": "Gatcomb"
-    },
-    "ridgeAttractivenessScore": 3.975883722305298
-  },
-  {
-    "rank": 3,
-    "player": {
-      "id": 8471724,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8471724.png",
-      "firstName": "Kris",
-      "lastName": "Letang"
-    },
-    "ridgeAttractivenessScore": 3.8707778453826904
-  },
-  {
-    "rank": 4,
-    "player": {
-      "id": 8475809,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8475809.png",
-      "firstName": "Scott",
-      "lastName": "Wedgewood"
-    },
-    "ridgeAttractivenessScore": 3.8661715984344482
-  },
-  {
-    "rank": 5,
-    "player": {
-      "id": 8477407,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8477407.png",
-      "firstName": "Anthony",
-      "lastName": "Duclair"
-    },
-    "ridgeAttractivenessScore": 3.8647165298461914
-  },
-  {
-    "rank": 6,
-    "player": {
-      "id": 8477450,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8477450.png",
-      "firstName": "Jason",
-      "lastName": "Dickinson"
-    },
-    "ridgeAttractivenessScore": 3.8299102783203125
-  },
-  {
-    "rank": 7,
-    "player": {
-      "id": 8480280,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8480280.png",
-      "firstName": "Jeremy",
-      "lastName": "Swayman"
-    },
-    "ridgeAttractivenessScore": 3.821573257446289
-  },
-  {
-    "rank": 8,
-    "player": {
-      "id": 8475179,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8475179.png",
-      "firstName": "Dmitry",
-      "lastName": "Kulikov"
-    },
-    "ridgeAttractivenessScore": 3.7927818298339844
-  },
-  {
-    "rank": 9,
-    "player": {
-      "id": 8479525,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8479525.png",
-      "firstName": "Ross",
-      "lastName": "Colton"
-    },
-    "ridgeAttractivenessScore": 3.788224220275879
-  },
-  {
-    "rank": 10,
-    "player": {
-      "id": 8476455,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8476455.png",
-      "firstName": "Gabriel",
-      "lastName": "Landeskog"
-    },
-    "ridgeAttractivenessScore": 3.7773869037628174
-  },
-  {
-    "rank": 11,
-    "player": {
-      "id": 8476869,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8476869.png",
-      "firstName": "Brady",
-      "lastName": "Skjei"
-    },
-    "ridgeAttractivenessScore": 3.7597899436950684
-  },
-  {
-    "rank": 12,
-    "player": {
-      "id": 8480185,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8480185.png",
-      "firstName": "Eetu",
-      "lastName": "Luostarinen"
-    },
-    "ridgeAttractivenessScore": 3.7545483112335205
-  },
-  {
-    "rank": 13,
-    "player": {
-      "id": 8477495,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8477495.png",
-      "firstName": "Seth",
-      "lastName": "Jones"
-    },
-    "ridgeAttractivenessScore": 3.7491281032562256
-  },
-  {
-    "rank": 14,
-    "player": {
-      "id": 8480021,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8480021.png",
-      "firstName": "Jack",
-      "lastName": "Studnicka"
-    },
-    "ridgeAttractivenessScore": 3.7234761714935303
-  },
-  {
-    "rank": 15,
-    "player": {
-      "id": 8477970,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8477970.png",
-      "firstName": "Vitek",
-      "lastName": "Vanecek"
-    },
-    "ridgeAttractivenessScore": 3.7064085006713867
-  },
-  {
-    "rank": 16,
-    "player": {
-      "id": 8482146,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8482146.png",
-      "firstName": "Luke",
-      "lastName": "Evangelista"
-    },
-    "ridgeAttractivenessScore": 3.7054667472839355
-  },
-  {
-    "rank": 17,
-    "player": {
-      "id": 8482713,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8482713.png",
-      "firstName": "Mackie",
-      "lastName": "Samoskevich"
-    },
-    "ridgeAttractivenessScore": 3.701110363006592
-  },
-  {
-    "rank": 18,
-    "player": {
-      "id": 8475794,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8475794.png",
-      "firstName": "Tyler",
-      "lastName": "Seguin"
-    },
-    "ridgeAttractivenessScore": 3.686535358428955
-  },
-  {
-    "rank": 19,
-    "player": {
-      "id": 8480208,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8480208.png",
-      "firstName": "Drake",
-      "lastName": "Batherson"
-    },
-    "ridgeAttractivenessScore": 3.6838293075561523
-  },
-  {
-    "rank": 20,
-    "player": {
-      "id": 8475279,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8475279.png",
-      "firstName": "Ben",
-      "lastName": "Chiarot"
-    },
-    "ridgeAttractivenessScore": 3.681917667388916
-  },
-  {
-    "rank": 21,
-    "player": {
-      "id": 8479193,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8479193.png",
-      "firstName": "Casey",
-      "lastName": "DeSmith"
-    },
-    "ridgeAttractivenessScore": 3.678607225418091
-  },
-  {
-    "rank": 22,
-    "player": {
-      "id": 8483752,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8483752.png",
-      "firstName": "Dominic",
-      "lastName": "James"
-    },
-    "ridgeAttractivenessScore": 3.667935848236084
-  },
-  {
-    "rank": 23,
-    "player": {
-      "id": 8473986,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8473986.png",
-      "firstName": "Alex",
-      "lastName": "Killorn"
-    },
-    "ridgeAttractivenessScore": 3.6668648719787598
-  },
-  {
-    "rank": 24,
-    "player": {
-      "id": 8476434,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8476434.png",
-      "firstName": "John",
-      "lastName": "Gibson"
-    },
-    "ridgeAttractivenessScore": 3.6611216068267822
-  },
-  {
-    "rank": 25,
-    "player": {
-      "id": 8478469,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8478469.png",
-      "firstName": "Thomas",
-      "lastName": "Chabot"
-    },
-    "ridgeAttractivenessScore": 3.658235549926758
-  },
-  {
-    "rank": 26,
-    "player": {
-      "id": 8481035,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8481035.png",
-      "firstName": "Samuel",
-      "lastName": "Ersson"
-    },
-    "ridgeAttractivenessScore": 3.646810531616211
-  },
-  {
-    "rank": 27,
-    "player": {
-      "id": 8477446,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8477446.png",
-      "firstName": "Michael",
-      "lastName": "McCarron"
-    },
-    "ridgeAttractivenessScore": 3.6402909755706787
-  },
-  {
-    "rank": 28,
-    "player": {
-      "id": 8479671,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8479671.png",
-      "firstName": "Mathieu",
-      "lastName": "Olivier"
-    },
-    "ridgeAttractivenessScore": 3.6390256881713867
-  },
-  {
-    "rank": 29,
-    "player": {
-      "id": 8475181,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8475181.png",
-      "firstName": "Nick",
-      "lastName": "Leddy"
-    },
-    "ridgeAttractivenessScore": 3.630244016647339
-  },
-  {
-    "rank": 30,
-    "player": {
-      "id": 8475343,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8475343.png",
-      "firstName": "Nic",
-      "lastName": "Dowd"
-    },
-    "ridgeAttractivenessScore": 3.6296374797821045
-  },
-  {
-    "rank": 31,
-    "player": {
-      "id": 8475169,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8475169.png",
-      "firstName": "Evander",
-      "lastName": "Kane"
-    },
-    "ridgeAttractivenessScore": 3.6242432594299316
-  },
-  {
-    "rank": 32,
-    "player": {
-      "id": 8477955,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8477955.png",
-      "firstName": "Jared",
-      "lastName": "McCann"
-    },
-    "ridgeAttractivenessScore": 3.6199135780334473
-  },
-  {
-    "rank": 33,
-    "player": {
-      "id": 8479345,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8479345.png",
-      "firstName": "Jakob",
-      "lastName": "Chychrun"
-    },
-    "ridgeAttractivenessScore": 3.6185102462768555
-  },
-  {
-    "rank": 34,
-    "player": {
-      "id": 8476525,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8476525.png",
-      "firstName": "Colin",
-      "lastName": "Miller"
-    },
-    "ridgeAttractivenessScore": 3.617767810821533
-  },
-  {
-    "rank": 35,
-    "player": {
-      "id": 8477505,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8477505.png",
-      "firstName": "Alexander",
-      "lastName": "Wennberg"
-    },
-    "ridgeAttractivenessScore": 3.6123976707458496
-  },
-  {
-    "rank": 36,
-    "player": {
-      "id": 8484142,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8484142.png",
-      "firstName": "Denver",
-      "lastName": "Barkey"
-    },
-    "ridgeAttractivenessScore": 3.609682083129883
-  },
-  {
-    "rank": 37,
-    "player": {
-      "id": 8481056,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8481056.png",
-      "firstName": "Spencer",
-      "lastName": "Stastney"
-    },
-    "ridgeAttractivenessScore": 3.609318494796753
-  },
-  {
-    "rank": 38,
-    "player": {
-      "id": 8482090,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8482090.png",
-      "firstName": "Jack",
-      "lastName": "Finley"
-    },
-    "ridgeAttractivenessScore": 3.6092607975006104
-  },
-  {
-    "rank": 39,
-    "player": {
-      "id": 8482475,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8482475.png",
-      "firstName": "Egor",
-      "lastName": "Chinakhov"
-    },
-    "ridgeAttractivenessScore": 3.6039676666259766
-  },
-  {
-    "rank": 40,
-    "player": {
-      "id": 8475660,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8475660.png",
-      "firstName": "Cam",
-      "lastName": "Talbot"
-    },
-    "ridgeAttractivenessScore": 3.599914073944092
-  },
-  {
-    "rank": 41,
-    "player": {
-      "id": 8483570,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8483570.png",
-      "firstName": "Ben",
-      "lastName": "Meyers"
-    },
-    "ridgeAttractivenessScore": 3.5972630977630615
-  },
-  {
-    "rank": 42,
-    "player": {
-      "id": 8478211,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8478211.png",
-      "firstName": "Dryden",
-      "lastName": "Hunt"
-    },
-    "ridgeAttractivenessScore": 3.5951693058013916
-  },
-  {
-    "rank": 43,
-    "player": {
-      "id": 8483395,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8483395.png",
-      "firstName": "Arshdeep",
-      "lastName": "Bains"
-    },
-    "ridgeAttractivenessScore": 3.595028877258301
-  },
-  {
-    "rank": 44,
-    "player": {
-      "id": 8482859,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8482859.png",
-      "firstName": "Zack",
-      "lastName": "Ostapchuk"
-    },
-    "ridgeAttractivenessScore": 3.593311309814453
-  },
-  {
-    "rank": 45,
-    "player": {
-      "id": 8477015,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8477015.png",
-      "firstName": "Connor",
-      "lastName": "Brown"
-    },
-    "ridgeAttractivenessScore": 3.584359645843506
-  },
-  {
-    "rank": 46,
-    "player": {
-      "id": 8475170,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8475170.png",
-      "firstName": "Brayden",
-      "lastName": "Schenn"
-    },
-    "ridgeAttractivenessScore": 3.5768332481384277
-  },
-  {
-    "rank": 47,
-    "player": {
-      "id": 8476448,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8476448.png",
-      "firstName": "William",
-      "lastName": "Karlsson"
-    },
-    "ridgeAttractivenessScore": 3.5719213485717773
-  },
-  {
-    "rank": 48,
-    "player": {
-      "id": 8479980,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8479980.png",
-      "firstName": "Nicolas",
-      "lastName": "Hague"
-    },
-    "ridgeAttractivenessScore": 3.5576071739196777
-  },
-  {
-    "rank": 49,
-    "player": {
-      "id": 8475311,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8475311.png",
-      "firstName": "Darcy",
-      "lastName": "Kuemper"
-    },
-    "ridgeAttractivenessScore": 3.555725574493408
-  },
-  {
-    "rank": 50,
-    "player": {
-      "id": 8483500,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8483500.png",
-      "firstName": "Noah",
-      "lastName": "Ostlund"
-    },
-    "ridgeAttractivenessScore": 3.555612087249756
-  },
-  {
-    "rank": 51,
-    "player": {
-      "id": 8474600,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8474600.png",
-      "firstName": "Roman",
-      "lastName": "Josi"
-    },
-    "ridgeAttractivenessScore": 3.553748369216919
-  },
-  {
-    "rank": 52,
-    "player": {
-      "id": 8478401,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8478401.png",
-      "firstName": "Pavel",
-      "lastName": "Zacha"
-    },
-    "ridgeAttractivenessScore": 3.553614854812622
-  },
-  {
-    "rank": 53,
-    "player": {
-      "id": 8475852,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8475852.png",
-      "firstName": "Petr",
-      "lastName": "Mrazek"
-    },
-    "ridgeAttractivenessScore": 3.5493087768554688
-  },
-  {
-    "rank": 54,
-    "player": {
-      "id": 8475171,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8475171.png",
-      "firstName": "Oliver",
-      "lastName": "Ekman-Larsson"
-    },
-    "ridgeAttractivenessScore": 3.5465872287750244
-  },
-  {
-    "rank": 55,
-    "player": {
-      "id": 8481721,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8481721.png",
-      "firstName": "Arseny",
-      "lastName": "Gritsyuk"
-    },
-    "ridgeAttractivenessScore": 3.544955253601074
-  },
-  {
-    "rank": 56,
-    "player": {
-      "id": 8483609,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8483609.png",
-      "firstName": "Adam",
-      "lastName": "Klapka"
-    },
-    "ridgeAttractivenessScore": 3.543790578842163
-  },
-  {
-    "rank": 57,
-    "player": {
-      "id": 8478010,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8478010.png",
-      "firstName": "Brayden",
-      "lastName": "Point"
-    },
-    "ridgeAttractivenessScore": 3.5385799407958984
-  },
-  {
-    "rank": 58,
-    "player": {
-      "id": 8482447,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8482447.png",
-      "firstName": "Leevi",
-      "lastName": "Meriläinen"
-    },
-    "ridgeAttractivenessScore": 3.536921501159668
-  },
-  {
-    "rank": 59,
-    "player": {
-      "id": 8480018,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8480018.png",
-      "firstName": "Nick",
-      "lastName": "Suzuki"
-    },
-    "ridgeAttractivenessScore": 3.5254690647125244
-  },
-  {
-    "rank": 60,
-    "player": {
-      "id": 8478416,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8478416.png",
-      "firstName": "Erik",
-      "lastName": "Cernak"
-    },
-    "ridgeAttractivenessScore": 3.519862174987793
-  },
-  {
-    "rank": 61,
-    "player": {
-      "id": 8475745,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8475745.png",
-      "firstName": "Charlie",
-      "lastName": "Coyle"
-    },
-    "ridgeAttractivenessScore": 3.515944004058838
-  },
-  {
-    "rank": 62,
-    "player": {
-      "id": 8476412,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8476412.png",
-      "firstName": "Jordan",
-      "lastName": "Binnington"
-    },
-    "ridgeAttractivenessScore": 3.5138773918151855
-  },
-  {
-    "rank": 63,
-    "player": {
-      "id": 8479661,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8479661.png",
-      "firstName": "Tanner",
-      "lastName": "Jeannot"
-    },
-    "ridgeAttractivenessScore": 3.5072240829467773
-  },
-  {
-    "rank": 64,
-    "player": {
-      "id": 8479400,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8479400.png",
-      "firstName": "Pierre-Luc",
-      "lastName": "Dubois"
-    },
-    "ridgeAttractivenessScore": 3.5059120655059814
-  },
-  {
-    "rank": 65,
-    "player": {
-      "id": 8479496,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8479496.png",
-      "firstName": "David",
-      "lastName": "Rittich"
-    },
-    "ridgeAttractivenessScore": 3.5014564990997314
-  },
-  {
-    "rank": 66,
-    "player": {
-      "id": 8480459,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8480459.png",
-      "firstName": "Pius",
-      "lastName": "Suter"
-    },
-    "ridgeAttractivenessScore": 3.496112585067749
-  },
-  {
-    "rank": 67,
-    "player": {
-      "id": 8474593,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8474593.png",
-      "firstName": "Jacob",
-      "lastName": "Markstrom"
-    },
-    "ridgeAttractivenessScore": 3.492297887802124
-  },
-  {
-    "rank": 68,
-    "player": {
-      "id": 8476905,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8476905.png",
-      "firstName": "Chandler",
-      "lastName": "Stephenson"
-    },
-    "ridgeAttractivenessScore": 3.491400718688965
-  },
-  {
-    "rank": 69,
-    "player": {
-      "id": 8481028,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8481028.png",
-      "firstName": "Martin",
-      "lastName": "Pospisil"
-    },
-    "ridgeAttractivenessScore": 3.488659381866455
-  },
-  {
-    "rank": 70,
-    "player": {
-      "id": 8478043,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8478043.png",
-      "firstName": "Sam",
-      "lastName": "Lafferty"
-    },
-    "ridgeAttractivenessScore": 3.48687744140625
-  },
-  {
-    "rank": 71,
-    "player": {
-      "id": 8483808,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8483808.png",
-      "firstName": "Andrei",
-      "lastName": "Kuzmenko"
-    },
-    "ridgeAttractivenessScore": 3.4834024906158447
-  },
-  {
-    "rank": 72,
-    "player": {
-      "id": 8476374,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8476374.png",
-      "firstName": "Sean",
-      "lastName": "Kuraly"
-    },
-    "ridgeAttractivenessScore": 3.4830737113952637
-  },
-  {
-    "rank": 73,
-    "player": {
-      "id": 8476931,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8476931.png",
-      "firstName": "Jake",
-      "lastName": "McCabe"
-    },
-    "ridgeAttractivenessScore": 3.4768593311309814
-  },
-  {
-    "rank": 74,
-    "player": {
-      "id": 8478449,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8478449.png",
-      "firstName": "Roope",
-      "lastName": "Hintz"
-    },
-    "ridgeAttractivenessScore": 3.4756717681884766
-  },
-  {
-    "rank": 75,
-    "player": {
-      "id": 8476967,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8476967.png",
-      "firstName": "Brett",
-      "lastName": "Kulak"
-    },
-    "ridgeAttractivenessScore": 3.4746928215026855
-  },
-  {
-    "rank": 76,
-    "player": {
-      "id": 8478013,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8478013.png",
-      "firstName": "Jake",
-      "lastName": "Walman"
-    },
-    "ridgeAttractivenessScore": 3.4737401008605957
-  },
-  {
-    "rank": 77,
-    "player": {
-      "id": 8480058,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8480058.png",
-      "firstName": "P.O",
-      "lastName": "Joseph"
-    },
-    "ridgeAttractivenessScore": 3.4724178314208984
-  },
-  {
-    "rank": 78,
-    "player": {
-      "id": 8483760,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8483760.png",
-      "firstName": "Hunter",
-      "lastName": "McDonald"
-    },
-    "ridgeAttractivenessScore": 3.469672203063965
-  },
-  {
-    "rank": 79,
-    "player": {
-      "id": 8480806,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8480806.png",
-      "firstName": "Isac",
-      "lastName": "Lundeström"
-    },
-    "ridgeAttractivenessScore": 3.468522071838379
-  },
-  {
-    "rank": 80,
-    "player": {
-      "id": 8477484,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8477484.png",
-      "firstName": "Spencer",
-      "lastName": "Martin"
-    },
-    "ridgeAttractivenessScore": 3.4674618244171143
-  },
-  {
-    "rank": 81,
-    "player": {
-      "id": 8475784,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8475784.png",
-      "firstName": "Jeff",
-      "lastName": "Skinner"
-    },
-    "ridgeAttractivenessScore": 3.467149257659912
-  },
-  {
-    "rank": 82,
-    "player": {
-      "id": 8484164,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8484164.png",
-      "firstName": "Dalibor",
-      "lastName": "Dvorsky"
-    },
-    "ridgeAttractivenessScore": 3.464587688446045
-  },
-  {
-    "rank": 83,
-    "player": {
-      "id": 8483499,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8483499.png",
-      "firstName": "Liam",
-      "lastName": "Ohgren"
-    },
-    "ridgeAttractivenessScore": 3.461881160736084
-  },
-  {
-    "rank": 84,
-    "player": {
-      "id": 8483452,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8483452.png",
-      "firstName": "Hunter",
-      "lastName": "Haight"
-    },
-    "ridgeAttractivenessScore": 3.4603490829467773
-  },
-  {
-    "rank": 85,
-    "player": {
-      "id": 8480830,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8480830.png",
-      "firstName": "Andrei",
-      "lastName": "Svechnikov"
-    },
-    "ridgeAttractivenessScore": 3.458949089050293
-  },
-  {
-    "rank": 86,
-    "player": {
-      "id": 8482192,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8482192.png",
-      "firstName": "Isaak",
-      "lastName": "Phillips"
-    },
-    "ridgeAttractivenessScore": 3.4550552368164062
-  },
-  {
-    "rank": 87,
-    "player": {
-      "id": 8483445,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8483445.png",
-      "firstName": "Cutter",
-      "lastName": "Gauthier"
-    },
-    "ridgeAttractivenessScore": 3.4546291828155518
-  },
-  {
-    "rank": 88,
-    "player": {
-      "id": 8480801,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8480801.png",
-      "firstName": "Brady",
-      "lastName": "Tkachuk"
-    },
-    "ridgeAttractivenessScore": 3.4538607597351074
-  },
-  {
-    "rank": 89,
-    "player": {
-      "id": 8477416,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8477416.png",
-      "firstName": "Oliver",
-      "lastName": "Bjorkstrand"
-    },
-    "ridgeAttractivenessScore": 3.450817584991455
-  },
-  {
-    "rank": 90,
-    "player": {
-      "id": 8478508,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8478508.png",
-      "firstName": "Yakov",
-      "lastName": "Trenin"
-    },
-    "ridgeAttractivenessScore": 3.449805736541748
-  },
-  {
-    "rank": 91,
-    "player": {
-      "id": 8478443,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8478443.png",
-      "firstName": "Brandon",
-      "lastName": "Carlo"
-    },
-    "ridgeAttractivenessScore": 3.448812484741211
-  },
-  {
-    "rank": 92,
-    "player": {
-      "id": 8480873,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8480873.png",
-      "firstName": "Rasmus",
-      "lastName": "Sandin"
-    },
-    "ridgeAttractivenessScore": 3.4480221271514893
-  },
-  {
-    "rank": 93,
-    "player": {
-      "id": 8482087,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8482087.png",
-      "firstName": "Kaiden",
-      "lastName": "Guhle"
-    },
-    "ridgeAttractivenessScore": 3.447417736053467
-  },
-  {
-    "rank": 94,
-    "player": {
-      "id": 8482964,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8482964.png",
-      "firstName": "Arber",
-      "lastName": "Xhekaj"
-    },
-    "ridgeAttractivenessScore": 3.441704750061035
-  },
-  {
-    "rank": 95,
-    "player": {
-      "id": 8482737,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8482737.png",
-      "firstName": "Zachary",
-      "lastName": "Bolduc"
-    },
-    "ridgeAttractivenessScore": 3.4415476322174072
-  },
-  {
-    "rank": 96,
-    "player": {
-      "id": 8479323,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8479323.png",
-      "firstName": "Adam",
-      "lastName": "Fox"
-    },
-    "ridgeAttractivenessScore": 3.4405620098114014
-  },
-  {
-    "rank": 97,
-    "player": {
-      "id": 8482671,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8482671.png",
-      "firstName": "Owen",
-      "lastName": "Power"
-    },
-    "ridgeAttractivenessScore": 3.4400522708892822
-  },
-  {
-    "rank": 98,
-    "player": {
-      "id": 8479619,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8479619.png",
-      "firstName": "Michael",
-      "lastName": "Carcone"
-    },
-    "ridgeAttractivenessScore": 3.4395692348480225
-  },
-  {
-    "rank": 99,
-    "player": {
-      "id": 8482740,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8482740.png",
-      "firstName": "Wyatt",
-      "lastName": "Johnston"
-    },
-    "ridgeAttractivenessScore": 3.4376730918884277
-  },
-  {
-    "rank": 100,
-    "player": {
-      "id": 8480192,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8480192.png",
-      "firstName": "Johnathan",
-      "lastName": "Kovacevic"
-    },
-    "ridgeAttractivenessScore": 3.436216354370117
-  },
-  {
-    "rank": 101,
-    "player": {
-      "id": 8476399,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8476399.png",
-      "firstName": "Blake",
-      "lastName": "Coleman"
-    },
-    "ridgeAttractivenessScore": 3.435792922973633
-  },
-  {
-    "rank": 102,
-    "player": {
-      "id": 8478038,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8478038.png",
-      "firstName": "Devon",
-      "lastName": "Toews"
-    },
-    "ridgeAttractivenessScore": 3.4333972930908203
-  },
-  {
-    "rank": 103,
-    "player": {
-      "id": 8481732,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8481732.png",
-      "firstName": "Andre",
-      "lastName": "Lee"
-    },
-    "ridgeAttractivenessScore": 3.4322762489318848
-  },
-  {
-    "rank": 104,
-    "player": {
-      "id": 8474578,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8474578.png",
-      "firstName": "Erik",
-      "lastName": "Karlsson"
-    },
-    "ridgeAttractivenessScore": 3.432122230529785
-  },
-  {
-    "rank": 105,
-    "player": {
-      "id": 8475810,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8475810.png",
-      "firstName": "Bryan",
-      "lastName": "Rust"
-    },
-    "ridgeAttractivenessScore": 3.42866849899292
-  },
-  {
-    "rank": 106,
-    "player": {
-      "id": 8483630,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8483630.png",
-      "firstName": "Pavol",
-      "lastName": "Regenda"
-    },
-    "ridgeAttractivenessScore": 3.4284558296203613
-  },
-  {
-    "rank": 107,
-    "player": {
-      "id": 8483526,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8483526.png",
-      "firstName": "Danil",
-      "lastName": "Zhilkin"
-    },
-    "ridgeAttractivenessScore": 3.4269192218780518
-  },
-  {
-    "rank": 108,
-    "player": {
-      "id": 8475760,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8475760.png",
-      "firstName": "Nick",
-      "lastName": "Bjugstad"
-    },
-    "ridgeAttractivenessScore": 3.424466848373413
-  },
-  {
-    "rank": 109,
-    "player": {
-      "id": 8476372,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8476372.png",
-      "firstName": "Nick",
-      "lastName": "Seeler"
-    },
-    "ridgeAttractivenessScore": 3.42445707321167
-  },
-  {
-    "rank": 110,
-    "player": {
-      "id": 8477451,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8477451.png",
-      "firstName": "Ryan",
-      "lastName": "Hartman"
-    },
-    "ridgeAttractivenessScore": 3.422792911529541
-  },
-  {
-    "rank": 111,
-    "player": {
-      "id": 8483565,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8483565.png",
-      "firstName": "Nick",
-      "lastName": "Blankenburg"
-    },
-    "ridgeAttractivenessScore": 3.4220499992370605
-  },
-  {
-    "rank": 112,
-    "player": {
-      "id": 8480797,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8480797.png",
-      "firstName": "Joel",
-      "lastName": "Farabee"
-    },
-    "ridgeAttractivenessScore": 3.421146869659424
-  },
-  {
-    "rank": 113,
-    "player": {
-      "id": 8481033,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8481033.png",
-      "firstName": "Akira",
-      "lastName": "Schmid"
-    },
-    "ridgeAttractivenessScore": 3.4175474643707275
-  },
-  {
-    "rank": 114,
-    "player": {
-      "id": 8482137,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8482137.png",
-      "firstName": "Yaroslav",
-      "lastName": "Askarov"
-    },
-    "ridgeAttractivenessScore": 3.4175233840942383
-  },
-  {
-    "rank": 115,
-    "player": {
-      "id": 8480001,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8480001.png",
-      "firstName": "Urho",
-      "lastName": "Vaakanainen"
-    },
-    "ridgeAttractivenessScore": 3.415318012237549
-  },
-  {
-    "rank": 116,
-    "player": {
-      "id": 8478424,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8478424.png",
-      "firstName": "Jansen",
-      "lastName": "Harkins"
-    },
-    "ridgeAttractivenessScore": 3.41485333442688
-  },
-  {
-    "rank": 117,
-    "player": {
-      "id": 8484797,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8484797.png",
-      "firstName": "Konsta",
-      "lastName": "Helenius"
-    },
-    "ridgeAttractivenessScore": 3.4147346019744873
-  },
-  {
-    "rank": 118,
-    "player": {
-      "id": 8478468,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8478468.png",
-      "firstName": "Jeremy",
-      "lastName": "Lauzon"
-    },
-    "ridgeAttractivenessScore": 3.414705276489258
-  },
-  {
-    "rank": 119,
-    "player": {
-      "id": 8480871,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8480871.png",
-      "firstName": "Adam",
-      "lastName": "Boqvist"
-    },
-    "ridgeAttractivenessScore": 3.4142565727233887
-  },
-  {
-    "rank": 120,
-    "player": {
-      "id": 8483468,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8483468.png",
-      "firstName": "Jiri",
-      "lastName": "Kulich"
-    },
-    "ridgeAttractivenessScore": 3.4137611389160156
-  },
-  {
-    "rank": 121,
-    "player": {
-      "id": 8482166,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8482166.png",
-      "firstName": "Shakir",
-      "lastName": "Mukhamadullin"
-    },
-    "ridgeAttractivenessScore": 3.412426471710205
-  },
-  {
-    "rank": 122,
-    "player": {
-      "id": 8482109,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8482109.png",
-      "firstName": "Alexis",
-      "lastName": "Lafrenière"
-    },
-    "ridgeAttractivenessScore": 3.410341262817383
-  },
-  {
-    "rank": 123,
-    "player": {
-      "id": 8481547,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8481547.png",
-      "firstName": "Simon",
-      "lastName": "Lundmark"
-    },
-    "ridgeAttractivenessScore": 3.4103000164031982
-  },
-  {
-    "rank": 124,
-    "player": {
-      "id": 8482176,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8482176.png",
-      "firstName": "Wyatt",
-      "lastName": "Kaiser"
-    },
-    "ridgeAttractivenessScore": 3.409996271133423
-  },
-  {
-    "rank": 125,
-    "player": {
-      "id": 8479353,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8479353.png",
-      "firstName": "Brett",
-      "lastName": "Howden"
-    },
-    "ridgeAttractivenessScore": 3.4059526920318604
-  },
-  {
-    "rank": 126,
-    "player": {
-      "id": 8482699,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8482699.png",
-      "firstName": "Dylan",
-      "lastName": "Guenther"
-    },
-    "ridgeAttractivenessScore": 3.405447006225586
-  },
-  {
-    "rank": 127,
-    "player": {
-      "id": 8477435,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8477435.png",
-      "firstName": "Ryan",
-      "lastName": "Graves"
-    },
-    "ridgeAttractivenessScore": 3.402843475341797
-  },
-  {
-    "rank": 128,
-    "player": {
-      "id": 8479394,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8479394.png",
-      "firstName": "Carter",
-      "lastName": "Hart"
-    },
-    "ridgeAttractivenessScore": 3.4021308422088623
-  },
-  {
-    "rank": 129,
-    "player": {
-      "id": 8477504,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8477504.png",
-      "firstName": "Josh",
-      "lastName": "Morrissey"
-    },
-    "ridgeAttractivenessScore": 3.4006741046905518
-  },
-  {
-    "rank": 130,
-    "player": {
-      "id": 8482110,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8482110.png",
-      "firstName": "Dawson",
-      "lastName": "Mercer"
-    },
-    "ridgeAttractivenessScore": 3.4006495475769043
-  },
-  {
-    "rank": 131,
-    "player": {
-      "id": 8476392,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8476392.png",
-      "firstName": "Adam",
-      "lastName": "Lowry"
-    },
-    "ridgeAttractivenessScore": 3.3985955715179443
-  },
-  {
-    "rank": 132,
-    "player": {
-      "id": 8477940,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8477940.png",
-      "firstName": "Nikolaj",
-      "lastName": "Ehlers"
-    },
-    "ridgeAttractivenessScore": 3.396562337875366
-  },
-  {
-    "rank": 133,
-    "player": {
-      "id": 8480015,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8480015.png",
-      "firstName": "Owen",
-      "lastName": "Tippett"
-    },
-    "ridgeAttractivenessScore": 3.3961572647094727
-  },
-  {
-    "rank": 134,
-    "player": {
-      "id": 8481596,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8481596.png",
-      "firstName": "Shane",
-      "lastName": "Pinto"
-    },
-    "ridgeAttractivenessScore": 3.394657850265503
-  },
-  {
-    "rank": 135,
-    "player": {
-      "id": 8477429,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8477429.png",
-      "firstName": "Andrew",
-      "lastName": "Copp"
-    },
-    "ridgeAttractivenessScore": 3.392676830291748
-  },
-  {
-    "rank": 136,
-    "player": {
-      "id": 8475168,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8475168.png",
-      "firstName": "Matt",
-      "lastName": "Duchene"
-    },
-    "ridgeAttractivenessScore": 3.3910136222839355
-  },
-  {
-    "rank": 137,
-    "player": {
-      "id": 8477987,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8477987.png",
-      "firstName": "Ryan",
-      "lastName": "Donato"
-    },
-    "ridgeAttractivenessScore": 3.3874387741088867
-  },
-  {
-    "rank": 138,
-    "player": {
-      "id": 8480981,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8480981.png",
-      "firstName": "Joel",
-      "lastName": "Hofer"
-    },
-    "ridgeAttractivenessScore": 3.3867344856262207
-  },
-  {
-    "rank": 139,
-    "player": {
-      "id": 8483890,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8483890.png",
-      "firstName": "Braeden",
-      "lastName": "Bowman"
-    },
-    "ridgeAttractivenessScore": 3.3866078853607178
-  },
-  {
-    "rank": 140,
-    "player": {
-      "id": 8482476,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8482476.png",
-      "firstName": "Emil",
-      "lastName": "Heineman"
-    },
-    "ridgeAttractivenessScore": 3.3862617015838623
-  },
-  {
-    "rank": 141,
-    "player": {
-      "id": 8477503,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8477503.png",
-      "firstName": "Max",
-      "lastName": "Domi"
-    },
-    "ridgeAttractivenessScore": 3.38384747505188
-  },
-  {
-    "rank": 142,
-    "player": {
-      "id": 8478474,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8478474.png",
-      "firstName": "Lawson",
-      "lastName": "Crouse"
-    },
-    "ridgeAttractivenessScore": 3.3818137645721436
-  },
-  {
-    "rank": 143,
-    "player": {
-      "id": 8477951,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8477951.png",
-      "firstName": "Nick",
-      "lastName": "Schmaltz"
-    },
-    "ridgeAttractivenessScore": 3.38179612159729
-  },
-  {
-    "rank": 144,
-    "player": {
-      "id": 8476341,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8476341.png",
-      "firstName": "Anton",
-      "lastName": "Forsberg"
-    },
-    "ridgeAttractivenessScore": 3.3809988498687744
-  },
-  {
-    "rank": 145,
-    "player": {
-      "id": 8475462,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8475462.png",
-      "firstName": "Radko",
-      "lastName": "Gudas"
-    },
-    "ridgeAttractivenessScore": 3.3767943382263184
-  },
-  {
-    "rank": 146,
-    "player": {
-      "id": 8484186,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8484186.png",
-      "firstName": "Ryan",
-      "lastName": "Leonard"
-    },
-    "ridgeAttractivenessScore": 3.375680685043335
-  },
-  {
-    "rank": 147,
-    "player": {
-      "id": 8476539,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8476539.png",
-      "firstName": "Jonathan",
-      "lastName": "Marchessault"
-    },
-    "ridgeAttractivenessScore": 3.3743529319763184
-  },
-  {
-    "rank": 148,
-    "player": {
-      "id": 8476867,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8476867.png",
-      "firstName": "Brendan",
-      "lastName": "Gaunce"
-    },
-    "ridgeAttractivenessScore": 3.373704671859741
-  },
-  {
-    "rank": 149,
-    "player": {
-      "id": 8480842,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8480842.png",
-      "firstName": "Filip",
-      "lastName": "Hallander"
-    },
-    "ridgeAttractivenessScore": 3.372551441192627
-  },
-  {
-    "rank": 150,
-    "player": {
-      "id": 8477541,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8477541.png",
-      "firstName": "Dakota",
-      "lastName": "Mermis"
-    },
-    "ridgeAttractivenessScore": 3.3720712661743164
-  },
-  {
-    "rank": 151,
-    "player": {
-      "id": 8473575,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8473575.png",
-      "firstName": "Semyon",
-      "lastName": "Varlamov"
-    },
-    "ridgeAttractivenessScore": 3.3711748123168945
-  },
-  {
-    "rank": 152,
-    "player": {
-      "id": 8482911,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8482911.png",
-      "firstName": "Joel",
-      "lastName": "Nystrom"
-    },
-    "ridgeAttractivenessScore": 3.370882749557495
-  },
-  {
-    "rank": 153,
-    "player": {
-      "id": 8473507,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8473507.png",
-      "firstName": "Jeff",
-      "lastName": "Petry"
-    },
-    "ridgeAttractivenessScore": 3.370621919631958
-  },
-  {
-    "rank": 154,
-    "player": {
-      "id": 8474037,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8474037.png",
-      "firstName": "James",
-      "lastName": "van Riemsdyk"
-    },
-    "ridgeAttractivenessScore": 3.370426893234253
-  },
-  {
-    "rank": 155,
-    "player": {
-      "id": 8478840,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8478840.png",
-      "firstName": "Will",
-      "lastName": "Borgen"
-    },
-    "ridgeAttractivenessScore": 3.3672659397125244
-  },
-  {
-    "rank": 156,
-    "player": {
-      "id": 8474679,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8474679.png",
-      "firstName": "Gustav",
-      "lastName": "Nyquist"
-    },
-    "ridgeAttractivenessScore": 3.362454414367676
-  },
-  {
-    "rank": 157,
-    "player": {
-      "id": 8480947,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8480947.png",
-      "firstName": "Kevin",
-      "lastName": "Lankinen"
-    },
-    "ridgeAttractivenessScore": 3.361879825592041
-  },
-  {
-    "rank": 158,
-    "player": {
-      "id": 8478421,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8478421.png",
-      "firstName": "A.J.",
-      "lastName": "Greer"
-    },
-    "ridgeAttractivenessScore": 3.3583552837371826
-  },
-  {
-    "rank": 159,
-    "player": {
-      "id": 8480813,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8480813.png",
-      "firstName": "Joe",
-      "lastName": "Veleno"
-    },
-    "ridgeAttractivenessScore": 3.3582420349121094
-  },
-  {
-    "rank": 160,
-    "player": {
-      "id": 8476891,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8476891.png",
-      "firstName": "Matt",
-      "lastName": "Grzelcyk"
-    },
-    "ridgeAttractivenessScore": 3.3572700023651123
-  },
-  {
-    "rank": 161,
-    "player": {
-      "id": 8477346,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8477346.png",
-      "firstName": "MacKenzie",
-      "lastName": "Weegar"
-    },
-    "ridgeAttractivenessScore": 3.3569211959838867
-  },
-  {
-    "rank": 162,
-    "player": {
-      "id": 8477998,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8477998.png",
-      "firstName": "Warren",
-      "lastName": "Foegele"
-    },
-    "ridgeAttractivenessScore": 3.356505870819092
-  },
-  {
-    "rank": 163,
-    "player": {
-      "id": 8479393,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8479393.png",
-      "firstName": "Noah",
-      "lastName": "Gregor"
-    },
-    "ridgeAttractivenessScore": 3.3552682399749756
-  },
-  {
-    "rank": 164,
-    "player": {
-      "id": 8480035,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8480035.png",
-      "firstName": "Henri",
-      "lastName": "Jokiharju"
-    },
-    "ridgeAttractivenessScore": 3.354918956756592
-  },
-  {
-    "rank": 165,
-    "player": {
-      "id": 8484149,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8484149.png",
-      "firstName": "Gavin",
-      "lastName": "Brindley"
-    },
-    "ridgeAttractivenessScore": 3.3543620109558105
-  },
-  {
-    "rank": 166,
-    "player": {
-      "id": 8480012,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8480012.png",
-      "firstName": "Elias",
-      "lastName": "Pettersson"
-    },
-    "ridgeAttractivenessScore": 3.353761672973633
-  },
-  {
-    "rank": 167,
-    "player": {
-      "id": 8480259,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8480259.png",
-      "firstName": "Ben",
-      "lastName": "Jones"
-    },
-    "ridgeAttractivenessScore": 3.3537425994873047
-  },
-  {
-    "rank": 168,
-    "player": {
-      "id": 8482177,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8482177.png",
-      "firstName": "Marat",
-      "lastName": "Khusnutdinov"
-    },
-    "ridgeAttractivenessScore": 3.353501796722412
-  },
-  {
-    "rank": 169,
-    "player": {
-      "id": 8477934,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8477934.png",
-      "firstName": "Leon",
-      "lastName": "Draisaitl"
-    },
-    "ridgeAttractivenessScore": 3.352788209915161
-  },
-  {
-    "rank": 170,
-    "player": {
-      "id": 8480084,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8480084.png",
-      "firstName": "Nick",
-      "lastName": "DeSimone"
-    },
-    "ridgeAttractivenessScore": 3.3525543212890625
-  },
-  {
-    "rank": 171,
-    "player": {
-      "id": 8474563,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8474563.png",
-      "firstName": "Drew",
-      "lastName": "Doughty"
-    },
-    "ridgeAttractivenessScore": 3.3524010181427
-  },
-  {
-    "rank": 172,
-    "player": {
-      "id": 8477996,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8477996.png",
-      "firstName": "Juho",
-      "lastName": "Lammikko"
-    },
-    "ridgeAttractivenessScore": 3.3500657081604004
-  },
-  {
-    "rank": 173,
-    "player": {
-      "id": 8475726,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8475726.png",
-      "firstName": "Tyler",
-      "lastName": "Toffoli"
-    },
-    "ridgeAttractivenessScore": 3.3441624641418457
-  },
-  {
-    "rank": 174,
-    "player": {
-      "id": 8476479,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8476479.png",
-      "firstName": "Phillip",
-      "lastName": "Danault"
-    },
-    "ridgeAttractivenessScore": 3.3416388034820557
-  },
-  {
-    "rank": 175,
-    "player": {
-      "id": 8480840,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8480840.png",
-      "firstName": "Oskar",
-      "lastName": "Bäck"
-    },
-    "ridgeAttractivenessScore": 3.340555191040039
-  },
-  {
-    "rank": 176,
-    "player": {
-      "id": 8476422,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8476422.png",
-      "firstName": "Mike",
-      "lastName": "Reilly"
-    },
-    "ridgeAttractivenessScore": 3.3402657508850098
-  },
-  {
-    "rank": 177,
-    "player": {
-      "id": 8478057,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8478057.png",
-      "firstName": "Dakota",
-      "lastName": "Joshua"
-    },
-    "ridgeAttractivenessScore": 3.339890241622925
-  },
-  {
-    "rank": 178,
-    "player": {
-      "id": 8478476,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8478476.png",
-      "firstName": "Kyle",
-      "lastName": "Capobianco"
-    },
-    "ridgeAttractivenessScore": 3.338005542755127
-  },
-  {
-    "rank": 179,
-    "player": {
-      "id": 8476312,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8476312.png",
-      "firstName": "Josh",
-      "lastName": "Manson"
-    },
-    "ridgeAttractivenessScore": 3.337151288986206
-  },
-  {
-    "rank": 180,
-    "player": {
-      "id": 8481167,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8481167.png",
-      "firstName": "Brayden",
-      "lastName": "Pachal"
-    },
-    "ridgeAttractivenessScore": 3.3363914489746094
-  },
-  {
-    "rank": 181,
-    "player": {
-      "id": 8479324,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8479324.png",
-      "firstName": "Ryan",
-      "lastName": "Lindgren"
-    },
-    "ridgeAttractivenessScore": 3.333538293838501
-  },
-  {
-    "rank": 182,
-    "player": {
-      "id": 8484471,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8484471.png",
-      "firstName": "Emmitt",
-      "lastName": "Finnie"
-    },
-    "ridgeAttractivenessScore": 3.3320653438568115
-  },
-  {
-    "rank": 183,
-    "player": {
-      "id": 8477810,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8477810.png",
-      "firstName": "Joel",
-      "lastName": "Hanley"
-    },
-    "ridgeAttractivenessScore": 3.3311216831207275
-  },
-  {
-    "rank": 184,
-    "player": {
-      "id": 8475790,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8475790.png",
-      "firstName": "Erik",
-      "lastName": "Gudbranson"
-    },
-    "ridgeAttractivenessScore": 3.3306102752685547
-  },
-  {
-    "rank": 185,
-    "player": {
-      "id": 8476432,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8476432.png",
-      "firstName": "Boone",
-      "lastName": "Jenner"
-    },
-    "ridgeAttractivenessScore": 3.3303163051605225
-  },
-  {
-    "rank": 186,
-    "player": {
-      "id": 8479576,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8479576.png",
-      "firstName": "Vincent",
-      "lastName": "Desharnais"
-    },
-    "ridgeAttractivenessScore": 3.329375743865967
-  },
-  {
-    "rank": 187,
-    "player": {
-      "id": 8475208,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8475208.png",
-      "firstName": "Brian",
-      "lastName": "Dumoulin"
-    },
-    "ridgeAttractivenessScore": 3.328953742980957
-  },
-  {
-    "rank": 188,
-    "player": {
-      "id": 8482659,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8482659.png",
-      "firstName": "Josh",
-      "lastName": "Doan"
-    },
-    "ridgeAttractivenessScore": 3.327500104904175
-  },
-  {
-    "rank": 189,
-    "player": {
-      "id": 8476872,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8476872.png",
-      "firstName": "Scott",
-      "lastName": "Laughton"
-    },
-    "ridgeAttractivenessScore": 3.3252341747283936
-  },
-  {
-    "rank": 190,
-    "player": {
-      "id": 8474568,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8474568.png",
-      "firstName": "Luke",
-      "lastName": "Schenn"
-    },
-    "ridgeAttractivenessScore": 3.3239998817443848
-  },
-  {
-    "rank": 191,
-    "player": {
-      "id": 8476458,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8476458.png",
-      "firstName": "Ryan",
-      "lastName": "Strome"
-    },
-    "ridgeAttractivenessScore": 3.3232834339141846
-  },
-  {
-    "rank": 192,
-    "player": {
-      "id": 8478009,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8478009.png",
-      "firstName": "Ilya",
-      "lastName": "Sorokin"
-    },
-    "ridgeAttractivenessScore": 3.3228418827056885
-  },
-  {
-    "rank": 193,
-    "player": {
-      "id": 8482726,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8482726.png",
-      "firstName": "Samuel",
-      "lastName": "Helenius"
-    },
-    "ridgeAttractivenessScore": 3.321622848510742
-  },
-  {
-    "rank": 194,
-    "player": {
-      "id": 8480068,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8480068.png",
-      "firstName": "Ryan",
-      "lastName": "Poehling"
-    },
-    "ridgeAttractivenessScore": 3.319108486175537
-  },
-  {
-    "rank": 195,
-    "player": {
-      "id": 8482124,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8482124.png",
-      "firstName": "Quinton",
-      "lastName": "Byfield"
-    },
-    "ridgeAttractivenessScore": 3.3185079097747803
-  },
-  {
-    "rank": 196,
-    "player": {
-      "id": 8479996,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8479996.png",
-      "firstName": "Cody",
-      "lastName": "Glass"
-    },
-    "ridgeAttractivenessScore": 3.3178155422210693
-  },
-  {
-    "rank": 197,
-    "player": {
-      "id": 8483512,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8483512.png",
-      "firstName": "Matt",
-      "lastName": "Savoie"
-    },
-    "ridgeAttractivenessScore": 3.31354022026062
-  },
-  {
-    "rank": 198,
-    "player": {
-      "id": 8476292,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8476292.png",
-      "firstName": "Ondrej",
-      "lastName": "Palat"
-    },
-    "ridgeAttractivenessScore": 3.3128292560577393
-  },
-  {
-    "rank": 199,
-    "player": {
-      "id": 8484388,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8484388.png",
-      "firstName": "Daniil",
-      "lastName": "But"
-    },
-    "ridgeAttractivenessScore": 3.312776803970337
-  },
-  {
-    "rank": 200,
-    "player": {
-      "id": 8482105,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8482105.png",
-      "firstName": "Jake",
-      "lastName": "Sanderson"
-    },
-    "ridgeAttractivenessScore": 3.312716245651245
-  },
-  {
-    "rank": 201,
-    "player": {
-      "id": 8484153,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8484153.png",
-      "firstName": "Leo",
-      "lastName": "Carlsson"
-    },
-    "ridgeAttractivenessScore": 3.311399459838867
-  },
-  {
-    "rank": 202,
-    "player": {
-      "id": 8478470,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8478470.png",
-      "firstName": "Samuel",
-      "lastName": "Montembeault"
-    },
-    "ridgeAttractivenessScore": 3.31129789352417
-  },
-  {
-    "rank": 203,
-    "player": {
-      "id": 8478904,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8478904.png",
-      "firstName": "Steven",
-      "lastName": "Lorentz"
-    },
-    "ridgeAttractivenessScore": 3.306285858154297
-  },
-  {
-    "rank": 204,
-    "player": {
-      "id": 8481014,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8481014.png",
-      "firstName": "Alexander",
-      "lastName": "Romanov"
-    },
-    "ridgeAttractivenessScore": 3.3053832054138184
-  },
-  {
-    "rank": 205,
-    "player": {
-      "id": 8482074,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8482074.png",
-      "firstName": "Connor",
-      "lastName": "Zary"
-    },
-    "ridgeAttractivenessScore": 3.302004814147949
-  },
-  {
-    "rank": 206,
-    "player": {
-      "id": 8481533,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8481533.png",
-      "firstName": "Trevor",
-      "lastName": "Zegras"
-    },
-    "ridgeAttractivenessScore": 3.3000168800354004
-  },
-  {
-    "rank": 207,
-    "player": {
-      "id": 8477935,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8477935.png",
-      "firstName": "Sam",
-      "lastName": "Bennett"
-    },
-    "ridgeAttractivenessScore": 3.2996017932891846
-  },
-  {
-    "rank": 208,
-    "player": {
-      "id": 8476822,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8476822.png",
-      "firstName": "Luke",
-      "lastName": "Glendening"
-    },
-    "ridgeAttractivenessScore": 3.2989425659179688
-  },
-  {
-    "rank": 209,
-    "player": {
-      "id": 8481582,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8481582.png",
-      "firstName": "Nicholas",
-      "lastName": "Robertson"
-    },
-    "ridgeAttractivenessScore": 3.2981386184692383
-  },
-  {
-    "rank": 210,
-    "player": {
-      "id": 8477447,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8477447.png",
-      "firstName": "Shea",
-      "lastName": "Theodore"
-    },
-    "ridgeAttractivenessScore": 3.295530319213867
-  },
-  {
-    "rank": 211,
-    "player": {
-      "id": 8480289,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8480289.png",
-      "firstName": "Morgan",
-      "lastName": "Barron"
-    },
-    "ridgeAttractivenessScore": 3.2949321269989014
-  },
-  {
-    "rank": 212,
-    "player": {
-      "id": 8482100,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8482100.png",
-      "firstName": "Alexander",
-      "lastName": "Nikishin"
-    },
-    "ridgeAttractivenessScore": 3.2932779788970947
-  },
-  {
-    "rank": 213,
-    "player": {
-      "id": 8474574,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8474574.png",
-      "firstName": "Tyler",
-      "lastName": "Myers"
-    },
-    "ridgeAttractivenessScore": 3.292398691177368
-  },
-  {
-    "rank": 214,
-    "player": {
-      "id": 8476459,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8476459.png",
-      "firstName": "Mika",
-      "lastName": "Zibanejad"
-    },
-    "ridgeAttractivenessScore": 3.291872024536133
-  },
-  {
-    "rank": 215,
-    "player": {
-      "id": 8475231,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8475231.png",
-      "firstName": "Casey",
-      "lastName": "Cizikas"
-    },
-    "ridgeAttractivenessScore": 3.291595697402954
-  },
-  {
-    "rank": 216,
-    "player": {
-      "id": 8474586,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8474586.png",
-      "firstName": "Jordan",
-      "lastName": "Eberle"
-    },
-    "ridgeAttractivenessScore": 3.2907626628875732
-  },
-  {
-    "rank": 217,
-    "player": {
-      "id": 8482113,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8482113.png",
-      "firstName": "Anton",
-      "lastName": "Lundell"
-    },
-    "ridgeAttractivenessScore": 3.288712501525879
-  },
-  {
-    "rank": 218,
-    "player": {
-      "id": 8477992,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8477992.png",
-      "firstName": "Jonas",
-      "lastName": "Johansson"
-    },
-    "ridgeAttractivenessScore": 3.288503885269165
-  },
-  {
-    "rank": 219,
-    "player": {
-      "id": 8477960,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8477960.png",
-      "firstName": "Adrian",
-      "lastName": "Kempe"
-    },
-    "ridgeAttractivenessScore": 3.288482904434204
-  },
-  {
-    "rank": 220,
-    "player": {
-      "id": 8482487,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8482487.png",
-      "firstName": "Jakub",
-      "lastName": "Dobes"
-    },
-    "ridgeAttractivenessScore": 3.288151264190674
-  },
-  {
-    "rank": 221,
-    "player": {
-      "id": 8475692,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8475692.png",
-      "firstName": "Mats",
-      "lastName": "Zuccarello"
-    },
-    "ridgeAttractivenessScore": 3.2873728275299072
-  },
-  {
-    "rank": 222,
-    "player": {
-      "id": 8476923,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8476923.png",
-      "firstName": "Damon",
-      "lastName": "Severson"
-    },
-    "ridgeAttractivenessScore": 3.287191390991211
-  },
-  {
-    "rank": 223,
-    "player": {
-      "id": 8477967,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8477967.png",
-      "firstName": "Thatcher",
-      "lastName": "Demko"
-    },
-    "ridgeAttractivenessScore": 3.2864503860473633
-  },
-  {
-    "rank": 224,
-    "player": {
-      "id": 8474567,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8474567.png",
-      "firstName": "Zach",
-      "lastName": "Bogosian"
-    },
-    "ridgeAttractivenessScore": 3.2857441902160645
-  },
-  {
-    "rank": 225,
-    "player": {
-      "id": 8479550,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8479550.png",
-      "firstName": "Tanner",
-      "lastName": "Laczynski"
-    },
-    "ridgeAttractivenessScore": 3.2841796875
-  },
-  {
-    "rank": 226,
-    "player": {
-      "id": 8479414,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8479414.png",
-      "firstName": "Nathan",
-      "lastName": "Bastian"
-    },
-    "ridgeAttractivenessScore": 3.2840280532836914
-  },
-  {
-    "rank": 227,
-    "player": {
-      "id": 8477948,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8477948.png",
-      "firstName": "Travis",
-      "lastName": "Sanheim"
-    },
-    "ridgeAttractivenessScore": 3.281489849090576
-  },
-  {
-    "rank": 228,
-    "player": {
-      "id": 8477365,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8477365.png",
-      "firstName": "Connor",
-      "lastName": "Clifton"
-    },
-    "ridgeAttractivenessScore": 3.276782512664795
-  },
-  {
-    "rank": 229,
-    "player": {
-      "id": 8475791,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8475791.png",
-      "firstName": "Taylor",
-      "lastName": "Hall"
-    },
-    "ridgeAttractivenessScore": 3.2764229774475098
-  },
-  {
-    "rank": 230,
-    "player": {
-      "id": 8478874,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8478874.png",
-      "firstName": "Adam",
-      "lastName": "Gaudette"
-    },
-    "ridgeAttractivenessScore": 3.276292562484741
-  },
-  {
-    "rank": 231,
-    "player": {
-      "id": 8484241,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8484241.png",
-      "firstName": "Matthew",
-      "lastName": "Wood"
-    },
-    "ridgeAttractivenessScore": 3.269991159439087
-  },
-  {
-    "rank": 232,
-    "player": {
-      "id": 8476902,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8476902.png",
-      "firstName": "Esa",
-      "lastName": "Lindell"
-    },
-    "ridgeAttractivenessScore": 3.2693305015563965
-  },
-  {
-    "rank": 233,
-    "player": {
-      "id": 8474141,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8474141.png",
-      "firstName": "Patrick",
-      "lastName": "Kane"
-    },
-    "ridgeAttractivenessScore": 3.2687740325927734
-  },
-  {
-    "rank": 234,
-    "player": {
-      "id": 8479336,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8479336.png",
-      "firstName": "Carl",
-      "lastName": "Grundstrom"
-    },
-    "ridgeAttractivenessScore": 3.267843246459961
-  },
-  {
-    "rank": 235,
-    "player": {
-      "id": 8482803,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8482803.png",
-      "firstName": "Olen",
-      "lastName": "Zellweger"
-    },
-    "ridgeAttractivenessScore": 3.2674460411071777
-  },
-  {
-    "rank": 236,
-    "player": {
-      "id": 8477493,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8477493.png",
-      "firstName": "Aleksander",
-      "lastName": "Barkov"
-    },
-    "ridgeAttractivenessScore": 3.2669761180877686
-  },
-  {
-    "rank": 237,
-    "player": {
-      "id": 8481524,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8481524.png",
-      "firstName": "Bowen",
-      "lastName": "Byram"
-    },
-    "ridgeAttractivenessScore": 3.266510009765625
-  },
-  {
-    "rank": 238,
-    "player": {
-      "id": 8478420,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8478420.png",
-      "firstName": "Mikko",
-      "lastName": "Rantanen"
-    },
-    "ridgeAttractivenessScore": 3.265981912612915
-  },
-  {
-    "rank": 239,
-    "player": {
-      "id": 8484177,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8484177.png",
-      "firstName": "Lenni",
-      "lastName": "Hameenaho"
-    },
-    "ridgeAttractivenessScore": 3.2655723094940186
-  },
-  {
-    "rank": 240,
-    "player": {
-      "id": 8478519,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8478519.png",
-      "firstName": "Anthony",
-      "lastName": "Cirelli"
-    },
-    "ridgeAttractivenessScore": 3.2635884284973145
-  },
-  {
-    "rank": 241,
-    "player": {
-      "id": 8479425,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8479425.png",
-      "firstName": "Filip",
-      "lastName": "Hronek"
-    },
-    "ridgeAttractivenessScore": 3.2623229026794434
-  },
-  {
-    "rank": 242,
-    "player": {
-      "id": 8483406,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8483406.png",
-      "firstName": "Taylor",
-      "lastName": "Ward"
-    },
-    "ridgeAttractivenessScore": 3.2621450424194336
-  },
-  {
-    "rank": 243,
-    "player": {
-      "id": 8476853,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8476853.png",
-      "firstName": "Morgan",
-      "lastName": "Rielly"
-    },
-    "ridgeAttractivenessScore": 3.2610909938812256
-  },
-  {
-    "rank": 244,
-    "player": {
-      "id": 8482097,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8482097.png",
-      "firstName": "Jack",
-      "lastName": "Quinn"
-    },
-    "ridgeAttractivenessScore": 3.258333444595337
-  },
-  {
-    "rank": 245,
-    "player": {
-      "id": 8476438,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8476438.png",
-      "firstName": "Brandon",
-      "lastName": "Saad"
-    },
-    "ridgeAttractivenessScore": 3.2579689025878906
-  },
-  {
-    "rank": 246,
-    "player": {
-      "id": 8480843,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8480843.png",
-      "firstName": "Lukas",
-      "lastName": "Dostal"
-    },
-    "ridgeAttractivenessScore": 3.2573070526123047
-  },
-  {
-    "rank": 247,
-    "player": {
-      "id": 8481030,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8481030.png",
-      "firstName": "Jack",
-      "lastName": "St. Ivany"
-    },
-    "ridgeAttractivenessScore": 3.257227659225464
-  },
-  {
-    "rank": 248,
-    "player": {
-      "id": 8477986,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8477986.png",
-      "firstName": "Brandon",
-      "lastName": "Montour"
-    },
-    "ridgeAttractivenessScore": 3.2566418647766113
-  },
-  {
-    "rank": 249,
-    "player": {
-      "id": 8482073,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8482073.png",
-      "firstName": "Braden",
-      "lastName": "Schneider"
-    },
-    "ridgeAttractivenessScore": 3.2563376426696777
-  },
-  {
-    "rank": 250,
-    "player": {
-      "id": 8480990,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8480990.png",
-      "firstName": "Declan",
-      "lastName": "Chisholm"
-    },
-    "ridgeAttractivenessScore": 3.2546370029449463
-  },
-  {
-    "rank": 251,
-    "player": {
-      "id": 8478831,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8478831.png",
-      "firstName": "Kevin",
-      "lastName": "Stenlund"
-    },
-    "ridgeAttractivenessScore": 3.25417423248291
-  },
-  {
-    "rank": 252,
-    "player": {
-      "id": 8478445,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8478445.png",
-      "firstName": "Mathew",
-      "lastName": "Barzal"
-    },
-    "ridgeAttractivenessScore": 3.253265142440796
-  },
-  {
-    "rank": 253,
-    "player": {
-      "id": 8477938,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8477938.png",
-      "firstName": "Haydn",
-      "lastName": "Fleury"
-    },
-    "ridgeAttractivenessScore": 3.252836227416992
-  },
-  {
-    "rank": 254,
-    "player": {
-      "id": 8483768,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8483768.png",
-      "firstName": "Victor",
-      "lastName": "Mancini"
-    },
-    "ridgeAttractivenessScore": 3.2499260902404785
-  },
-  {
-    "rank": 255,
-    "player": {
-      "id": 8482667,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8482667.png",
-      "firstName": "William",
-      "lastName": "Eklund"
-    },
-    "ridgeAttractivenessScore": 3.2496678829193115
-  },
-  {
-    "rank": 256,
-    "player": {
-      "id": 8476917,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8476917.png",
-      "firstName": "Adam",
-      "lastName": "Pelech"
-    },
-    "ridgeAttractivenessScore": 3.2478671073913574
-  },
-  {
-    "rank": 257,
-    "player": {
-      "id": 8478399,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8478399.png",
-      "firstName": "Jonas",
-      "lastName": "Siegenthaler"
-    },
-    "ridgeAttractivenessScore": 3.246251344680786
-  },
-  {
-    "rank": 258,
-    "player": {
-      "id": 8478396,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8478396.png",
-      "firstName": "Noah",
-      "lastName": "Hanifin"
-    },
-    "ridgeAttractivenessScore": 3.2456676959991455
-  },
-  {
-    "rank": 259,
-    "player": {
-      "id": 8479981,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8479981.png",
-      "firstName": "Jonah",
-      "lastName": "Gadjovich"
-    },
-    "ridgeAttractivenessScore": 3.244370460510254
-  },
-  {
-    "rank": 260,
-    "player": {
-      "id": 8484185,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8484185.png",
-      "firstName": "Nick",
-      "lastName": "Lardis"
-    },
-    "ridgeAttractivenessScore": 3.243929862976074
-  },
-  {
-    "rank": 261,
-    "player": {
-      "id": 8483493,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8483493.png",
-      "firstName": "Frank",
-      "lastName": "Nazar"
-    },
-    "ridgeAttractivenessScore": 3.2437937259674072
-  },
-  {
-    "rank": 262,
-    "player": {
-      "id": 8478104,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8478104.png",
-      "firstName": "Sammy",
-      "lastName": "Blais"
-    },
-    "ridgeAttractivenessScore": 3.2429349422454834
-  },
-  {
-    "rank": 263,
-    "player": {
-      "id": 8478055,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8478055.png",
-      "firstName": "Gustav",
-      "lastName": "Forsling"
-    },
-    "ridgeAttractivenessScore": 3.2426681518554688
-  },
-  {
-    "rank": 264,
-    "player": {
-      "id": 8479359,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8479359.png",
-      "firstName": "Beck",
-      "lastName": "Malenstyn"
-    },
-    "ridgeAttractivenessScore": 3.2416439056396484
-  },
-  {
-    "rank": 265,
-    "player": {
-      "id": 8480879,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8480879.png",
-      "firstName": "Jacob",
-      "lastName": "Bernard-Docker"
-    },
-    "ridgeAttractivenessScore": 3.240853786468506
-  },
-  {
-    "rank": 266,
-    "player": {
-      "id": 8479542,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8479542.png",
-      "firstName": "Brandon",
-      "lastName": "Hagel"
-    },
-    "ridgeAttractivenessScore": 3.240219831466675
-  },
-  {
-    "rank": 267,
-    "player": {
-      "id": 8478133,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8478133.png",
-      "firstName": "Jake",
-      "lastName": "Evans"
-    },
-    "ridgeAttractivenessScore": 3.2392735481262207
-  },
-  {
-    "rank": 268,
-    "player": {
-      "id": 8477964,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8477964.png",
-      "firstName": "Ivan",
-      "lastName": "Barbashev"
-    },
-    "ridgeAttractivenessScore": 3.238589286804199
-  },
-  {
-    "rank": 269,
-    "player": {
-      "id": 8482111,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8482111.png",
-      "firstName": "Justin",
-      "lastName": "Barron"
-    },
-    "ridgeAttractivenessScore": 3.2380731105804443
-  },
-  {
-    "rank": 270,
-    "player": {
-      "id": 8477021,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8477021.png",
-      "firstName": "Alexander",
-      "lastName": "Kerfoot"
-    },
-    "ridgeAttractivenessScore": 3.2374215126037598
-  },
-  {
-    "rank": 271,
-    "player": {
-      "id": 8480281,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8480281.png",
-      "firstName": "Alexey",
-      "lastName": "Toropchenko"
-    },
-    "ridgeAttractivenessScore": 3.236992120742798
-  },
-  {
-    "rank": 272,
-    "player": {
-      "id": 8477942,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8477942.png",
-      "firstName": "Kevin",
-      "lastName": "Fiala"
-    },
-    "ridgeAttractivenessScore": 3.2365972995758057
-  },
-  {
-    "rank": 273,
-    "player": {
-      "id": 8478366,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8478366.png",
-      "firstName": "Frank",
-      "lastName": "Vatrano"
-    },
-    "ridgeAttractivenessScore": 3.2364091873168945
-  },
-  {
-    "rank": 274,
-    "player": {
-      "id": 8485402,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8485402.png",
-      "firstName": "Michael",
-      "lastName": "Misa"
-    },
-    "ridgeAttractivenessScore": 3.233142852783203
-  },
-  {
-    "rank": 275,
-    "player": {
-      "id": 8476880,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8476880.png",
-      "firstName": "Tom",
-      "lastName": "Wilson"
-    },
-    "ridgeAttractivenessScore": 3.231478691101074
-  },
-  {
-    "rank": 276,
-    "player": {
-      "id": 8484287,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8484287.png",
-      "firstName": "Cole",
-      "lastName": "McWard"
-    },
-    "ridgeAttractivenessScore": 3.231281042098999
-  },
-  {
-    "rank": 277,
-    "player": {
-      "id": 8482408,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8482408.png",
-      "firstName": "Jeff",
-      "lastName": "Malott"
-    },
-    "ridgeAttractivenessScore": 3.2280352115631104
-  },
-  {
-    "rank": 278,
-    "player": {
-      "id": 8484984,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8484984.png",
-      "firstName": "Ivan",
-      "lastName": "Demidov"
-    },
-    "ridgeAttractivenessScore": 3.226408004760742
-  },
-  {
-    "rank": 279,
-    "player": {
-      "id": 8482095,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8482095.png",
-      "firstName": "Tyler",
-      "lastName": "Kleven"
-    },
-    "ridgeAttractivenessScore": 3.226311206817627
-  },
-  {
-    "rank": 280,
-    "player": {
-      "id": 8481527,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8481527.png",
-      "firstName": "Kaedan",
-      "lastName": "Korczak"
-    },
-    "ridgeAttractivenessScore": 3.222543716430664
-  },
-  {
-    "rank": 281,
-    "player": {
-      "id": 8484305,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8484305.png",
-      "firstName": "Zach",
-      "lastName": "Metsa"
-    },
-    "ridgeAttractivenessScore": 3.2212886810302734
-  },
-  {
-    "rank": 282,
-    "player": {
-      "id": 8475714,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8475714.png",
-      "firstName": "Calle",
-      "lastName": "Jarnkrok"
-    },
-    "ridgeAttractivenessScore": 3.2210497856140137
-  },
-  {
-    "rank": 283,
-    "player": {
-      "id": 8475765,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8475765.png",
-      "firstName": "Vladimir",
-      "lastName": "Tarasenko"
-    },
-    "ridgeAttractivenessScore": 3.220698118209839
-  },
-  {
-    "rank": 284,
-    "player": {
-      "id": 8476480,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8476480.png",
-      "firstName": "Vladislav",
-      "lastName": "Namestnikov"
-    },
-    "ridgeAttractivenessScore": 3.2177062034606934
-  },
-  {
-    "rank": 285,
-    "player": {
-      "id": 8474641,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8474641.png",
-      "firstName": "Adam",
-      "lastName": "Henrique"
-    },
-    "ridgeAttractivenessScore": 3.2169978618621826
-  },
-  {
-    "rank": 286,
-    "player": {
-      "id": 8480848,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8480848.png",
-      "firstName": "Ty",
-      "lastName": "Dellandrea"
-    },
-    "ridgeAttractivenessScore": 3.216916084289551
-  },
-  {
-    "rank": 287,
-    "player": {
-      "id": 8478483,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8478483.png",
-      "firstName": "Mitch",
-      "lastName": "Marner"
-    },
-    "ridgeAttractivenessScore": 3.216313123703003
-  },
-  {
-    "rank": 288,
-    "player": {
-      "id": 8482155,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8482155.png",
-      "firstName": "Alex",
-      "lastName": "Laferriere"
-    },
-    "ridgeAttractivenessScore": 3.2162320613861084
-  },
-  {
-    "rank": 289,
-    "player": {
-      "id": 8478472,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8478472.png",
-      "firstName": "Mathieu",
-      "lastName": "Joseph"
-    },
-    "ridgeAttractivenessScore": 3.2144837379455566
-  },
-  {
-    "rank": 290,
-    "player": {
-      "id": 8480829,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8480829.png",
-      "firstName": "Jesperi",
-      "lastName": "Kotkaniemi"
-    },
-    "ridgeAttractivenessScore": 3.214092969894409
-  },
-  {
-    "rank": 291,
-    "player": {
-      "id": 8475795,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8475795.png",
-      "firstName": "Dylan",
-      "lastName": "McIlrath"
-    },
-    "ridgeAttractivenessScore": 3.2122726440429688
-  },
-  {
-    "rank": 292,
-    "player": {
-      "id": 8482149,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8482149.png",
-      "firstName": "Cole",
-      "lastName": "Perfetti"
-    },
-    "ridgeAttractivenessScore": 3.2118895053863525
-  },
-  {
-    "rank": 293,
-    "player": {
-      "id": 8480069,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8480069.png",
-      "firstName": "Cale",
-      "lastName": "Makar"
-    },
-    "ridgeAttractivenessScore": 3.2118682861328125
-  },
-  {
-    "rank": 294,
-    "player": {
-      "id": 8473994,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8473994.png",
-      "firstName": "Jamie",
-      "lastName": "Benn"
-    },
-    "ridgeAttractivenessScore": 3.2108640670776367
-  },
-  {
-    "rank": 295,
-    "player": {
-      "id": 8480835,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8480835.png",
-      "firstName": "Jack",
-      "lastName": "Drury"
-    },
-    "ridgeAttractivenessScore": 3.2106566429138184
-  },
-  {
-    "rank": 296,
-    "player": {
-      "id": 8477845,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8477845.png",
-      "firstName": "Trevor",
-      "lastName": "van Riemsdyk"
-    },
-    "ridgeAttractivenessScore": 3.2088639736175537
-  },
-  {
-    "rank": 297,
-    "player": {
-      "id": 8480336,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8480336.png",
-      "firstName": "Sean",
-      "lastName": "Walker"
-    },
-    "ridgeAttractivenessScore": 3.208792209625244
-  },
-  {
-    "rank": 298,
-    "player": {
-      "id": 8482809,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8482809.png",
-      "firstName": "Jackson",
-      "lastName": "Blake"
-    },
-    "ridgeAttractivenessScore": 3.207961320877075
-  },
-  {
-    "rank": 299,
-    "player": {
-      "id": 8479982,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8479982.png",
-      "firstName": "Conor",
-      "lastName": "Timmins"
-    },
-    "ridgeAttractivenessScore": 3.207834482192993
-  },
-  {
-    "rank": 300,
-    "player": {
-      "id": 8477506,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8477506.png",
-      "firstName": "Ryan",
-      "lastName": "Pulock"
-    },
-    "ridgeAttractivenessScore": 3.2046499252319336
-  },
-  {
-    "rank": 301,
-    "player": {
-      "id": 8477494,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8477494.png",
-      "firstName": "Jonathan",
-      "lastName": "Drouin"
-    },
-    "ridgeAttractivenessScore": 3.204570770263672
-  },
-  {
-    "rank": 302,
-    "player": {
-      "id": 8484783,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8484783.png",
-      "firstName": "Artyom",
-      "lastName": "Levshunov"
-    },
-    "ridgeAttractivenessScore": 3.203772783279419
-  },
-  {
-    "rank": 303,
-    "player": {
-      "id": 8479638,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8479638.png",
-      "firstName": "Justin",
-      "lastName": "Brazeau"
-    },
-    "ridgeAttractivenessScore": 3.203620195388794
-  },
-  {
-    "rank": 304,
-    "player": {
-      "id": 8477480,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8477480.png",
-      "firstName": "Eric",
-      "lastName": "Comrie"
-    },
-    "ridgeAttractivenessScore": 3.203615665435791
-  },
-  {
-    "rank": 305,
-    "player": {
-      "id": 8484144,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8484144.png",
-      "firstName": "Connor",
-      "lastName": "Bedard"
-    },
-    "ridgeAttractivenessScore": 3.2034430503845215
-  },
-  {
-    "rank": 306,
-    "player": {
-      "id": 8480196,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8480196.png",
-      "firstName": "Jacob",
-      "lastName": "Bryson"
-    },
-    "ridgeAttractivenessScore": 3.2023658752441406
-  },
-  {
-    "rank": 307,
-    "player": {
-      "id": 8482445,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8482445.png",
-      "firstName": "Devin",
-      "lastName": "Cooley"
-    },
-    "ridgeAttractivenessScore": 3.2013425827026367
-  },
-  {
-    "rank": 308,
-    "player": {
-      "id": 8480817,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8480817.png",
-      "firstName": "K'Andre",
-      "lastName": "Miller"
-    },
-    "ridgeAttractivenessScore": 3.2011404037475586
-  },
-  {
-    "rank": 309,
-    "player": {
-      "id": 8473512,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8473512.png",
-      "firstName": "Claude",
-      "lastName": "Giroux"
-    },
-    "ridgeAttractivenessScore": 3.2008445262908936
-  },
-  {
-    "rank": 310,
-    "player": {
-      "id": 8482103,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8482103.png",
-      "firstName": "Ozzy",
-      "lastName": "Wiesblatt"
-    },
-    "ridgeAttractivenessScore": 3.1989762783050537
-  },
-  {
-    "rank": 311,
-    "player": {
-      "id": 8481726,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8481726.png",
-      "firstName": "Adam",
-      "lastName": "Edstrom"
-    },
-    "ridgeAttractivenessScore": 3.1973228454589844
-  },
-  {
-    "rank": 312,
-    "player": {
-      "id": 8473604,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8473604.png",
-      "firstName": "Jonathan",
-      "lastName": "Toews"
-    },
-    "ridgeAttractivenessScore": 3.196333408355713
-  },
-  {
-    "rank": 313,
-    "player": {
-      "id": 8476871,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8476871.png",
-      "firstName": "Tanner",
-      "lastName": "Pearson"
-    },
-    "ridgeAttractivenessScore": 3.1955416202545166
-  },
-  {
-    "rank": 314,
-    "player": {
-      "id": 8479361,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8479361.png",
-      "firstName": "Joseph",
-      "lastName": "Woll"
-    },
-    "ridgeAttractivenessScore": 3.1953177452087402
-  },
-  {
-    "rank": 315,
-    "player": {
-      "id": 8484801,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8484801.png",
-      "firstName": "Macklin",
-      "lastName": "Celebrini"
-    },
-    "ridgeAttractivenessScore": 3.1933274269104004
-  },
-  {
-    "rank": 316,
-    "player": {
-      "id": 8479365,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8479365.png",
-      "firstName": "Trent",
-      "lastName": "Frederic"
-    },
-    "ridgeAttractivenessScore": 3.1921753883361816
-  },
-  {
-    "rank": 317,
-    "player": {
-      "id": 8475754,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8475754.png",
-      "firstName": "Brock",
-      "lastName": "Nelson"
-    },
-    "ridgeAttractivenessScore": 3.1910767555236816
-  },
-  {
-    "rank": 318,
-    "player": {
-      "id": 8478048,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8478048.png",
-      "firstName": "Igor",
-      "lastName": "Shesterkin"
-    },
-    "ridgeAttractivenessScore": 3.1910758018493652
-  },
-  {
-    "rank": 319,
-    "player": {
-      "id": 8476468,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8476468.png",
-      "firstName": "J.T.",
-      "lastName": "Miller"
-    },
-    "ridgeAttractivenessScore": 3.1910486221313477
-  },
-  {
-    "rank": 320,
-    "player": {
-      "id": 8475324,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8475324.png",
-      "firstName": "Nick",
-      "lastName": "Jensen"
-    },
-    "ridgeAttractivenessScore": 3.190747022628784
-  },
-  {
-    "rank": 321,
-    "player": {
-      "id": 8478882,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8478882.png",
-      "firstName": "Vladislav",
-      "lastName": "Gavrikov"
-    },
-    "ridgeAttractivenessScore": 3.1903719902038574
-  },
-  {
-    "rank": 322,
-    "player": {
-      "id": 8475798,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8475798.png",
-      "firstName": "Mikael",
-      "lastName": "Granlund"
-    },
-    "ridgeAttractivenessScore": 3.1900947093963623
-  },
-  {
-    "rank": 323,
-    "player": {
-      "id": 8478460,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8478460.png",
-      "firstName": "Zach",
-      "lastName": "Werenski"
-    },
-    "ridgeAttractivenessScore": 3.18902850151062
-  },
-  {
-    "rank": 324,
-    "player": {
-      "id": 8480950,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8480950.png",
-      "firstName": "Ilya",
-      "lastName": "Lyubushkin"
-    },
-    "ridgeAttractivenessScore": 3.1877715587615967
-  },
-  {
-    "rank": 325,
-    "player": {
-      "id": 8481557,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8481557.png",
-      "firstName": "Matt",
-      "lastName": "Boldy"
-    },
-    "ridgeAttractivenessScore": 3.187188148498535
-  },
-  {
-    "rank": 326,
-    "player": {
-      "id": 8479591,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8479591.png",
-      "firstName": "Michael",
-      "lastName": "Eyssimont"
-    },
-    "ridgeAttractivenessScore": 3.186192035675049
-  },
-  {
-    "rank": 327,
-    "player": {
-      "id": 8474612,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8474612.png",
-      "firstName": "Travis",
-      "lastName": "Hamonic"
-    },
-    "ridgeAttractivenessScore": 3.1841816902160645
-  },
-  {
-    "rank": 328,
-    "player": {
-      "id": 8478042,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8478042.png",
-      "firstName": "Viktor",
-      "lastName": "Arvidsson"
-    },
-    "ridgeAttractivenessScore": 3.182152509689331
-  },
-  {
-    "rank": 329,
-    "player": {
-      "id": 8478233,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8478233.png",
-      "firstName": "Andrew",
-      "lastName": "Mangiapane"
-    },
-    "ridgeAttractivenessScore": 3.182126522064209
-  },
-  {
-    "rank": 330,
-    "player": {
-      "id": 8480448,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8480448.png",
-      "firstName": "Parker",
-      "lastName": "Kelly"
-    },
-    "ridgeAttractivenessScore": 3.1789777278900146
-  },
-  {
-    "rank": 331,
-    "player": {
-      "id": 8481523,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8481523.png",
-      "firstName": "Kirby",
-      "lastName": "Dach"
-    },
-    "ridgeAttractivenessScore": 3.178121328353882
-  },
-  {
-    "rank": 332,
-    "player": {
-      "id": 8477950,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8477950.png",
-      "firstName": "Tony",
-      "lastName": "DeAngelo"
-    },
-    "ridgeAttractivenessScore": 3.175879955291748
-  },
-  {
-    "rank": 333,
-    "player": {
-      "id": 8482470,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8482470.png",
-      "firstName": "Ilya",
-      "lastName": "Solovyov"
-    },
-    "ridgeAttractivenessScore": 3.175558567047119
-  },
-  {
-    "rank": 334,
-    "player": {
-      "id": 8480003,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8480003.png",
-      "firstName": "Jesper",
-      "lastName": "Boqvist"
-    },
-    "ridgeAttractivenessScore": 3.174600124359131
-  },
-  {
-    "rank": 335,
-    "player": {
-      "id": 8479402,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8479402.png",
-      "firstName": "Jake",
-      "lastName": "Bean"
-    },
-    "ridgeAttractivenessScore": 3.1744608879089355
-  },
-  {
-    "rank": 336,
-    "player": {
-      "id": 8482679,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8482679.png",
-      "firstName": "Matt",
-      "lastName": "Coronato"
-    },
-    "ridgeAttractivenessScore": 3.172823905944824
-  },
-  {
-    "rank": 337,
-    "player": {
-      "id": 8478462,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8478462.png",
-      "firstName": "Nicolas",
-      "lastName": "Roy"
-    },
-    "ridgeAttractivenessScore": 3.1727688312530518
-  },
-  {
-    "rank": 338,
-    "player": {
-      "id": 8483450,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8483450.png",
-      "firstName": "Ryan",
-      "lastName": "Greene"
-    },
-    "ridgeAttractivenessScore": 3.171729326248169
-  },
-  {
-    "rank": 339,
-    "player": {
-      "id": 8475755,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8475755.png",
-      "firstName": "Alexander",
-      "lastName": "Petrovic"
-    },
-    "ridgeAttractivenessScore": 3.170051336288452
-  },
-  {
-    "rank": 340,
-    "player": {
-      "id": 8481477,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8481477.png",
-      "firstName": "Nico",
-      "lastName": "Sturm"
-    },
-    "ridgeAttractivenessScore": 3.169562578201294
-  },
-  {
-    "rank": 341,
-    "player": {
-      "id": 8479983,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8479983.png",
-      "firstName": "Mario",
-      "lastName": "Ferraro"
-    },
-    "ridgeAttractivenessScore": 3.1681180000305176
-  },
-  {
-    "rank": 342,
-    "player": {
-      "id": 8475753,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8475753.png",
-      "firstName": "Justin",
-      "lastName": "Faulk"
-    },
-    "ridgeAttractivenessScore": 3.1676361560821533
-  },
-  {
-    "rank": 343,
-    "player": {
-      "id": 8477496,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8477496.png",
-      "firstName": "Elias",
-      "lastName": "Lindholm"
-    },
-    "ridgeAttractivenessScore": 3.165982246398926
-  },
-  {
-    "rank": 344,
-    "player": {
-      "id": 8480995,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8480995.png",
-      "firstName": "Pontus",
-      "lastName": "Holmberg"
-    },
-    "ridgeAttractivenessScore": 3.164825439453125
-  },
-  {
-    "rank": 345,
-    "player": {
-      "id": 8481655,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8481655.png",
-      "firstName": "Cole",
-      "lastName": "Schwindt"
-    },
-    "ridgeAttractivenessScore": 3.1638989448547363
-  },
-  {
-    "rank": 346,
-    "player": {
-      "id": 8479372,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8479372.png",
-      "firstName": "Joshua",
-      "lastName": "Mahura"
-    },
-    "ridgeAttractivenessScore": 3.163111925125122
-  },
-  {
-    "rank": 347,
-    "player": {
-      "id": 8475768,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8475768.png",
-      "firstName": "Jaden",
-      "lastName": "Schwartz"
-    },
-    "ridgeAttractivenessScore": 3.162938356399536
-  },
-  {
-    "rank": 348,
-    "player": {
-      "id": 8480049,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8480049.png",
-      "firstName": "Dylan",
-      "lastName": "Samberg"
-    },
-    "ridgeAttractivenessScore": 3.16180419921875
-  },
-  {
-    "rank": 349,
-    "player": {
-      "id": 8479378,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8479378.png",
-      "firstName": "Logan",
-      "lastName": "Stanley"
-    },
-    "ridgeAttractivenessScore": 3.161442995071411
-  },
-  {
-    "rank": 350,
-    "player": {
-      "id": 8475906,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8475906.png",
-      "firstName": "John",
-      "lastName": "Klingberg"
-    },
-    "ridgeAttractivenessScore": 3.1606011390686035
-  },
-  {
-    "rank": 351,
-    "player": {
-      "id": 8476463,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8476463.png",
-      "firstName": "Jonas",
-      "lastName": "Brodin"
-    },
-    "ridgeAttractivenessScore": 3.159816265106201
-  },
-  {
-    "rank": 352,
-    "player": {
-      "id": 8481540,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8481540.png",
-      "firstName": "Cole",
-      "lastName": "Caufield"
-    },
-    "ridgeAttractivenessScore": 3.1591973304748535
-  },
-  {
-    "rank": 353,
-    "player": {
-      "id": 8476887,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8476887.png",
-      "firstName": "Filip",
-      "lastName": "Forsberg"
-    },
-    "ridgeAttractivenessScore": 3.1573598384857178
-  },
-  {
-    "rank": 354,
-    "player": {
-      "id": 8477501,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8477501.png",
-      "firstName": "Valeri",
-      "lastName": "Nichushkin"
-    },
-    "ridgeAttractivenessScore": 3.156904697418213
-  },
-  {
-    "rank": 355,
-    "player": {
-      "id": 8477989,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8477989.png",
-      "firstName": "Christian",
-      "lastName": "Dvorak"
-    },
-    "ridgeAttractivenessScore": 3.156378746032715
-  },
-  {
-    "rank": 356,
-    "player": {
-      "id": 8476958,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8476958.png",
-      "firstName": "Jaccob",
-      "lastName": "Slavin"
-    },
-    "ridgeAttractivenessScore": 3.154799699783325
-  },
-  {
-    "rank": 357,
-    "player": {
-      "id": 8478854,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8478854.png",
-      "firstName": "Ryan",
-      "lastName": "Shea"
-    },
-    "ridgeAttractivenessScore": 3.154106616973877
-  },
-  {
-    "rank": 358,
-    "player": {
-      "id": 8476460,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8476460.png",
-      "firstName": "Mark",
-      "lastName": "Scheifele"
-    },
-    "ridgeAttractivenessScore": 3.152348279953003
-  },
-  {
-    "rank": 359,
-    "player": {
-      "id": 8475314,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8475314.png",
-      "firstName": "Anders",
-      "lastName": "Lee"
-    },
-    "ridgeAttractivenessScore": 3.152179718017578
-  },
-  {
-    "rank": 360,
-    "player": {
-      "id": 8479369,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8479369.png",
-      "firstName": "Andrew",
-      "lastName": "Peeke"
-    },
-    "ridgeAttractivenessScore": 3.151115894317627
-  },
-  {
-    "rank": 361,
-    "player": {
-      "id": 8478402,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8478402.png",
-      "firstName": "Connor",
-      "lastName": "McDavid"
-    },
-    "ridgeAttractivenessScore": 3.150050401687622
-  },
-  {
-    "rank": 362,
-    "player": {
-      "id": 8480839,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8480839.png",
-      "firstName": "Rasmus",
-      "lastName": "Dahlin"
-    },
-    "ridgeAttractivenessScore": 3.1492083072662354
-  },
-  {
-    "rank": 363,
-    "player": {
-      "id": 8477979,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8477979.png",
-      "firstName": "Nicolas",
-      "lastName": "Aube-Kubel"
-    },
-    "ridgeAttractivenessScore": 3.1475250720977783
-  },
-  {
-    "rank": 364,
-    "player": {
-      "id": 8479343,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8479343.png",
-      "firstName": "Clayton",
-      "lastName": "Keller"
-    },
-    "ridgeAttractivenessScore": 3.147456407546997
-  },
-  {
-    "rank": 365,
-    "player": {
-      "id": 8481606,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8481606.png",
-      "firstName": "Jordan",
-      "lastName": "Spence"
-    },
-    "ridgeAttractivenessScore": 3.1467597484588623
-  },
-  {
-    "rank": 366,
-    "player": {
-      "id": 8477404,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8477404.png",
-      "firstName": "Jake",
-      "lastName": "Guentzel"
-    },
-    "ridgeAttractivenessScore": 3.1447830200195312
-  },
-  {
-    "rank": 367,
-    "player": {
-      "id": 8476875,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8476875.png",
-      "firstName": "Mike",
-      "lastName": "Matheson"
-    },
-    "ridgeAttractivenessScore": 3.1446585655212402
-  },
-  {
-    "rank": 368,
-    "player": {
-      "id": 8479675,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8479675.png",
-      "firstName": "Trevor",
-      "lastName": "Moore"
-    },
-    "ridgeAttractivenessScore": 3.1441545486450195
-  },
-  {
-    "rank": 369,
-    "player": {
-      "id": 8479944,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8479944.png",
-      "firstName": "Zachary",
-      "lastName": "Aston-Reese"
-    },
-    "ridgeAttractivenessScore": 3.142486810684204
-  },
-  {
-    "rank": 370,
-    "player": {
-      "id": 8483524,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8483524.png",
-      "firstName": "Shane",
-      "lastName": "Wright"
-    },
-    "ridgeAttractivenessScore": 3.1422433853149414
-  },
-  {
-    "rank": 371,
-    "player": {
-      "id": 8480798,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8480798.png",
-      "firstName": "Philipp",
-      "lastName": "Kurashev"
-    },
-    "ridgeAttractivenessScore": 3.141677141189575
-  },
-  {
-    "rank": 372,
-    "player": {
-      "id": 8483710,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8483710.png",
-      "firstName": "Dennis",
-      "lastName": "Hildeby"
-    },
-    "ridgeAttractivenessScore": 3.141176700592041
-  },
-  {
-    "rank": 373,
-    "player": {
-      "id": 8481491,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8481491.png",
-      "firstName": "Noah",
-      "lastName": "Philp"
-    },
-    "ridgeAttractivenessScore": 3.1406567096710205
-  },
-  {
-    "rank": 374,
-    "player": {
-      "id": 8479985,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8479985.png",
-      "firstName": "Cale",
-      "lastName": "Fleury"
-    },
-    "ridgeAttractivenessScore": 3.1392884254455566
-  },
-  {
-    "rank": 375,
-    "player": {
-      "id": 8479977,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8479977.png",
-      "firstName": "Kailer",
-      "lastName": "Yamamoto"
-    },
-    "ridgeAttractivenessScore": 3.1379623413085938
-  },
-  {
-    "rank": 376,
-    "player": {
-      "id": 8475799,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8475799.png",
-      "firstName": "Nino",
-      "lastName": "Niederreiter"
-    },
-    "ridgeAttractivenessScore": 3.1376771926879883
-  },
-  {
-    "rank": 377,
-    "player": {
-      "id": 8476988,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8476988.png",
-      "firstName": "Matt",
-      "lastName": "Benning"
-    },
-    "ridgeAttractivenessScore": 3.1370551586151123
-  },
-  {
-    "rank": 378,
-    "player": {
-      "id": 8476885,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8476885.png",
-      "firstName": "Jacob",
-      "lastName": "Trouba"
-    },
-    "ridgeAttractivenessScore": 3.136552572250366
-  },
-  {
-    "rank": 379,
-    "player": {
-      "id": 8479371,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8479371.png",
-      "firstName": "Dante",
-      "lastName": "Fabbro"
-    },
-    "ridgeAttractivenessScore": 3.136223554611206
-  },
-  {
-    "rank": 380,
-    "player": {
-      "id": 8479998,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8479998.png",
-      "firstName": "Mikey",
-      "lastName": "Anderson"
-    },
-    "ridgeAttractivenessScore": 3.1340558528900146
-  },
-  {
-    "rank": 381,
-    "player": {
-      "id": 8476467,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8476467.png",
-      "firstName": "Jamie",
-      "lastName": "Oleksiak"
-    },
-    "ridgeAttractivenessScore": 3.1331374645233154
-  },
-  {
-    "rank": 382,
-    "player": {
-      "id": 8478438,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8478438.png",
-      "firstName": "Tommy",
-      "lastName": "Novak"
-    },
-    "ridgeAttractivenessScore": 3.1328415870666504
-  },
-  {
-    "rank": 383,
-    "player": {
-      "id": 8476879,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8476879.png",
-      "firstName": "Cody",
-      "lastName": "Ceci"
-    },
-    "ridgeAttractivenessScore": 3.132502794265747
-  },
-  {
-    "rank": 384,
-    "player": {
-      "id": 8483485,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8483485.png",
-      "firstName": "Denton",
-      "lastName": "Mateychuk"
-    },
-    "ridgeAttractivenessScore": 3.130525588989258
-  },
-  {
-    "rank": 385,
-    "player": {
-      "id": 8484180,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8484180.png",
-      "firstName": "Samuel",
-      "lastName": "Honzek"
-    },
-    "ridgeAttractivenessScore": 3.1301164627075195
-  },
-  {
-    "rank": 386,
-    "player": {
-      "id": 8478109,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8478109.png",
-      "firstName": "Victor",
-      "lastName": "Olofsson"
-    },
-    "ridgeAttractivenessScore": 3.1295907497406006
-  },
-  {
-    "rank": 387,
-    "player": {
-      "id": 8476457,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8476457.png",
-      "firstName": "Adam",
-      "lastName": "Larsson"
-    },
-    "ridgeAttractivenessScore": 3.1295664310455322
-  },
-  {
-    "rank": 388,
-    "player": {
-      "id": 8481601,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8481601.png",
-      "firstName": "Simon",
-      "lastName": "Holmstrom"
-    },
-    "ridgeAttractivenessScore": 3.1281280517578125
-  },
-  {
-    "rank": 389,
-    "player": {
-      "id": 8477903,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8477903.png",
-      "firstName": "Garnet",
-      "lastName": "Hathaway"
-    },
-    "ridgeAttractivenessScore": 3.1280784606933594
-  },
-  {
-    "rank": 390,
-    "player": {
-      "id": 8482703,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8482703.png",
-      "firstName": "Colton",
-      "lastName": "Dach"
-    },
-    "ridgeAttractivenessScore": 3.1279611587524414
-  },
-  {
-    "rank": 391,
-    "player": {
-      "id": 8479987,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8479987.png",
-      "firstName": "Morgan",
-      "lastName": "Geekie"
-    },
-    "ridgeAttractivenessScore": 3.126852512359619
-  },
-  {
-    "rank": 392,
-    "player": {
-      "id": 8481535,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8481535.png",
-      "firstName": "Nils",
-      "lastName": "Hoglander"
-    },
-    "ridgeAttractivenessScore": 3.1266515254974365
-  },
-  {
-    "rank": 393,
-    "player": {
-      "id": 8482077,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8482077.png",
-      "firstName": "Dylan",
-      "lastName": "Holloway"
-    },
-    "ridgeAttractivenessScore": 3.12650728225708
-  },
-  {
-    "rank": 394,
-    "player": {
-      "id": 8483489,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8483489.png",
-      "firstName": "Fraser",
-      "lastName": "Minten"
-    },
-    "ridgeAttractivenessScore": 3.125520944595337
-  },
-  {
-    "rank": 395,
-    "player": {
-      "id": 8479941,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8479941.png",
-      "firstName": "Justin",
-      "lastName": "Danforth"
-    },
-    "ridgeAttractivenessScore": 3.123520612716675
-  },
-  {
-    "rank": 396,
-    "player": {
-      "id": 8477454,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8477454.png",
-      "firstName": "Adam",
-      "lastName": "Erne"
-    },
-    "ridgeAttractivenessScore": 3.1228830814361572
-  },
-  {
-    "rank": 397,
-    "player": {
-      "id": 8479292,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8479292.png",
-      "firstName": "Charlie",
-      "lastName": "Lindgren"
-    },
-    "ridgeAttractivenessScore": 3.1227498054504395
-  },
-  {
-    "rank": 398,
-    "player": {
-      "id": 8484911,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8484911.png",
-      "firstName": "Collin",
-      "lastName": "Graf"
-    },
-    "ridgeAttractivenessScore": 3.122222423553467
-  },
-  {
-    "rank": 399,
-    "player": {
-      "id": 8481551,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8481551.png",
-      "firstName": "Colten",
-      "lastName": "Ellis"
-    },
-    "ridgeAttractivenessScore": 3.1221752166748047
-  },
-  {
-    "rank": 400,
-    "player": {
-      "id": 8481032,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8481032.png",
-      "firstName": "Paul",
-      "lastName": "Cotter"
-    },
-    "ridgeAttractivenessScore": 3.121758222579956
-  },
-  {
-    "rank": 401,
-    "player": {
-      "id": 8482858,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8482858.png",
-      "firstName": "Ryker",
-      "lastName": "Evans"
-    },
-    "ridgeAttractivenessScore": 3.1215364933013916
-  },
-  {
-    "rank": 402,
-    "player": {
-      "id": 8482131,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8482131.png",
-      "firstName": "Donovan",
-      "lastName": "Sebrango"
-    },
-    "ridgeAttractivenessScore": 3.121189594268799
-  },
-  {
-    "rank": 403,
-    "player": {
-      "id": 8475158,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8475158.png",
-      "firstName": "Ryan",
-      "lastName": "O'Reilly"
-    },
-    "ridgeAttractivenessScore": 3.1211862564086914
-  },
-  {
-    "rank": 404,
-    "player": {
-      "id": 8478569,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8478569.png",
-      "firstName": "Noel",
-      "lastName": "Acciari"
-    },
-    "ridgeAttractivenessScore": 3.1211178302764893
-  },
-  {
-    "rank": 405,
-    "player": {
-      "id": 8475188,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8475188.png",
-      "firstName": "Brayden",
-      "lastName": "McNabb"
-    },
-    "ridgeAttractivenessScore": 3.119969606399536
-  },
-  {
-    "rank": 406,
-    "player": {
-      "id": 8480434,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8480434.png",
-      "firstName": "Sean",
-      "lastName": "Durzi"
-    },
-    "ridgeAttractivenessScore": 3.119680166244507
-  },
-  {
-    "rank": 407,
-    "player": {
-      "id": 8482092,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8482092.png",
-      "firstName": "Ridly",
-      "lastName": "Greig"
-    },
-    "ridgeAttractivenessScore": 3.119504690170288
-  },
-  {
-    "rank": 408,
-    "player": {
-      "id": 8478463,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8478463.png",
-      "firstName": "Anthony",
-      "lastName": "Beauvillier"
-    },
-    "ridgeAttractivenessScore": 3.118152379989624
-  },
-  {
-    "rank": 409,
-    "player": {
-      "id": 8475184,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8475184.png",
-      "firstName": "Chris",
-      "lastName": "Kreider"
-    },
-    "ridgeAttractivenessScore": 3.117734432220459
-  },
-  {
-    "rank": 410,
-    "player": {
-      "id": 8478444,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8478444.png",
-      "firstName": "Brock",
-      "lastName": "Boeser"
-    },
-    "ridgeAttractivenessScore": 3.116386890411377
-  },
-  {
-    "rank": 411,
-    "player": {
-      "id": 8482062,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8482062.png",
-      "firstName": "Cole",
-      "lastName": "Smith"
-    },
-    "ridgeAttractivenessScore": 3.115726947784424
-  },
-  {
-    "rank": 412,
-    "player": {
-      "id": 8480748,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8480748.png",
-      "firstName": "Kiefer",
-      "lastName": "Sherwood"
-    },
-    "ridgeAttractivenessScore": 3.1149919033050537
-  },
-  {
-    "rank": 413,
-    "player": {
-      "id": 8483771,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8483771.png",
-      "firstName": "Sandis",
-      "lastName": "Vilmanis"
-    },
-    "ridgeAttractivenessScore": 3.1148300170898438
-  },
-  {
-    "rank": 414,
-    "player": {
-      "id": 8478872,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8478872.png",
-      "firstName": "Karel",
-      "lastName": "Vejmelka"
-    },
-    "ridgeAttractivenessScore": 3.1147701740264893
-  },
-  {
-    "rank": 415,
-    "player": {
-      "id": 8481554,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8481554.png",
-      "firstName": "Kaapo",
-      "lastName": "Kakko"
-    },
-    "ridgeAttractivenessScore": 3.113865613937378
-  },
-  {
-    "rank": 416,
-    "player": {
-      "id": 8481133,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8481133.png",
-      "firstName": "Cole",
-      "lastName": "Reinhardt"
-    },
-    "ridgeAttractivenessScore": 3.1132876873016357
-  },
-  {
-    "rank": 417,
-    "player": {
-      "id": 8484829,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8484829.png",
-      "firstName": "Justin",
-      "lastName": "Hryckowian"
-    },
-    "ridgeAttractivenessScore": 3.110638380050659
-  },
-  {
-    "rank": 418,
-    "player": {
-      "id": 8482947,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8482947.png",
-      "firstName": "Zakhar",
-      "lastName": "Bardakov"
-    },
-    "ridgeAttractivenessScore": 3.1091370582580566
-  },
-  {
-    "rank": 419,
-    "player": {
-      "id": 8473533,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8473533.png",
-      "firstName": "Jordan",
-      "lastName": "Staal"
-    },
-    "ridgeAttractivenessScore": 3.1077792644500732
-  },
-  {
-    "rank": 420,
-    "player": {
-      "id": 8480860,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8480860.png",
-      "firstName": "Kevin",
-      "lastName": "Bahl"
-    },
-    "ridgeAttractivenessScore": 3.1069447994232178
-  },
-  {
-    "rank": 421,
-    "player": {
-      "id": 8477018,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8477018.png",
-      "firstName": "Ben",
-      "lastName": "Hutton"
-    },
-    "ridgeAttractivenessScore": 3.1061129570007324
-  },
-  {
-    "rank": 422,
-    "player": {
-      "id": 8478975,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8478975.png",
-      "firstName": "Mason",
-      "lastName": "Marchment"
-    },
-    "ridgeAttractivenessScore": 3.1060314178466797
-  },
-  {
-    "rank": 423,
-    "player": {
-      "id": 8480014,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8480014.png",
-      "firstName": "Gabriel",
-      "lastName": "Vilardi"
-    },
-    "ridgeAttractivenessScore": 3.104381561279297
-  },
-  {
-    "rank": 424,
-    "player": {
-      "id": 8482496,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8482496.png",
-      "firstName": "Nils",
-      "lastName": "Aman"
-    },
-    "ridgeAttractivenessScore": 3.1036581993103027
-  },
-  {
-    "rank": 425,
-    "player": {
-      "id": 8478971,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8478971.png",
-      "firstName": "Connor",
-      "lastName": "Ingram"
-    },
-    "ridgeAttractivenessScore": 3.1031694412231445
-  },
-  {
-    "rank": 426,
-    "player": {
-      "id": 8479398,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8479398.png",
-      "firstName": "Samuel",
-      "lastName": "Girard"
-    },
-    "ridgeAttractivenessScore": 3.0985348224639893
-  },
-  {
-    "rank": 427,
-    "player": {
-      "id": 8477498,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8477498.png",
-      "firstName": "Darnell",
-      "lastName": "Nurse"
-    },
-    "ridgeAttractivenessScore": 3.0983011722564697
-  },
-  {
-    "rank": 428,
-    "player": {
-      "id": 8477500,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8477500.png",
-      "firstName": "Bo",
-      "lastName": "Horvat"
-    },
-    "ridgeAttractivenessScore": 3.098125457763672
-  },
-  {
-    "rank": 429,
-    "player": {
-      "id": 8480145,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8480145.png",
-      "firstName": "Neal",
-      "lastName": "Pionk"
-    },
-    "ridgeAttractivenessScore": 3.0971248149871826
-  },
-  {
-    "rank": 430,
-    "player": {
-      "id": 8479022,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8479022.png",
-      "firstName": "Rodrigo",
-      "lastName": "Abols"
-    },
-    "ridgeAttractivenessScore": 3.0964412689208984
-  },
-  {
-    "rank": 431,
-    "player": {
-      "id": 8484798,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8484798.png",
-      "firstName": "Zeev",
-      "lastName": "Buium"
-    },
-    "ridgeAttractivenessScore": 3.096011161804199
-  },
-  {
-    "rank": 432,
-    "player": {
-      "id": 8478499,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8478499.png",
-      "firstName": "Adin",
-      "lastName": "Hill"
-    },
-    "ridgeAttractivenessScore": 3.095224618911743
-  },
-  {
-    "rank": 433,
-    "player": {
-      "id": 8479421,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8479421.png",
-      "firstName": "Jacob",
-      "lastName": "Moverare"
-    },
-    "ridgeAttractivenessScore": 3.0940027236938477
-  },
-  {
-    "rank": 434,
-    "player": {
-      "id": 8482159,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8482159.png",
-      "firstName": "Tyson",
-      "lastName": "Foerster"
-    },
-    "ridgeAttractivenessScore": 3.0937466621398926
-  },
-  {
-    "rank": 435,
-    "player": {
-      "id": 8476925,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8476925.png",
-      "firstName": "Colton",
-      "lastName": "Sissons"
-    },
-    "ridgeAttractivenessScore": 3.093740940093994
-  },
-  {
-    "rank": 436,
-    "player": {
-      "id": 8474090,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8474090.png",
-      "firstName": "Brendan",
-      "lastName": "Smith"
-    },
-    "ridgeAttractivenessScore": 3.093188524246216
-  },
-  {
-    "rank": 437,
-    "player": {
-      "id": 8479312,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8479312.png",
-      "firstName": "Alex",
-      "lastName": "Lyon"
-    },
-    "ridgeAttractivenessScore": 3.0930795669555664
-  },
-  {
-    "rank": 438,
-    "player": {
-      "id": 8484762,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8484762.png",
-      "firstName": "Beckett",
-      "lastName": "Sennecke"
-    },
-    "ridgeAttractivenessScore": 3.092489242553711
-  },
-  {
-    "rank": 439,
-    "player": {
-      "id": 8480891,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8480891.png",
-      "firstName": "Michael",
-      "lastName": "Kesselring"
-    },
-    "ridgeAttractivenessScore": 3.0896589756011963
-  },
-  {
-    "rank": 440,
-    "player": {
-      "id": 8476462,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8476462.png",
-      "firstName": "Dougie",
-      "lastName": "Hamilton"
-    },
-    "ridgeAttractivenessScore": 3.088348150253296
-  },
-  {
-    "rank": 441,
-    "player": {
-      "id": 8479337,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8479337.png",
-      "firstName": "Alex",
-      "lastName": "DeBrincat"
-    },
-    "ridgeAttractivenessScore": 3.087411403656006
-  },
-  {
-    "rank": 442,
-    "player": {
-      "id": 8482094,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8482094.png",
-      "firstName": "Daemon",
-      "lastName": "Hunt"
-    },
-    "ridgeAttractivenessScore": 3.08602237701416
-  },
-  {
-    "rank": 443,
-    "player": {
-      "id": 8482684,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8482684.png",
-      "firstName": "Luke",
-      "lastName": "Hughes"
-    },
-    "ridgeAttractivenessScore": 3.0860166549682617
-  },
-  {
-    "rank": 444,
-    "player": {
-      "id": 8474102,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8474102.png",
-      "firstName": "David",
-      "lastName": "Perron"
-    },
-    "ridgeAttractivenessScore": 3.0859994888305664
-  },
-  {
-    "rank": 445,
-    "player": {
-      "id": 8478439,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8478439.png",
-      "firstName": "Travis",
-      "lastName": "Konecny"
-    },
-    "ridgeAttractivenessScore": 3.0852086544036865
-  },
-  {
-    "rank": 446,
-    "player": {
-      "id": 8477952,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8477952.png",
-      "firstName": "Robby",
-      "lastName": "Fabbri"
-    },
-    "ridgeAttractivenessScore": 3.0836522579193115
-  },
-  {
-    "rank": 447,
-    "player": {
-      "id": 8478864,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8478864.png",
-      "firstName": "Kirill",
-      "lastName": "Kaprizov"
-    },
-    "ridgeAttractivenessScore": 3.0836071968078613
-  },
-  {
-    "rank": 448,
-    "player": {
-      "id": 8482259,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8482259.png",
-      "firstName": "Bobby",
-      "lastName": "McMann"
-    },
-    "ridgeAttractivenessScore": 3.0833609104156494
-  },
-  {
-    "rank": 449,
-    "player": {
-      "id": 8482660,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8482660.png",
-      "firstName": "Kent",
-      "lastName": "Johnson"
-    },
-    "ridgeAttractivenessScore": 3.0820200443267822
-  },
-  {
-    "rank": 450,
-    "player": {
-      "id": 8484230,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8484230.png",
-      "firstName": "Otto",
-      "lastName": "Stenberg"
-    },
-    "ridgeAttractivenessScore": 3.081620693206787
-  },
-  {
-    "rank": 451,
-    "player": {
-      "id": 8477149,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8477149.png",
-      "firstName": "Scott",
-      "lastName": "Sabourin"
-    },
-    "ridgeAttractivenessScore": 3.079911708831787
-  },
-  {
-    "rank": 452,
-    "player": {
-      "id": 8484387,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8484387.png",
-      "firstName": "Matvei",
-      "lastName": "Michkov"
-    },
-    "ridgeAttractivenessScore": 3.0785861015319824
-  },
-  {
-    "rank": 453,
-    "player": {
-      "id": 8482116,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8482116.png",
-      "firstName": "Tim",
-      "lastName": "Stützle"
-    },
-    "ridgeAttractivenessScore": 3.0750985145568848
-  },
-  {
-    "rank": 454,
-    "player": {
-      "id": 8481068,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8481068.png",
-      "firstName": "Yegor",
-      "lastName": "Sharangovich"
-    },
-    "ridgeAttractivenessScore": 3.0749173164367676
-  },
-  {
-    "rank": 455,
-    "player": {
-      "id": 8477507,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8477507.png",
-      "firstName": "Nikita",
-      "lastName": "Zadorov"
-    },
-    "ridgeAttractivenessScore": 3.0735185146331787
-  },
-  {
-    "rank": 456,
-    "player": {
-      "id": 8481043,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8481043.png",
-      "firstName": "Cole",
-      "lastName": "Koepke"
-    },
-    "ridgeAttractivenessScore": 3.071669340133667
-  },
-  {
-    "rank": 457,
-    "player": {
-      "id": 8480807,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8480807.png",
-      "firstName": "Mattias",
-      "lastName": "Samuelsson"
-    },
-    "ridgeAttractivenessScore": 3.071178436279297
-  },
-  {
-    "rank": 458,
-    "player": {
-      "id": 8480036,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8480036.png",
-      "firstName": "Miro",
-      "lastName": "Heiskanen"
-    },
-    "ridgeAttractivenessScore": 3.071033239364624
-  },
-  {
-    "rank": 459,
-    "player": {
-      "id": 8484768,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8484768.png",
-      "firstName": "Zayne",
-      "lastName": "Parekh"
-    },
-    "ridgeAttractivenessScore": 3.069467306137085
-  },
-  {
-    "rank": 460,
-    "player": {
-      "id": 8474189,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8474189.png",
-      "firstName": "Lars",
-      "lastName": "Eller"
-    },
-    "ridgeAttractivenessScore": 3.0691988468170166
-  },
-  {
-    "rank": 461,
-    "player": {
-      "id": 8480865,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8480865.png",
-      "firstName": "Noah",
-      "lastName": "Dobson"
-    },
-    "ridgeAttractivenessScore": 3.0676076412200928
-  },
-  {
-    "rank": 462,
-    "player": {
-      "id": 8475287,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8475287.png",
-      "firstName": "Erik",
-      "lastName": "Haula"
-    },
-    "ridgeAttractivenessScore": 3.067551851272583
-  },
-  {
-    "rank": 463,
-    "player": {
-      "id": 8479420,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8479420.png",
-      "firstName": "Tage",
-      "lastName": "Thompson"
-    },
-    "ridgeAttractivenessScore": 3.067413568496704
-  },
-  {
-    "rank": 464,
-    "player": {
-      "id": 8475848,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8475848.png",
-      "firstName": "Brendan",
-      "lastName": "Gallagher"
-    },
-    "ridgeAttractivenessScore": 3.0647823810577393
-  },
-  {
-    "rank": 465,
-    "player": {
-      "id": 8482089,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8482089.png",
-      "firstName": "Jake",
-      "lastName": "Neighbours"
-    },
-    "ridgeAttractivenessScore": 3.064612865447998
-  },
-  {
-    "rank": 466,
-    "player": {
-      "id": 8479772,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8479772.png",
-      "firstName": "Zack",
-      "lastName": "MacEwen"
-    },
-    "ridgeAttractivenessScore": 3.0633838176727295
-  },
-  {
-    "rank": 467,
-    "player": {
-      "id": 8476892,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8476892.png",
-      "firstName": "Colton",
-      "lastName": "Parayko"
-    },
-    "ridgeAttractivenessScore": 3.062516450881958
-  },
-  {
-    "rank": 468,
-    "player": {
-      "id": 8479370,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8479370.png",
-      "firstName": "Tyson",
-      "lastName": "Jost"
-    },
-    "ridgeAttractivenessScore": 3.0624282360076904
-  },
-  {
-    "rank": 469,
-    "player": {
-      "id": 8476441,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8476441.png",
-      "firstName": "Joel",
-      "lastName": "Edmundson"
-    },
-    "ridgeAttractivenessScore": 3.0619583129882812
-  },
-  {
-    "rank": 470,
-    "player": {
-      "id": 8476979,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8476979.png",
-      "firstName": "Erik",
-      "lastName": "Gustafsson"
-    },
-    "ridgeAttractivenessScore": 3.061584234237671
-  },
-  {
-    "rank": 471,
-    "player": {
-      "id": 8476981,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8476981.png",
-      "firstName": "Josh",
-      "lastName": "Anderson"
-    },
-    "ridgeAttractivenessScore": 3.061422348022461
-  },
-  {
-    "rank": 472,
-    "player": {
-      "id": 8482655,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8482655.png",
-      "firstName": "J.J.",
-      "lastName": "Moser"
-    },
-    "ridgeAttractivenessScore": 3.0607802867889404
-  },
-  {
-    "rank": 473,
-    "player": {
-      "id": 8476927,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8476927.png",
-      "firstName": "Teddy",
-      "lastName": "Blueger"
-    },
-    "ridgeAttractivenessScore": 3.0606541633605957
-  },
-  {
-    "rank": 474,
-    "player": {
-      "id": 8484158,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8484158.png",
-      "firstName": "Easton",
-      "lastName": "Cowan"
-    },
-    "ridgeAttractivenessScore": 3.0605807304382324
-  },
-  {
-    "rank": 475,
-    "player": {
-      "id": 8474564,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8474564.png",
-      "firstName": "Steven",
-      "lastName": "Stamkos"
-    },
-    "ridgeAttractivenessScore": 3.0601391792297363
-  },
-  {
-    "rank": 476,
-    "player": {
-      "id": 8476945,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8476945.png",
-      "firstName": "Connor",
-      "lastName": "Hellebuyck"
-    },
-    "ridgeAttractivenessScore": 3.0600874423980713
-  },
-  {
-    "rank": 477,
-    "player": {
-      "id": 8481668,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8481668.png",
-      "firstName": "Arturs",
-      "lastName": "Silovs"
-    },
-    "ridgeAttractivenessScore": 3.0599539279937744
-  },
-  {
-    "rank": 478,
-    "player": {
-      "id": 8476994,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8476994.png",
-      "firstName": "Vinnie",
-      "lastName": "Hinostroza"
-    },
-    "ridgeAttractivenessScore": 3.058670997619629
-  },
-  {
-    "rank": 479,
-    "player": {
-      "id": 8480878,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8480878.png",
-      "firstName": "Nils",
-      "lastName": "Lundkvist"
-    },
-    "ridgeAttractivenessScore": 3.058011531829834
-  },
-  {
-    "rank": 480,
-    "player": {
-      "id": 8476331,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8476331.png",
-      "firstName": "Dylan",
-      "lastName": "DeMelo"
-    },
-    "ridgeAttractivenessScore": 3.057894468307495
-  },
-  {
-    "rank": 481,
-    "player": {
-      "id": 8481725,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8481725.png",
-      "firstName": "Elmer",
-      "lastName": "Soderblom"
-    },
-    "ridgeAttractivenessScore": 3.05721116065979
-  },
-  {
-    "rank": 482,
-    "player": {
-      "id": 8478454,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8478454.png",
-      "firstName": "Noah",
-      "lastName": "Juulsen"
-    },
-    "ridgeAttractivenessScore": 3.057156562805176
-  },
-  {
-    "rank": 483,
-    "player": {
-      "id": 8478500,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8478500.png",
-      "firstName": "Ivan",
-      "lastName": "Provorov"
-    },
-    "ridgeAttractivenessScore": 3.054027795791626
-  },
-  {
-    "rank": 484,
-    "player": {
-      "id": 8470613,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8470613.png",
-      "firstName": "Brent",
-      "lastName": "Burns"
-    },
-    "ridgeAttractivenessScore": 3.053983211517334
-  },
-  {
-    "rank": 485,
-    "player": {
-      "id": 8483464,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8483464.png",
-      "firstName": "Marco",
-      "lastName": "Kasper"
-    },
-    "ridgeAttractivenessScore": 3.0531704425811768
-  },
-  {
-    "rank": 486,
-    "player": {
-      "id": 8478450,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8478450.png",
-      "firstName": "Parker",
-      "lastName": "Wotherspoon"
-    },
-    "ridgeAttractivenessScore": 3.0527756214141846
-  },
-  {
-    "rank": 487,
-    "player": {
-      "id": 8474150,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8474150.png",
-      "firstName": "Mikael",
-      "lastName": "Backlund"
-    },
-    "ridgeAttractivenessScore": 3.052638053894043
-  },
-  {
-    "rank": 488,
-    "player": {
-      "id": 8481532,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8481532.png",
-      "firstName": "Alex",
-      "lastName": "Turcotte"
-    },
-    "ridgeAttractivenessScore": 3.0519955158233643
-  },
-  {
-    "rank": 489,
-    "player": {
-      "id": 8478413,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8478413.png",
-      "firstName": "Jordan",
-      "lastName": "Greenway"
-    },
-    "ridgeAttractivenessScore": 3.0517807006835938
-  },
-  {
-    "rank": 490,
-    "player": {
-      "id": 8481122,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8481122.png",
-      "firstName": "Simon",
-      "lastName": "Benoit"
-    },
-    "ridgeAttractivenessScore": 3.0516622066497803
-  },
-  {
-    "rank": 491,
-    "player": {
-      "id": 8476456,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8476456.png",
-      "firstName": "Jonathan",
-      "lastName": "Huberdeau"
-    },
-    "ridgeAttractivenessScore": 3.05159068107605
-  },
-  {
-    "rank": 492,
-    "player": {
-      "id": 8482172,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8482172.png",
-      "firstName": "Landon",
-      "lastName": "Slaggert"
-    },
-    "ridgeAttractivenessScore": 3.0506186485290527
-  },
-  {
-    "rank": 493,
-    "player": {
-      "id": 8478891,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8478891.png",
-      "firstName": "Mason",
-      "lastName": "Appleton"
-    },
-    "ridgeAttractivenessScore": 3.049623727798462
-  },
-  {
-    "rank": 494,
-    "player": {
-      "id": 8481754,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8481754.png",
-      "firstName": "Nikita",
-      "lastName": "Nesterenko"
-    },
-    "ridgeAttractivenessScore": 3.0491843223571777
-  },
-  {
-    "rank": 495,
-    "player": {
-      "id": 8482666,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8482666.png",
-      "firstName": "Scott",
-      "lastName": "Morrow"
-    },
-    "ridgeAttractivenessScore": 3.0491116046905518
-  },
-  {
-    "rank": 496,
-    "player": {
-      "id": 8478020,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8478020.png",
-      "firstName": "Michael",
-      "lastName": "Amadio"
-    },
-    "ridgeAttractivenessScore": 3.0479955673217773
-  },
-  {
-    "rank": 497,
-    "player": {
-      "id": 8476889,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8476889.png",
-      "firstName": "Radek",
-      "lastName": "Faksa"
-    },
-    "ridgeAttractivenessScore": 3.0478711128234863
-  },
-  {
-    "rank": 498,
-    "player": {
-      "id": 8476278,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8476278.png",
-      "firstName": "Colin",
-      "lastName": "Blackwell"
-    },
-    "ridgeAttractivenessScore": 3.046353340148926
-  },
-  {
-    "rank": 499,
-    "player": {
-      "id": 8473419,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8473419.png",
-      "firstName": "Brad",
-      "lastName": "Marchand"
-    },
-    "ridgeAttractivenessScore": 3.0451529026031494
-  },
-  {
-    "rank": 500,
-    "player": {
-      "id": 8477527,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8477527.png",
-      "firstName": "Ross",
-      "lastName": "Johnston"
-    },
-    "ridgeAttractivenessScore": 3.044649124145508
-  },
-  {
-    "rank": 501,
-    "player": {
-      "id": 8484210,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8484210.png",
-      "firstName": "Gabe",
-      "lastName": "Perreault"
-    },
-    "ridgeAttractivenessScore": 3.044029474258423
-  },
-  {
-    "rank": 502,
-    "player": {
-      "id": 8482142,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8482142.png",
-      "firstName": "Jamie",
-      "lastName": "Drysdale"
-    },
-    "ridgeAttractivenessScore": 3.0435187816619873
-  },
-  {
-    "rank": 503,
-    "player": {
-      "id": 8475722,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8475722.png",
-      "firstName": "Jason",
-      "lastName": "Zucker"
-    },
-    "ridgeAttractivenessScore": 3.043379545211792
-  },
-  {
-    "rank": 504,
-    "player": {
-      "id": 8477946,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8477946.png",
-      "firstName": "Dylan",
-      "lastName": "Larkin"
-    },
-    "ridgeAttractivenessScore": 3.042428970336914
-  },
-  {
-    "rank": 505,
-    "player": {
-      "id": 8477968,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8477968.png",
-      "firstName": "Alex",
-      "lastName": "Nedeljkovic"
-    },
-    "ridgeAttractivenessScore": 3.042417287826538
-  },
-  {
-    "rank": 506,
-    "player": {
-      "id": 8478873,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8478873.png",
-      "firstName": "Troy",
-      "lastName": "Terry"
-    },
-    "ridgeAttractivenessScore": 3.0398881435394287
-  },
-  {
-    "rank": 507,
-    "player": {
-      "id": 8477949,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8477949.png",
-      "firstName": "Alex",
-      "lastName": "Tuch"
-    },
-    "ridgeAttractivenessScore": 3.0388519763946533
-  },
-  {
-    "rank": 508,
-    "player": {
-      "id": 8481525,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8481525.png",
-      "firstName": "Matthew",
-      "lastName": "Robertson"
-    },
-    "ridgeAttractivenessScore": 3.0384128093719482
-  },
-  {
-    "rank": 509,
-    "player": {
-      "id": 8481624,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8481624.png",
-      "firstName": "Ilya",
-      "lastName": "Mikheyev"
-    },
-    "ridgeAttractivenessScore": 3.0380234718322754
-  },
-  {
-    "rank": 510,
-    "player": {
-      "id": 8482762,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8482762.png",
-      "firstName": "Simon",
-      "lastName": "Edvinsson"
-    },
-    "ridgeAttractivenessScore": 3.0365076065063477
-  },
-  {
-    "rank": 511,
-    "player": {
-      "id": 8483573,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8483573.png",
-      "firstName": "Ethen",
-      "lastName": "Frank"
-    },
-    "ridgeAttractivenessScore": 3.0359418392181396
-  },
-  {
-    "rank": 512,
-    "player": {
-      "id": 8480313,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8480313.png",
-      "firstName": "Logan",
-      "lastName": "Thompson"
-    },
-    "ridgeAttractivenessScore": 3.035550117492676
-  },
-  {
-    "rank": 513,
-    "player": {
-      "id": 8474716,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8474716.png",
-      "firstName": "Jared",
-      "lastName": "Spurgeon"
-    },
-    "ridgeAttractivenessScore": 3.0346784591674805
-  },
-  {
-    "rank": 514,
-    "player": {
-      "id": 8480980,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8480980.png",
-      "firstName": "Connor",
-      "lastName": "Dewar"
-    },
-    "ridgeAttractivenessScore": 3.0336549282073975
-  },
-  {
-    "rank": 515,
-    "player": {
-      "id": 8484197,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8484197.png",
-      "firstName": "Oliver",
-      "lastName": "Moore"
-    },
-    "ridgeAttractivenessScore": 3.031552314758301
-  },
-  {
-    "rank": 516,
-    "player": {
-      "id": 8477497,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8477497.png",
-      "firstName": "Sean",
-      "lastName": "Monahan"
-    },
-    "ridgeAttractivenessScore": 3.0302090644836426
-  },
-  {
-    "rank": 517,
-    "player": {
-      "id": 8474590,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8474590.png",
-      "firstName": "John",
-      "lastName": "Carlson"
-    },
-    "ridgeAttractivenessScore": 3.028796672821045
-  },
-  {
-    "rank": 518,
-    "player": {
-      "id": 8481237,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8481237.png",
-      "firstName": "Kyle",
-      "lastName": "MacLean"
-    },
-    "ridgeAttractivenessScore": 3.026944398880005
-  },
-  {
-    "rank": 519,
-    "player": {
-      "id": 8483425,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8483425.png",
-      "firstName": "Lian",
-      "lastName": "Bichsel"
-    },
-    "ridgeAttractivenessScore": 3.0266478061676025
-  },
-  {
-    "rank": 520,
-    "player": {
-      "id": 8482751,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8482751.png",
-      "firstName": "Ryan",
-      "lastName": "Winterton"
-    },
-    "ridgeAttractivenessScore": 3.025991916656494
-  },
-  {
-    "rank": 521,
-    "player": {
-      "id": 8483487,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8483487.png",
-      "firstName": "Rutger",
-      "lastName": "McGroarty"
-    },
-    "ridgeAttractivenessScore": 3.021775722503662
-  },
-  {
-    "rank": 522,
-    "player": {
-      "id": 8481542,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8481542.png",
-      "firstName": "Moritz",
-      "lastName": "Seider"
-    },
-    "ridgeAttractivenessScore": 3.021512746810913
-  },
-  {
-    "rank": 523,
-    "player": {
-      "id": 8482702,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8482702.png",
-      "firstName": "Logan",
-      "lastName": "Stankoven"
-    },
-    "ridgeAttractivenessScore": 3.0201594829559326
-  },
-  {
-    "rank": 524,
-    "player": {
-      "id": 8475717,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8475717.png",
-      "firstName": "Calvin",
-      "lastName": "Pickard"
-    },
-    "ridgeAttractivenessScore": 3.0199215412139893
-  },
-  {
-    "rank": 525,
-    "player": {
-      "id": 8475762,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8475762.png",
-      "firstName": "Derek",
-      "lastName": "Forbort"
-    },
-    "ridgeAttractivenessScore": 3.017092704772949
-  },
-  {
-    "rank": 526,
-    "player": {
-      "id": 8476624,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8476624.png",
-      "firstName": "Barclay",
-      "lastName": "Goodrow"
-    },
-    "ridgeAttractivenessScore": 3.017026901245117
-  },
-  {
-    "rank": 527,
-    "player": {
-      "id": 8484258,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8484258.png",
-      "firstName": "Sam",
-      "lastName": "Malinski"
-    },
-    "ridgeAttractivenessScore": 3.0152194499969482
-  },
-  {
-    "rank": 528,
-    "player": {
-      "id": 8477511,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8477511.png",
-      "firstName": "Anthony",
-      "lastName": "Mantha"
-    },
-    "ridgeAttractivenessScore": 3.015207052230835
-  },
-  {
-    "rank": 529,
-    "player": {
-      "id": 8482896,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8482896.png",
-      "firstName": "Tyson",
-      "lastName": "Kozak"
-    },
-    "ridgeAttractivenessScore": 3.0144360065460205
-  },
-  {
-    "rank": 530,
-    "player": {
-      "id": 8471214,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8471214.png",
-      "firstName": "Alex",
-      "lastName": "Ovechkin"
-    },
-    "ridgeAttractivenessScore": 3.014085054397583
-  },
-  {
-    "rank": 531,
-    "player": {
-      "id": 8471685,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8471685.png",
-      "firstName": "Anze",
-      "lastName": "Kopitar"
-    },
-    "ridgeAttractivenessScore": 3.011901378631592
-  },
-  {
-    "rank": 532,
-    "player": {
-      "id": 8484145,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8484145.png",
-      "firstName": "Zach",
-      "lastName": "Benson"
-    },
-    "ridgeAttractivenessScore": 3.0112507343292236
-  },
-  {
-    "rank": 533,
-    "player": {
-      "id": 8476453,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8476453.png",
-      "firstName": "Nikita",
-      "lastName": "Kucherov"
-    },
-    "ridgeAttractivenessScore": 3.010777473449707
-  },
-  {
-    "rank": 534,
-    "player": {
-      "id": 8484321,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8484321.png",
-      "firstName": "Nikolas",
-      "lastName": "Matinpalo"
-    },
-    "ridgeAttractivenessScore": 3.0099897384643555
-  },
-  {
-    "rank": 535,
-    "player": {
-      "id": 8480803,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8480803.png",
-      "firstName": "Evan",
-      "lastName": "Bouchard"
-    },
-    "ridgeAttractivenessScore": 3.0096023082733154
-  },
-  {
-    "rank": 536,
-    "player": {
-      "id": 8478851,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8478851.png",
-      "firstName": "Alexandre",
-      "lastName": "Carrier"
-    },
-    "ridgeAttractivenessScore": 3.0084378719329834
-  },
-  {
-    "rank": 537,
-    "player": {
-      "id": 8479973,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8479973.png",
-      "firstName": "Stuart",
-      "lastName": "Skinner"
-    },
-    "ridgeAttractivenessScore": 3.0079386234283447
-  },
-  {
-    "rank": 538,
-    "player": {
-      "id": 8477993,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8477993.png",
-      "firstName": "Justin",
-      "lastName": "Kirkland"
-    },
-    "ridgeAttractivenessScore": 3.0073461532592773
-  },
-  {
-    "rank": 539,
-    "player": {
-      "id": 8484221,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8484221.png",
-      "firstName": "Calum",
-      "lastName": "Ritchie"
-    },
-    "ridgeAttractivenessScore": 3.007251739501953
-  },
-  {
-    "rank": 540,
-    "player": {
-      "id": 8477465,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8477465.png",
-      "firstName": "Tristan",
-      "lastName": "Jarry"
-    },
-    "ridgeAttractivenessScore": 3.0072426795959473
-  },
-  {
-    "rank": 541,
-    "player": {
-      "id": 8483495,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8483495.png",
-      "firstName": "Simon",
-      "lastName": "Nemec"
-    },
-    "ridgeAttractivenessScore": 3.006976366043091
-  },
-  {
-    "rank": 542,
-    "player": {
-      "id": 8478403,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8478403.png",
-      "firstName": "Jack",
-      "lastName": "Eichel"
-    },
-    "ridgeAttractivenessScore": 3.0069377422332764
-  },
-  {
-    "rank": 543,
-    "player": {
-      "id": 8479291,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8479291.png",
-      "firstName": "Kevin",
-      "lastName": "Rooney"
-    },
-    "ridgeAttractivenessScore": 3.006598711013794
-  },
-  {
-    "rank": 544,
-    "player": {
-      "id": 8480849,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8480849.png",
-      "firstName": "Barrett",
-      "lastName": "Hayton"
-    },
-    "ridgeAttractivenessScore": 3.0054996013641357
-  },
-  {
-    "rank": 545,
-    "player": {
-      "id": 8481806,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8481806.png",
-      "firstName": "Louis",
-      "lastName": "Crevier"
-    },
-    "ridgeAttractivenessScore": 3.0049889087677
-  },
-  {
-    "rank": 546,
-    "player": {
-      "id": 8477492,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8477492.png",
-      "firstName": "Nathan",
-      "lastName": "MacKinnon"
-    },
-    "ridgeAttractivenessScore": 3.004497528076172
-  },
-  {
-    "rank": 547,
-    "player": {
-      "id": 8483516,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8483516.png",
-      "firstName": "Jimmy",
-      "lastName": "Snuggerud"
-    },
-    "ridgeAttractivenessScore": 3.0021963119506836
-  },
-  {
-    "rank": 548,
-    "player": {
-      "id": 8477070,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8477070.png",
-      "firstName": "Liam",
-      "lastName": "O'Brien"
-    },
-    "ridgeAttractivenessScore": 3.0018298625946045
-  },
-  {
-    "rank": 549,
-    "player": {
-      "id": 8477479,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8477479.png",
-      "firstName": "Tyler",
-      "lastName": "Bertuzzi"
-    },
-    "ridgeAttractivenessScore": 3.001389980316162
-  },
-  {
-    "rank": 550,
-    "player": {
-      "id": 8477444,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8477444.png",
-      "firstName": "Andre",
-      "lastName": "Burakovsky"
-    },
-    "ridgeAttractivenessScore": 3.0013816356658936
-  },
-  {
-    "rank": 551,
-    "player": {
-      "id": 8481020,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8481020.png",
-      "firstName": "Justus",
-      "lastName": "Annunen"
-    },
-    "ridgeAttractivenessScore": 3.0013625621795654
-  },
-  {
-    "rank": 552,
-    "player": {
-      "id": 8475235,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8475235.png",
-      "firstName": "Nicolas",
-      "lastName": "Deslauriers"
-    },
-    "ridgeAttractivenessScore": 2.998344898223877
-  },
-  {
-    "rank": 553,
-    "player": {
-      "id": 8478911,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8478911.png",
-      "firstName": "Matt",
-      "lastName": "Roy"
-    },
-    "ridgeAttractivenessScore": 2.9982402324676514
-  },
-  {
-    "rank": 554,
-    "player": {
-      "id": 8473422,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8473422.png",
-      "firstName": "Nick",
-      "lastName": "Foligno"
-    },
-    "ridgeAttractivenessScore": 2.9977846145629883
-  },
-  {
-    "rank": 555,
-    "player": {
-      "id": 8476873,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8476873.png",
-      "firstName": "Mark",
-      "lastName": "Jankowski"
-    },
-    "ridgeAttractivenessScore": 2.996927499771118
-  },
-  {
-    "rank": 556,
-    "player": {
-      "id": 8482460,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8482460.png",
-      "firstName": "Matt",
-      "lastName": "Rempe"
-    },
-    "ridgeAttractivenessScore": 2.9949638843536377
-  },
-  {
-    "rank": 557,
-    "player": {
-      "id": 8481641,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8481641.png",
-      "firstName": "Joel",
-      "lastName": "Kiviranta"
-    },
-    "ridgeAttractivenessScore": 2.9945249557495117
-  },
-  {
-    "rank": 558,
-    "player": {
-      "id": 8482245,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8482245.png",
-      "firstName": "Artem",
-      "lastName": "Zub"
-    },
-    "ridgeAttractivenessScore": 2.9943485260009766
-  },
-  {
-    "rank": 559,
-    "player": {
-      "id": 8482148,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8482148.png",
-      "firstName": "Hendrix",
-      "lastName": "Lapierre"
-    },
-    "ridgeAttractivenessScore": 2.9922847747802734
-  },
-  {
-    "rank": 560,
-    "player": {
-      "id": 8484806,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8484806.png",
-      "firstName": "Sam",
-      "lastName": "Dickinson"
-    },
-    "ridgeAttractivenessScore": 2.9890193939208984
-  },
-  {
-    "rank": 561,
-    "player": {
-      "id": 8478398,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8478398.png",
-      "firstName": "Kyle",
-      "lastName": "Connor"
-    },
-    "ridgeAttractivenessScore": 2.9867184162139893
-  },
-  {
-    "rank": 562,
-    "player": {
-      "id": 8479992,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8479992.png",
-      "firstName": "Michael",
-      "lastName": "Rasmussen"
-    },
-    "ridgeAttractivenessScore": 2.9862771034240723
-  },
-  {
-    "rank": 563,
-    "player": {
-      "id": 8479390,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8479390.png",
-      "firstName": "Taylor",
-      "lastName": "Raddysh"
-    },
-    "ridgeAttractivenessScore": 2.986243724822998
-  },
-  {
-    "rank": 564,
-    "player": {
-      "id": 8480023,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8480023.png",
-      "firstName": "Robert",
-      "lastName": "Thomas"
-    },
-    "ridgeAttractivenessScore": 2.985886335372925
-  },
-  {
-    "rank": 565,
-    "player": {
-      "id": 8477476,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8477476.png",
-      "firstName": "Artturi",
-      "lastName": "Lehkonen"
-    },
-    "ridgeAttractivenessScore": 2.985748529434204
-  },
-  {
-    "rank": 566,
-    "player": {
-      "id": 8478406,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8478406.png",
-      "firstName": "Mackenzie",
-      "lastName": "Blackwood"
-    },
-    "ridgeAttractivenessScore": 2.9853768348693848
-  },
-  {
-    "rank": 567,
-    "player": {
-      "id": 8479999,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8479999.png",
-      "firstName": "Casey",
-      "lastName": "Mittelstadt"
-    },
-    "ridgeAttractivenessScore": 2.984898328781128
-  },
-  {
-    "rank": 568,
-    "player": {
-      "id": 8477424,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8477424.png",
-      "firstName": "Juuse",
-      "lastName": "Saros"
-    },
-    "ridgeAttractivenessScore": 2.9832394123077393
-  },
-  {
-    "rank": 569,
-    "player": {
-      "id": 8476826,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8476826.png",
-      "firstName": "Yanni",
-      "lastName": "Gourde"
-    },
-    "ridgeAttractivenessScore": 2.982800006866455
-  },
-  {
-    "rank": 570,
-    "player": {
-      "id": 8479520,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8479520.png",
-      "firstName": "Brandon",
-      "lastName": "Duhaime"
-    },
-    "ridgeAttractivenessScore": 2.9826717376708984
-  },
-  {
-    "rank": 571,
-    "player": {
-      "id": 8482691,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8482691.png",
-      "firstName": "Aatu",
-      "lastName": "Raty"
-    },
-    "ridgeAttractivenessScore": 2.982259750366211
-  },
-  {
-    "rank": 572,
-    "player": {
-      "id": 8476389,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8476389.png",
-      "firstName": "Vincent",
-      "lastName": "Trocheck"
-    },
-    "ridgeAttractivenessScore": 2.982008934020996
-  },
-  {
-    "rank": 573,
-    "player": {
-      "id": 8483733,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8483733.png",
-      "firstName": "Nikita",
-      "lastName": "Grebenkin"
-    },
-    "ridgeAttractivenessScore": 2.981233835220337
-  },
-  {
-    "rank": 574,
-    "player": {
-      "id": 8482145,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8482145.png",
-      "firstName": "Mavrik",
-      "lastName": "Bourque"
-    },
-    "ridgeAttractivenessScore": 2.979037284851074
-  },
-  {
-    "rank": 575,
-    "player": {
-      "id": 8484994,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8484994.png",
-      "firstName": "Igor",
-      "lastName": "Chernyshov"
-    },
-    "ridgeAttractivenessScore": 2.9780423641204834
-  },
-  {
-    "rank": 576,
-    "player": {
-      "id": 8481611,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8481611.png",
-      "firstName": "Pyotr",
-      "lastName": "Kochetkov"
-    },
-    "ridgeAttractivenessScore": 2.9774539470672607
-  },
-  {
-    "rank": 577,
-    "player": {
-      "id": 8482747,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8482747.png",
-      "firstName": "Brennan",
-      "lastName": "Othmann"
-    },
-    "ridgeAttractivenessScore": 2.9742300510406494
-  },
-  {
-    "rank": 578,
-    "player": {
-      "id": 8480796,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8480796.png",
-      "firstName": "Martin",
-      "lastName": "Fehérváry"
-    },
-    "ridgeAttractivenessScore": 2.974001407623291
-  },
-  {
-    "rank": 579,
-    "player": {
-      "id": 8484166,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8484166.png",
-      "firstName": "Adam",
-      "lastName": "Fantilli"
-    },
-    "ridgeAttractivenessScore": 2.971731424331665
-  },
-  {
-    "rank": 580,
-    "player": {
-      "id": 8480802,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8480802.png",
-      "firstName": "Ryan",
-      "lastName": "McLeod"
-    },
-    "ridgeAttractivenessScore": 2.9703993797302246
-  },
-  {
-    "rank": 581,
-    "player": {
-      "id": 8477499,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8477499.png",
-      "firstName": "Rasmus",
-      "lastName": "Ristolainen"
-    },
-    "ridgeAttractivenessScore": 2.968425989151001
-  },
-  {
-    "rank": 582,
-    "player": {
-      "id": 8484150,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8484150.png",
-      "firstName": "Hunter",
-      "lastName": "Brzustewicz"
-    },
-    "ridgeAttractivenessScore": 2.967741012573242
-  },
-  {
-    "rank": 583,
-    "player": {
-      "id": 8474149,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8474149.png",
-      "firstName": "Evgenii",
-      "lastName": "Dadonov"
-    },
-    "ridgeAttractivenessScore": 2.967574119567871
-  },
-  {
-    "rank": 584,
-    "player": {
-      "id": 8476461,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8476461.png",
-      "firstName": "Sean",
-      "lastName": "Couturier"
-    },
-    "ridgeAttractivenessScore": 2.965959072113037
-  },
-  {
-    "rank": 585,
-    "player": {
-      "id": 8478498,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8478498.png",
-      "firstName": "Jake",
-      "lastName": "DeBrusk"
-    },
-    "ridgeAttractivenessScore": 2.9657771587371826
-  },
-  {
-    "rank": 586,
-    "player": {
-      "id": 8471675,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8471675.png",
-      "firstName": "Sidney",
-      "lastName": "Crosby"
-    },
-    "ridgeAttractivenessScore": 2.9646360874176025
-  },
-  {
-    "rank": 587,
-    "player": {
-      "id": 8475191,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8475191.png",
-      "firstName": "Reilly",
-      "lastName": "Smith"
-    },
-    "ridgeAttractivenessScore": 2.962501049041748
-  },
-  {
-    "rank": 588,
-    "player": {
-      "id": 8477508,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8477508.png",
-      "firstName": "Curtis",
-      "lastName": "Lazar"
-    },
-    "ridgeAttractivenessScore": 2.9624557495117188
-  },
-  {
-    "rank": 589,
-    "player": {
-      "id": 8481556,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8481556.png",
-      "firstName": "John",
-      "lastName": "Beecher"
-    },
-    "ridgeAttractivenessScore": 2.962088108062744
-  },
-  {
-    "rank": 590,
-    "player": {
-      "id": 8482720,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8482720.png",
-      "firstName": "Matthew",
-      "lastName": "Knies"
-    },
-    "ridgeAttractivenessScore": 2.962024211883545
-  },
-  {
-    "rank": 591,
-    "player": {
-      "id": 8482929,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8482929.png",
-      "firstName": "Emil",
-      "lastName": "Lilleberg"
-    },
-    "ridgeAttractivenessScore": 2.9606008529663086
-  },
-  {
-    "rank": 592,
-    "player": {
-      "id": 8483457,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8483457.png",
-      "firstName": "Lane",
-      "lastName": "Hutson"
-    },
-    "ridgeAttractivenessScore": 2.9594919681549072
-  },
-  {
-    "rank": 593,
-    "player": {
-      "id": 8475166,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8475166.png",
-      "firstName": "John",
-      "lastName": "Tavares"
-    },
-    "ridgeAttractivenessScore": 2.9594171047210693
-  },
-  {
-    "rank": 594,
-    "player": {
-      "id": 8484800,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8484800.png",
-      "firstName": "Berkly",
-      "lastName": "Catton"
-    },
-    "ridgeAttractivenessScore": 2.9586803913116455
-  },
-  {
-    "rank": 595,
-    "player": {
-      "id": 8481219,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8481219.png",
-      "firstName": "Jonathan",
-      "lastName": "Aspirot"
-    },
-    "ridgeAttractivenessScore": 2.9568119049072266
-  },
-  {
-    "rank": 596,
-    "player": {
-      "id": 8482126,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8482126.png",
-      "firstName": "Emil",
-      "lastName": "Andrae"
-    },
-    "ridgeAttractivenessScore": 2.9564096927642822
-  },
-  {
-    "rank": 597,
-    "player": {
-      "id": 8476899,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8476899.png",
-      "firstName": "Matt",
-      "lastName": "Murray"
-    },
-    "ridgeAttractivenessScore": 2.954371929168701
-  },
-  {
-    "rank": 598,
-    "player": {
-      "id": 8478507,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8478507.png",
-      "firstName": "John",
-      "lastName": "Marino"
-    },
-    "ridgeAttractivenessScore": 2.9541378021240234
-  },
-  {
-    "rank": 599,
-    "player": {
-      "id": 8478007,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8478007.png",
-      "firstName": "Elvis",
-      "lastName": "Merzlikins"
-    },
-    "ridgeAttractivenessScore": 2.9534506797790527
-  },
-  {
-    "rank": 600,
-    "player": {
-      "id": 8482055,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8482055.png",
-      "firstName": "Drew",
-      "lastName": "O'Connor"
-    },
-    "ridgeAttractivenessScore": 2.951364755630493
-  },
-  {
-    "rank": 601,
-    "player": {
-      "id": 8477919,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8477919.png",
-      "firstName": "Frederick",
-      "lastName": "Gaudreau"
-    },
-    "ridgeAttractivenessScore": 2.949791669845581
-  },
-  {
-    "rank": 602,
-    "player": {
-      "id": 8479410,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8479410.png",
-      "firstName": "Mikhail",
-      "lastName": "Sergachev"
-    },
-    "ridgeAttractivenessScore": 2.949429750442505
-  },
-  {
-    "rank": 603,
-    "player": {
-      "id": 8482157,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8482157.png",
-      "firstName": "Will",
-      "lastName": "Cuylle"
-    },
-    "ridgeAttractivenessScore": 2.949188470840454
-  },
-  {
-    "rank": 604,
-    "player": {
-      "id": 8481581,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8481581.png",
-      "firstName": "Thomas",
-      "lastName": "Harley"
-    },
-    "ridgeAttractivenessScore": 2.948776960372925
-  },
-  {
-    "rank": 605,
-    "player": {
-      "id": 8479293,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8479293.png",
-      "firstName": "Brandon",
-      "lastName": "Tanev"
-    },
-    "ridgeAttractivenessScore": 2.9479477405548096
-  },
-  {
-    "rank": 606,
-    "player": {
-      "id": 8482122,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8482122.png",
-      "firstName": "Brock",
-      "lastName": "Faber"
-    },
-    "ridgeAttractivenessScore": 2.946809768676758
-  },
-  {
-    "rank": 607,
-    "player": {
-      "id": 8483513,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8483513.png",
-      "firstName": "Reid",
-      "lastName": "Schaefer"
-    },
-    "ridgeAttractivenessScore": 2.943114757537842
-  },
-  {
-    "rank": 608,
-    "player": {
-      "id": 8481517,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8481517.png",
-      "firstName": "Brett",
-      "lastName": "Leason"
-    },
-    "ridgeAttractivenessScore": 2.9430418014526367
-  },
-  {
-    "rank": 609,
-    "player": {
-      "id": 8483490,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8483490.png",
-      "firstName": "Pavel",
-      "lastName": "Mintyukov"
-    },
-    "ridgeAttractivenessScore": 2.94242787361145
-  },
-  {
-    "rank": 610,
-    "player": {
-      "id": 8480893,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8480893.png",
-      "firstName": "Kirill",
-      "lastName": "Marchenko"
-    },
-    "ridgeAttractivenessScore": 2.9393558502197266
-  },
-  {
-    "rank": 611,
-    "player": {
-      "id": 8483525,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8483525.png",
-      "firstName": "Danila",
-      "lastName": "Yurov"
-    },
-    "ridgeAttractivenessScore": 2.9385130405426025
-  },
-  {
-    "rank": 612,
-    "player": {
-      "id": 8476469,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8476469.png",
-      "firstName": "Joel",
-      "lastName": "Armia"
-    },
-    "ridgeAttractivenessScore": 2.9378788471221924
-  },
-  {
-    "rank": 613,
-    "player": {
-      "id": 8479406,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8479406.png",
-      "firstName": "Filip",
-      "lastName": "Gustavsson"
-    },
-    "ridgeAttractivenessScore": 2.9357831478118896
-  },
-  {
-    "rank": 614,
-    "player": {
-      "id": 8481481,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8481481.png",
-      "firstName": "Blake",
-      "lastName": "Lizotte"
-    },
-    "ridgeAttractivenessScore": 2.935683488845825
-  },
-  {
-    "rank": 615,
-    "player": {
-      "id": 8476881,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8476881.png",
-      "firstName": "Tomas",
-      "lastName": "Hertl"
-    },
-    "ridgeAttractivenessScore": 2.935655117034912
-  },
-  {
-    "rank": 616,
-    "player": {
-      "id": 8484958,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8484958.png",
-      "firstName": "Maxim",
-      "lastName": "Tsyplakov"
-    },
-    "ridgeAttractivenessScore": 2.9352641105651855
-  },
-  {
-    "rank": 617,
-    "player": {
-      "id": 8471734,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8471734.png",
-      "firstName": "Jonathan",
-      "lastName": "Quick"
-    },
-    "ridgeAttractivenessScore": 2.9344236850738525
-  },
-  {
-    "rank": 618,
-    "player": {
-      "id": 8482768,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8482768.png",
-      "firstName": "Fedor",
-      "lastName": "Svechkov"
-    },
-    "ridgeAttractivenessScore": 2.932722568511963
-  },
-  {
-    "rank": 619,
-    "player": {
-      "id": 8475842,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8475842.png",
-      "firstName": "Sam",
-      "lastName": "Carrick"
-    },
-    "ridgeAttractivenessScore": 2.9318363666534424
-  },
-  {
-    "rank": 620,
-    "player": {
-      "id": 8482516,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8482516.png",
-      "firstName": "Matthew",
-      "lastName": "Kessel"
-    },
-    "ridgeAttractivenessScore": 2.931610584259033
-  },
-  {
-    "rank": 621,
-    "player": {
-      "id": 8484227,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8484227.png",
-      "firstName": "Will",
-      "lastName": "Smith"
-    },
-    "ridgeAttractivenessScore": 2.931549310684204
-  },
-  {
-    "rank": 622,
-    "player": {
-      "id": 8482661,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8482661.png",
-      "firstName": "Jesper",
-      "lastName": "Wallstedt"
-    },
-    "ridgeAttractivenessScore": 2.9302620887756348
-  },
-  {
-    "rank": 623,
-    "player": {
-      "id": 8475764,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8475764.png",
-      "firstName": "Cam",
-      "lastName": "Fowler"
-    },
-    "ridgeAttractivenessScore": 2.929668426513672
-  },
-  {
-    "rank": 624,
-    "player": {
-      "id": 8474596,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8474596.png",
-      "firstName": "Jake",
-      "lastName": "Allen"
-    },
-    "ridgeAttractivenessScore": 2.9289743900299072
-  },
-  {
-    "rank": 625,
-    "player": {
-      "id": 8481580,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8481580.png",
-      "firstName": "Connor",
-      "lastName": "McMichael"
-    },
-    "ridgeAttractivenessScore": 2.928720235824585
-  },
-  {
-    "rank": 626,
-    "player": {
-      "id": 8483766,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8483766.png",
-      "firstName": "David",
-      "lastName": "Spacek"
-    },
-    "ridgeAttractivenessScore": 2.92596173286438
-  },
-  {
-    "rank": 627,
-    "player": {
-      "id": 8482482,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8482482.png",
-      "firstName": "Adam",
-      "lastName": "Wilsby"
-    },
-    "ridgeAttractivenessScore": 2.925823450088501
-  },
-  {
-    "rank": 628,
-    "player": {
-      "id": 8485702,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8485702.png",
-      "firstName": "Max",
-      "lastName": "Shabanov"
-    },
-    "ridgeAttractivenessScore": 2.923450469970703
-  },
-  {
-    "rank": 629,
-    "player": {
-      "id": 8476882,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8476882.png",
-      "firstName": "Teuvo",
-      "lastName": "Teravainen"
-    },
-    "ridgeAttractivenessScore": 2.9221110343933105
-  },
-  {
-    "rank": 630,
-    "player": {
-      "id": 8482511,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8482511.png",
-      "firstName": "Mason",
-      "lastName": "Lohrei"
-    },
-    "ridgeAttractivenessScore": 2.9209883213043213
-  },
-  {
-    "rank": 631,
-    "player": {
-      "id": 8483397,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8483397.png",
-      "firstName": "Marc",
-      "lastName": "McLaughlin"
-    },
-    "ridgeAttractivenessScore": 2.920323610305786
-  },
-  {
-    "rank": 632,
-    "player": {
-      "id": 8476874,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8476874.png",
-      "firstName": "Olli",
-      "lastName": "Määttä"
-    },
-    "ridgeAttractivenessScore": 2.919503688812256
-  },
-  {
-    "rank": 633,
-    "player": {
-      "id": 8480834,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8480834.png",
-      "firstName": "Ty",
-      "lastName": "Emberson"
-    },
-    "ridgeAttractivenessScore": 2.9182379245758057
-  },
-  {
-    "rank": 634,
-    "player": {
-      "id": 8482775,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8482775.png",
-      "firstName": "Oliver",
-      "lastName": "Kapanen"
-    },
-    "ridgeAttractivenessScore": 2.917584180831909
-  },
-  {
-    "rank": 635,
-    "player": {
-      "id": 8475883,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8475883.png",
-      "firstName": "Frederik",
-      "lastName": "Andersen"
-    },
-    "ridgeAttractivenessScore": 2.9160993099212646
-  },
-  {
-    "rank": 636,
-    "player": {
-      "id": 8481604,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8481604.png",
-      "firstName": "Pavel",
-      "lastName": "Dorofeyev"
-    },
-    "ridgeAttractivenessScore": 2.915830135345459
-  },
-  {
-    "rank": 637,
-    "player": {
-      "id": 8480246,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8480246.png",
-      "firstName": "Nick",
-      "lastName": "Perbix"
-    },
-    "ridgeAttractivenessScore": 2.9150021076202393
-  },
-  {
-    "rank": 638,
-    "player": {
-      "id": 8477073,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8477073.png",
-      "firstName": "Kurtis",
-      "lastName": "MacDermid"
-    },
-    "ridgeAttractivenessScore": 2.9128220081329346
-  },
-  {
-    "rank": 639,
-    "player": {
-      "id": 8481692,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8481692.png",
-      "firstName": "Dustin",
-      "lastName": "Wolf"
-    },
-    "ridgeAttractivenessScore": 2.9127306938171387
-  },
-  {
-    "rank": 640,
-    "player": {
-      "id": 8478440,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8478440.png",
-      "firstName": "Dylan",
-      "lastName": "Strome"
-    },
-    "ridgeAttractivenessScore": 2.912362813949585
-  },
-  {
-    "rank": 641,
-    "player": {
-      "id": 8474013,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8474013.png",
-      "firstName": "Ian",
-      "lastName": "Cole"
-    },
-    "ridgeAttractivenessScore": 2.911836624145508
-  },
-  {
-    "rank": 642,
-    "player": {
-      "id": 8481716,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8481716.png",
-      "firstName": "Dmitri",
-      "lastName": "Voronkov"
-    },
-    "ridgeAttractivenessScore": 2.9107847213745117
-  },
-  {
-    "rank": 643,
-    "player": {
-      "id": 8480887,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8480887.png",
-      "firstName": "Jordan",
-      "lastName": "Harris"
-    },
-    "ridgeAttractivenessScore": 2.908050298690796
-  },
-  {
-    "rank": 644,
-    "player": {
-      "id": 8483510,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8483510.png",
-      "firstName": "Elias",
-      "lastName": "Salomonsson"
-    },
-    "ridgeAttractivenessScore": 2.9079666137695312
-  },
-  {
-    "rank": 645,
-    "player": {
-      "id": 8475831,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8475831.png",
-      "firstName": "Philipp",
-      "lastName": "Grubauer"
-    },
-    "ridgeAttractivenessScore": 2.904111385345459
-  },
-  {
-    "rank": 646,
-    "player": {
-      "id": 8482745,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8482745.png",
-      "firstName": "Mason",
-      "lastName": "McTavish"
-    },
-    "ridgeAttractivenessScore": 2.9008989334106445
-  },
-  {
-    "rank": 647,
-    "player": {
-      "id": 8479026,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8479026.png",
-      "firstName": "Philippe",
-      "lastName": "Myers"
-    },
-    "ridgeAttractivenessScore": 2.898603916168213
-  },
-  {
-    "rank": 648,
-    "player": {
-      "id": 8477932,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8477932.png",
-      "firstName": "Aaron",
-      "lastName": "Ekblad"
-    },
-    "ridgeAttractivenessScore": 2.8965022563934326
-  },
-  {
-    "rank": 649,
-    "player": {
-      "id": 8480855,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8480855.png",
-      "firstName": "Jack",
-      "lastName": "McBain"
-    },
-    "ridgeAttractivenessScore": 2.896462917327881
-  },
-  {
-    "rank": 650,
-    "player": {
-      "id": 8479639,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8479639.png",
-      "firstName": "Dylan",
-      "lastName": "Coghlan"
-    },
-    "ridgeAttractivenessScore": 2.896243095397949
-  },
-  {
-    "rank": 651,
-    "player": {
-      "id": 8482634,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8482634.png",
-      "firstName": "Alex",
-      "lastName": "Steeves"
-    },
-    "ridgeAttractivenessScore": 2.894320249557495
-  },
-  {
-    "rank": 652,
-    "player": {
-      "id": 8480074,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8480074.png",
-      "firstName": "Alexandre",
-      "lastName": "Texier"
-    },
-    "ridgeAttractivenessScore": 2.893808364868164
-  },
-  {
-    "rank": 653,
-    "player": {
-      "id": 8483431,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8483431.png",
-      "firstName": "Logan",
-      "lastName": "Cooley"
-    },
-    "ridgeAttractivenessScore": 2.890049457550049
-  },
-  {
-    "rank": 654,
-    "player": {
-      "id": 8478434,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8478434.png",
-      "firstName": "Keegan",
-      "lastName": "Kolesar"
-    },
-    "ridgeAttractivenessScore": 2.8893356323242188
-  },
-  {
-    "rank": 655,
-    "player": {
-      "id": 8481546,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8481546.png",
-      "firstName": "Cam",
-      "lastName": "York"
-    },
-    "ridgeAttractivenessScore": 2.8873209953308105
-  },
-  {
-    "rank": 656,
-    "player": {
-      "id": 8481024,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8481024.png",
-      "firstName": "Linus",
-      "lastName": "Karlsson"
-    },
-    "ridgeAttractivenessScore": 2.886321544647217
-  },
-  {
-    "rank": 657,
-    "player": {
-      "id": 8479325,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8479325.png",
-      "firstName": "Charlie",
-      "lastName": "McAvoy"
-    },
-    "ridgeAttractivenessScore": 2.88588285446167
-  },
-  {
-    "rank": 658,
-    "player": {
-      "id": 8481609,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8481609.png",
-      "firstName": "Vladislav",
-      "lastName": "Kolyachonok"
-    },
-    "ridgeAttractivenessScore": 2.8846590518951416
-  },
-  {
-    "rank": 659,
-    "player": {
-      "id": 8481519,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8481519.png",
-      "firstName": "Spencer",
-      "lastName": "Knight"
-    },
-    "ridgeAttractivenessScore": 2.884096384048462
-  },
-  {
-    "rank": 660,
-    "player": {
-      "id": 8480426,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8480426.png",
-      "firstName": "Charle-Edouard",
-      "lastName": "D'Astous"
-    },
-    "ridgeAttractivenessScore": 2.8837339878082275
-  },
-  {
-    "rank": 661,
-    "player": {
-      "id": 8480831,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8480831.png",
-      "firstName": "Alec",
-      "lastName": "Regula"
-    },
-    "ridgeAttractivenessScore": 2.883471727371216
-  },
-  {
-    "rank": 662,
-    "player": {
-      "id": 8484223,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8484223.png",
-      "firstName": "Axel",
-      "lastName": "Sandin-Pellikka"
-    },
-    "ridgeAttractivenessScore": 2.883150577545166
-  },
-  {
-    "rank": 663,
-    "player": {
-      "id": 8476454,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8476454.png",
-      "firstName": "Ryan",
-      "lastName": "Nugent-Hopkins"
-    },
-    "ridgeAttractivenessScore": 2.883040428161621
-  },
-  {
-    "rank": 664,
-    "player": {
-      "id": 8481656,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8481656.png",
-      "firstName": "Aliaksei",
-      "lastName": "Protas"
-    },
-    "ridgeAttractivenessScore": 2.8829145431518555
-  },
-  {
-    "rank": 665,
-    "player": {
-      "id": 8480002,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8480002.png",
-      "firstName": "Nico",
-      "lastName": "Hischier"
-    },
-    "ridgeAttractivenessScore": 2.88274884223938
-  },
-  {
-    "rank": 666,
-    "player": {
-      "id": 8480043,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8480043.png",
-      "firstName": "Timothy",
-      "lastName": "Liljegren"
-    },
-    "ridgeAttractivenessScore": 2.8818345069885254
-  },
-  {
-    "rank": 667,
-    "player": {
-      "id": 8477956,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8477956.png",
-      "firstName": "David",
-      "lastName": "Pastrnak"
-    },
-    "ridgeAttractivenessScore": 2.8781118392944336
-  },
-  {
-    "rank": 668,
-    "player": {
-      "id": 8475786,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8475786.png",
-      "firstName": "Zach",
-      "lastName": "Hyman"
-    },
-    "ridgeAttractivenessScore": 2.876737117767334
-  },
-  {
-    "rank": 669,
-    "player": {
-      "id": 8477456,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8477456.png",
-      "firstName": "J.T.",
-      "lastName": "Compher"
-    },
-    "ridgeAttractivenessScore": 2.876021385192871
-  },
-  {
-    "rank": 670,
-    "player": {
-      "id": 8478136,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8478136.png",
-      "firstName": "Jake",
-      "lastName": "Middleton"
-    },
-    "ridgeAttractivenessScore": 2.87351131439209
-  },
-  {
-    "rank": 671,
-    "player": {
-      "id": 8476897,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8476897.png",
-      "firstName": "Oskar",
-      "lastName": "Sundqvist"
-    },
-    "ridgeAttractivenessScore": 2.8728039264678955
-  },
-  {
-    "rank": 672,
-    "player": {
-      "id": 8475172,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8475172.png",
-      "firstName": "Nazem",
-      "lastName": "Kadri"
-    },
-    "ridgeAttractivenessScore": 2.8721063137054443
-  },
-  {
-    "rank": 673,
-    "player": {
-      "id": 8475763,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8475763.png",
-      "firstName": "Kevin",
-      "lastName": "Hayes"
-    },
-    "ridgeAttractivenessScore": 2.8707737922668457
-  },
-  {
-    "rank": 674,
-    "player": {
-      "id": 8482665,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8482665.png",
-      "firstName": "Matty",
-      "lastName": "Beniers"
-    },
-    "ridgeAttractivenessScore": 2.8700435161590576
-  },
-  {
-    "rank": 675,
-    "player": {
-      "id": 8479339,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8479339.png",
-      "firstName": "Patrik",
-      "lastName": "Laine"
-    },
-    "ridgeAttractivenessScore": 2.868556022644043
-  },
-  {
-    "rank": 676,
-    "player": {
-      "id": 8480045,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8480045.png",
-      "firstName": "Ukko-Pekka",
-      "lastName": "Luukkonen"
-    },
-    "ridgeAttractivenessScore": 2.8678395748138428
-  },
-  {
-    "rank": 677,
-    "player": {
-      "id": 8480039,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/COL/8480039.png",
-      "firstName": "Martin",
-      "lastName": "Necas"
-    },
-    "ridgeAttractivenessScore": 2.867365837097168
-  },
-  {
-    "rank": 678,
-    "player": {
-      "id": 8478024,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8478024.png",
-      "firstName": "Ville",
-      "lastName": "Husso"
-    },
-    "ridgeAttractivenessScore": 2.8666348457336426
-  },
-  {
-    "rank": 679,
-    "player": {
-      "id": 8477573,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8477573.png",
-      "firstName": "Nathan",
-      "lastName": "Walker"
-    },
-    "ridgeAttractivenessScore": 2.8662264347076416
-  },
-  {
-    "rank": 680,
-    "player": {
-      "id": 8481522,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8481522.png",
-      "firstName": "Peyton",
-      "lastName": "Krebs"
-    },
-    "ridgeAttractivenessScore": 2.8648018836975098
-  },
-  {
-    "rank": 681,
-    "player": {
-      "id": 8483548,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8483548.png",
-      "firstName": "Brandon",
-      "lastName": "Bussi"
-    },
-    "ridgeAttractivenessScore": 2.8589937686920166
-  },
-  {
-    "rank": 682,
-    "player": {
-      "id": 8480800,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8480800.png",
-      "firstName": "Quinn",
-      "lastName": "Hughes"
-    },
-    "ridgeAttractivenessScore": 2.8578481674194336
-  },
-  {
-    "rank": 683,
-    "player": {
-      "id": 8478458,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8478458.png",
-      "firstName": "Jack",
-      "lastName": "Roslovic"
-    },
-    "ridgeAttractivenessScore": 2.857428550720215
-  },
-  {
-    "rank": 684,
-    "player": {
-      "id": 8482118,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8482118.png",
-      "firstName": "Sam",
-      "lastName": "Colangelo"
-    },
-    "ridgeAttractivenessScore": 2.8561506271362305
-  },
-  {
-    "rank": 685,
-    "player": {
-      "id": 8477939,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8477939.png",
-      "firstName": "William",
-      "lastName": "Nylander"
-    },
-    "ridgeAttractivenessScore": 2.8528943061828613
-  },
-  {
-    "rank": 686,
-    "player": {
-      "id": 8483455,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8483455.png",
-      "firstName": "Isaac",
-      "lastName": "Howard"
-    },
-    "ridgeAttractivenessScore": 2.8509953022003174
-  },
-  {
-    "rank": 687,
-    "player": {
-      "id": 8475220,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8475220.png",
-      "firstName": "Marcus",
-      "lastName": "Foligno"
-    },
-    "ridgeAttractivenessScore": 2.850907564163208
-  },
-  {
-    "rank": 688,
-    "player": {
-      "id": 8482125,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8482125.png",
-      "firstName": "Alexander",
-      "lastName": "Holtz"
-    },
-    "ridgeAttractivenessScore": 2.8503358364105225
-  },
-  {
-    "rank": 689,
-    "player": {
-      "id": 8475151,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8475151.png",
-      "firstName": "Kyle",
-      "lastName": "Palmieri"
-    },
-    "ridgeAttractivenessScore": 2.843580484390259
-  },
-  {
-    "rank": 690,
-    "player": {
-      "id": 8484860,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8484860.png",
-      "firstName": "Matvei",
-      "lastName": "Gridin"
-    },
-    "ridgeAttractivenessScore": 2.841691255569458
-  },
-  {
-    "rank": 691,
-    "player": {
-      "id": 8485366,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8485366.png",
-      "firstName": "Matthew",
-      "lastName": "Schaefer"
-    },
-    "ridgeAttractivenessScore": 2.8405306339263916
-  },
-  {
-    "rank": 692,
-    "player": {
-      "id": 8481568,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8481568.png",
-      "firstName": "Alex",
-      "lastName": "Vlasic"
-    },
-    "ridgeAttractivenessScore": 2.8390426635742188
-  },
-  {
-    "rank": 693,
-    "player": {
-      "id": 8484240,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8484240.png",
-      "firstName": "Tom",
-      "lastName": "Willander"
-    },
-    "ridgeAttractivenessScore": 2.8369598388671875
-  },
-  {
-    "rank": 694,
-    "player": {
-      "id": 8478047,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NSH/8478047.png",
-      "firstName": "Michael",
-      "lastName": "Bunting"
-    },
-    "ridgeAttractivenessScore": 2.8362417221069336
-  },
-  {
-    "rank": 695,
-    "player": {
-      "id": 8478859,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8478859.png",
-      "firstName": "Niko",
-      "lastName": "Mikkola"
-    },
-    "ridgeAttractivenessScore": 2.8359813690185547
-  },
-  {
-    "rank": 696,
-    "player": {
-      "id": 8480113,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WPG/8480113.png",
-      "firstName": "Alex",
-      "lastName": "Iafallo"
-    },
-    "ridgeAttractivenessScore": 2.8354532718658447
-  },
-  {
-    "rank": 697,
-    "player": {
-      "id": 8480009,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8480009.png",
-      "firstName": "Eeli",
-      "lastName": "Tolvanen"
-    },
-    "ridgeAttractivenessScore": 2.8339145183563232
-  },
-  {
-    "rank": 698,
-    "player": {
-      "id": 8471817,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8471817.png",
-      "firstName": "Ryan",
-      "lastName": "Reaves"
-    },
-    "ridgeAttractivenessScore": 2.831024408340454
-  },
-  {
-    "rank": 699,
-    "player": {
-      "id": 8482730,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/LAK/8482730.png",
-      "firstName": "Brandt",
-      "lastName": "Clarke"
-    },
-    "ridgeAttractivenessScore": 2.830928325653076
-  },
-  {
-    "rank": 700,
-    "player": {
-      "id": 8477380,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8477380.png",
-      "firstName": "Jonny",
-      "lastName": "Brodzinski"
-    },
-    "ridgeAttractivenessScore": 2.8309152126312256
-  },
-  {
-    "rank": 701,
-    "player": {
-      "id": 8480220,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8480220.png",
-      "firstName": "Noah",
-      "lastName": "Cates"
-    },
-    "ridgeAttractivenessScore": 2.8291501998901367
-  },
-  {
-    "rank": 702,
-    "player": {
-      "id": 8483515,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8483515.png",
-      "firstName": "Juraj",
-      "lastName": "Slafkovský"
-    },
-    "ridgeAttractivenessScore": 2.82905650138855
-  },
-  {
-    "rank": 703,
-    "player": {
-      "id": 8476932,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8476932.png",
-      "firstName": "Anthony",
-      "lastName": "Stolarz"
-    },
-    "ridgeAttractivenessScore": 2.8288254737854004
-  },
-  {
-    "rank": 704,
-    "player": {
-      "id": 8480762,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8480762.png",
-      "firstName": "Eric",
-      "lastName": "Robinson"
-    },
-    "ridgeAttractivenessScore": 2.8283329010009766
-  },
-  {
-    "rank": 705,
-    "player": {
-      "id": 8480078,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8480078.png",
-      "firstName": "Filip",
-      "lastName": "Chytil"
-    },
-    "ridgeAttractivenessScore": 2.8268001079559326
-  },
-  {
-    "rank": 706,
-    "player": {
-      "id": 8482078,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8482078.png",
-      "firstName": "Lucas",
-      "lastName": "Raymond"
-    },
-    "ridgeAttractivenessScore": 2.8244972229003906
-  },
-  {
-    "rank": 707,
-    "player": {
-      "id": 8478916,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8478916.png",
-      "firstName": "Joey",
-      "lastName": "Daccord"
-    },
-    "ridgeAttractivenessScore": 2.8199551105499268
-  },
-  {
-    "rank": 708,
-    "player": {
-      "id": 8481593,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8481593.png",
-      "firstName": "Jayden",
-      "lastName": "Struble"
-    },
-    "ridgeAttractivenessScore": 2.8183822631835938
-  },
-  {
-    "rank": 709,
-    "player": {
-      "id": 8482623,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8482623.png",
-      "firstName": "Josh",
-      "lastName": "Dunne"
-    },
-    "ridgeAttractivenessScore": 2.8166699409484863
-  },
-  {
-    "rank": 710,
-    "player": {
-      "id": 8478435,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8478435.png",
-      "firstName": "Dan",
-      "lastName": "Vladar"
-    },
-    "ridgeAttractivenessScore": 2.8166110515594482
-  },
-  {
-    "rank": 711,
-    "player": {
-      "id": 8476921,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8476921.png",
-      "firstName": "Jordan",
-      "lastName": "Martinook"
-    },
-    "ridgeAttractivenessScore": 2.8156635761260986
-  },
-  {
-    "rank": 712,
-    "player": {
-      "id": 8483398,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8483398.png",
-      "firstName": "Declan",
-      "lastName": "Carlile"
-    },
-    "ridgeAttractivenessScore": 2.8115248680114746
-  },
-  {
-    "rank": 713,
-    "player": {
-      "id": 8482178,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8482178.png",
-      "firstName": "Ian",
-      "lastName": "Moore"
-    },
-    "ridgeAttractivenessScore": 2.810892343521118
-  },
-  {
-    "rank": 714,
-    "player": {
-      "id": 8478427,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8478427.png",
-      "firstName": "Sebastian",
-      "lastName": "Aho"
-    },
-    "ridgeAttractivenessScore": 2.810861349105835
-  },
-  {
-    "rank": 715,
-    "player": {
-      "id": 8475167,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8475167.png",
-      "firstName": "Victor",
-      "lastName": "Hedman"
-    },
-    "ridgeAttractivenessScore": 2.809046745300293
-  },
-  {
-    "rank": 716,
-    "player": {
-      "id": 8481006,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8481006.png",
-      "firstName": "Tyler",
-      "lastName": "Tucker"
-    },
-    "ridgeAttractivenessScore": 2.808824062347412
-  },
-  {
-    "rank": 717,
-    "player": {
-      "id": 8480064,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BUF/8480064.png",
-      "firstName": "Josh",
-      "lastName": "Norris"
-    },
-    "ridgeAttractivenessScore": 2.804837226867676
-  },
-  {
-    "rank": 718,
-    "player": {
-      "id": 8481598,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8481598.png",
-      "firstName": "Philip",
-      "lastName": "Broberg"
-    },
-    "ridgeAttractivenessScore": 2.799929141998291
-  },
-  {
-    "rank": 719,
-    "player": {
-      "id": 8479316,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8479316.png",
-      "firstName": "Luke",
-      "lastName": "Kunin"
-    },
-    "ridgeAttractivenessScore": 2.7983999252319336
-  },
-  {
-    "rank": 720,
-    "player": {
-      "id": 8476474,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8476474.png",
-      "firstName": "Stefan",
-      "lastName": "Noesen"
-    },
-    "ridgeAttractivenessScore": 2.7935328483581543
-  },
-  {
-    "rank": 721,
-    "player": {
-      "id": 8477425,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8477425.png",
-      "firstName": "Miles",
-      "lastName": "Wood"
-    },
-    "ridgeAttractivenessScore": 2.7892227172851562
-  },
-  {
-    "rank": 722,
-    "player": {
-      "id": 8475752,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8475752.png",
-      "firstName": "Tyler",
-      "lastName": "Pitlick"
-    },
-    "ridgeAttractivenessScore": 2.7888917922973633
-  },
-  {
-    "rank": 723,
-    "player": {
-      "id": 8477969,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8477969.png",
-      "firstName": "Marcus",
-      "lastName": "Pettersson"
-    },
-    "ridgeAttractivenessScore": 2.788701057434082
-  },
-  {
-    "rank": 724,
-    "player": {
-      "id": 8481789,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SEA/8481789.png",
-      "firstName": "Tye",
-      "lastName": "Kartye"
-    },
-    "ridgeAttractivenessScore": 2.788694143295288
-  },
-  {
-    "rank": 725,
-    "player": {
-      "id": 8477426,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8477426.png",
-      "firstName": "Nick",
-      "lastName": "Paul"
-    },
-    "ridgeAttractivenessScore": 2.7832248210906982
-  },
-  {
-    "rank": 726,
-    "player": {
-      "id": 8478397,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8478397.png",
-      "firstName": "Rasmus",
-      "lastName": "Andersson"
-    },
-    "ridgeAttractivenessScore": 2.78305983543396
-  },
-  {
-    "rank": 727,
-    "player": {
-      "id": 8478856,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8478856.png",
-      "firstName": "Conor",
-      "lastName": "Garland"
-    },
-    "ridgeAttractivenessScore": 2.773224353790283
-  },
-  {
-    "rank": 728,
-    "player": {
-      "id": 8480027,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8480027.png",
-      "firstName": "Jason",
-      "lastName": "Robertson"
-    },
-    "ridgeAttractivenessScore": 2.7717747688293457
-  },
-  {
-    "rank": 729,
-    "player": {
-      "id": 8481618,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MTL/8481618.png",
-      "firstName": "Alex",
-      "lastName": "Newhook"
-    },
-    "ridgeAttractivenessScore": 2.771254539489746
-  },
-  {
-    "rank": 730,
-    "player": {
-      "id": 8475690,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8475690.png",
-      "firstName": "Chris",
-      "lastName": "Tanev"
-    },
-    "ridgeAttractivenessScore": 2.7704405784606934
-  },
-  {
-    "rank": 731,
-    "player": {
-      "id": 8476393,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8476393.png",
-      "firstName": "Nick",
-      "lastName": "Cousins"
-    },
-    "ridgeAttractivenessScore": 2.7666096687316895
-  },
-  {
-    "rank": 732,
-    "player": {
-      "id": 8484428,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8484428.png",
-      "firstName": "Charles Alexis",
-      "lastName": "Legault"
-    },
-    "ridgeAttractivenessScore": 2.7651100158691406
-  },
-  {
-    "rank": 733,
-    "player": {
-      "id": 8481719,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8481719.png",
-      "firstName": "Max",
-      "lastName": "Crozier"
-    },
-    "ridgeAttractivenessScore": 2.7640819549560547
-  },
-  {
-    "rank": 734,
-    "player": {
-      "id": 8482733,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8482733.png",
-      "firstName": "Logan",
-      "lastName": "Mailloux"
-    },
-    "ridgeAttractivenessScore": 2.763319492340088
-  },
-  {
-    "rank": 735,
-    "player": {
-      "id": 8476854,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8476854.png",
-      "firstName": "Hampus",
-      "lastName": "Lindholm"
-    },
-    "ridgeAttractivenessScore": 2.762791633605957
-  },
-  {
-    "rank": 736,
-    "player": {
-      "id": 8475218,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8475218.png",
-      "firstName": "Mattias",
-      "lastName": "Ekholm"
-    },
-    "ridgeAttractivenessScore": 2.7610952854156494
-  },
-  {
-    "rank": 737,
-    "player": {
-      "id": 8477402,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8477402.png",
-      "firstName": "Pavel",
-      "lastName": "Buchnevich"
-    },
-    "ridgeAttractivenessScore": 2.7589402198791504
-  },
-  {
-    "rank": 738,
-    "player": {
-      "id": 8476429,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8476429.png",
-      "firstName": "Scott",
-      "lastName": "Mayfield"
-    },
-    "ridgeAttractivenessScore": 2.7556087970733643
-  },
-  {
-    "rank": 739,
-    "player": {
-      "id": 8475683,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8475683.png",
-      "firstName": "Sergei",
-      "lastName": "Bobrovsky"
-    },
-    "ridgeAttractivenessScore": 2.753648519515991
-  },
-  {
-    "rank": 740,
-    "player": {
-      "id": 8479979,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8479979.png",
-      "firstName": "Jake",
-      "lastName": "Oettinger"
-    },
-    "ridgeAttractivenessScore": 2.746649742126465
-  },
-  {
-    "rank": 741,
-    "player": {
-      "id": 8481559,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8481559.png",
-      "firstName": "Jack",
-      "lastName": "Hughes"
-    },
-    "ridgeAttractivenessScore": 2.7458765506744385
-  },
-  {
-    "rank": 742,
-    "player": {
-      "id": 8482982,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8482982.png",
-      "firstName": "Jet",
-      "lastName": "Greaves"
-    },
-    "ridgeAttractivenessScore": 2.745551586151123
-  },
-  {
-    "rank": 743,
-    "player": {
-      "id": 8479066,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8479066.png",
-      "firstName": "Ryan",
-      "lastName": "Lomberg"
-    },
-    "ridgeAttractivenessScore": 2.744394540786743
-  },
-  {
-    "rank": 744,
-    "player": {
-      "id": 8480355,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8480355.png",
-      "firstName": "Mark",
-      "lastName": "Kastelic"
-    },
-    "ridgeAttractivenessScore": 2.743497371673584
-  },
-  {
-    "rank": 745,
-    "player": {
-      "id": 8471215,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8471215.png",
-      "firstName": "Evgeni",
-      "lastName": "Malkin"
-    },
-    "ridgeAttractivenessScore": 2.741591215133667
-  },
-  {
-    "rank": 746,
-    "player": {
-      "id": 8476914,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/BOS/8476914.png",
-      "firstName": "Joonas",
-      "lastName": "Korpisalo"
-    },
-    "ridgeAttractivenessScore": 2.735743761062622
-  },
-  {
-    "rank": 747,
-    "player": {
-      "id": 8476473,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8476473.png",
-      "firstName": "Connor",
-      "lastName": "Murphy"
-    },
-    "ridgeAttractivenessScore": 2.7338924407958984
-  },
-  {
-    "rank": 748,
-    "player": {
-      "id": 8474151,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8474151.png",
-      "firstName": "Ryan",
-      "lastName": "McDonagh"
-    },
-    "ridgeAttractivenessScore": 2.732257127761841
-  },
-  {
-    "rank": 749,
-    "player": {
-      "id": 8476483,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8476483.png",
-      "firstName": "Rickard",
-      "lastName": "Rakell"
-    },
-    "ridgeAttractivenessScore": 2.729111433029175
-  },
-  {
-    "rank": 750,
-    "player": {
-      "id": 8483690,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8483690.png",
-      "firstName": "Noah",
-      "lastName": "Laba"
-    },
-    "ridgeAttractivenessScore": 2.7279574871063232
-  },
-  {
-    "rank": 751,
-    "player": {
-      "id": 8477488,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8477488.png",
-      "firstName": "Brett",
-      "lastName": "Pesce"
-    },
-    "ridgeAttractivenessScore": 2.7244420051574707
-  },
-  {
-    "rank": 752,
-    "player": {
-      "id": 8480193,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8480193.png",
-      "firstName": "Daniil",
-      "lastName": "Tarasov"
-    },
-    "ridgeAttractivenessScore": 2.7211759090423584
-  },
-  {
-    "rank": 753,
-    "player": {
-      "id": 8484304,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8484304.png",
-      "firstName": "Uvis",
-      "lastName": "Balinskis"
-    },
-    "ridgeAttractivenessScore": 2.7179877758026123
-  },
-  {
-    "rank": 754,
-    "player": {
-      "id": 8482821,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CHI/8482821.png",
-      "firstName": "Arvid",
-      "lastName": "Soderblom"
-    },
-    "ridgeAttractivenessScore": 2.717663288116455
-  },
-  {
-    "rank": 755,
-    "player": {
-      "id": 8482079,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8482079.png",
-      "firstName": "Marco",
-      "lastName": "Rossi"
-    },
-    "ridgeAttractivenessScore": 2.717376708984375
-  },
-  {
-    "rank": 756,
-    "player": {
-      "id": 8482088,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8482088.png",
-      "firstName": "Justin",
-      "lastName": "Sourdif"
-    },
-    "ridgeAttractivenessScore": 2.713008403778076
-  },
-  {
-    "rank": 757,
-    "player": {
-      "id": 8477947,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/WSH/8477947.png",
-      "firstName": "Sonny",
-      "lastName": "Milano"
-    },
-    "ridgeAttractivenessScore": 2.7128665447235107
-  },
-  {
-    "rank": 758,
-    "player": {
-      "id": 8483460,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8483460.png",
-      "firstName": "David",
-      "lastName": "Jiricek"
-    },
-    "ridgeAttractivenessScore": 2.7115085124969482
-  },
-  {
-    "rank": 759,
-    "player": {
-      "id": 8482861,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8482861.png",
-      "firstName": "Vincent",
-      "lastName": "Iorio"
-    },
-    "ridgeAttractivenessScore": 2.7110297679901123
-  },
-  {
-    "rank": 760,
-    "player": {
-      "id": 8476883,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8476883.png",
-      "firstName": "Andrei",
-      "lastName": "Vasilevskiy"
-    },
-    "ridgeAttractivenessScore": 2.7076051235198975
-  },
-  {
-    "rank": 761,
-    "player": {
-      "id": 8482783,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8482783.png",
-      "firstName": "Aleksei",
-      "lastName": "Kolosov"
-    },
-    "ridgeAttractivenessScore": 2.706671714782715
-  },
-  {
-    "rank": 762,
-    "player": {
-      "id": 8482175,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8482175.png",
-      "firstName": "JJ",
-      "lastName": "Peterka"
-    },
-    "ridgeAttractivenessScore": 2.7007429599761963
-  },
-  {
-    "rank": 763,
-    "player": {
-      "id": 8479351,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DAL/8479351.png",
-      "firstName": "Sam",
-      "lastName": "Steel"
-    },
-    "ridgeAttractivenessScore": 2.6982879638671875
-  },
-  {
-    "rank": 764,
-    "player": {
-      "id": 8481617,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8481617.png",
-      "firstName": "Vasily",
-      "lastName": "Podkolzin"
-    },
-    "ridgeAttractivenessScore": 2.6972897052764893
-  },
-  {
-    "rank": 765,
-    "player": {
-      "id": 8476906,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8476906.png",
-      "firstName": "Shayne",
-      "lastName": "Gostisbehere"
-    },
-    "ridgeAttractivenessScore": 2.688911199569702
-  },
-  {
-    "rank": 766,
-    "player": {
-      "id": 8476878,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8476878.png",
-      "firstName": "Zemgus",
-      "lastName": "Girgensons"
-    },
-    "ridgeAttractivenessScore": 2.686814069747925
-  },
-  {
-    "rank": 767,
-    "player": {
-      "id": 8480028,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8480028.png",
-      "firstName": "Morgan",
-      "lastName": "Frost"
-    },
-    "ridgeAttractivenessScore": 2.6850204467773438
-  },
-  {
-    "rank": 768,
-    "player": {
-      "id": 8477406,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8477406.png",
-      "firstName": "Mattias",
-      "lastName": "Janmark"
-    },
-    "ridgeAttractivenessScore": 2.681950092315674
-  },
-  {
-    "rank": 769,
-    "player": {
-      "id": 8478542,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8478542.png",
-      "firstName": "Evan",
-      "lastName": "Rodrigues"
-    },
-    "ridgeAttractivenessScore": 2.681670665740967
-  },
-  {
-    "rank": 770,
-    "player": {
-      "id": 8476419,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYI/8476419.png",
-      "firstName": "Jean-Gabriel",
-      "lastName": "Pageau"
-    },
-    "ridgeAttractivenessScore": 2.679382562637329
-  },
-  {
-    "rank": 771,
-    "player": {
-      "id": 8475455,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8475455.png",
-      "firstName": "Brenden",
-      "lastName": "Dillon"
-    },
-    "ridgeAttractivenessScore": 2.6792969703674316
-  },
-  {
-    "rank": 772,
-    "player": {
-      "id": 8478493,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8478493.png",
-      "firstName": "Joel",
-      "lastName": "Eriksson Ek"
-    },
-    "ridgeAttractivenessScore": 2.6771483421325684
-  },
-  {
-    "rank": 773,
-    "player": {
-      "id": 8481711,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8481711.png",
-      "firstName": "Matias",
-      "lastName": "Maccelli"
-    },
-    "ridgeAttractivenessScore": 2.676576614379883
-  },
-  {
-    "rank": 774,
-    "player": {
-      "id": 8477933,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8477933.png",
-      "firstName": "Sam",
-      "lastName": "Reinhart"
-    },
-    "ridgeAttractivenessScore": 2.673079490661621
-  },
-  {
-    "rank": 775,
-    "player": {
-      "id": 8477478,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8477478.png",
-      "firstName": "William",
-      "lastName": "Carrier"
-    },
-    "ridgeAttractivenessScore": 2.667804479598999
-  },
-  {
-    "rank": 776,
-    "player": {
-      "id": 8477220,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/UTA/8477220.png",
-      "firstName": "Nate",
-      "lastName": "Schmidt"
-    },
-    "ridgeAttractivenessScore": 2.6646218299865723
-  },
-  {
-    "rank": 777,
-    "player": {
-      "id": 8480876,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8480876.png",
-      "firstName": "Curtis",
-      "lastName": "Douglas"
-    },
-    "ridgeAttractivenessScore": 2.660719633102417
-  },
-  {
-    "rank": 778,
-    "player": {
-      "id": 8484268,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8484268.png",
-      "firstName": "Nikita",
-      "lastName": "Tolopilo"
-    },
-    "ridgeAttractivenessScore": 2.6538994312286377
-  },
-  {
-    "rank": 779,
-    "player": {
-      "id": 8485414,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PIT/8485414.png",
-      "firstName": "Ben",
-      "lastName": "Kindel"
-    },
-    "ridgeAttractivenessScore": 2.6366496086120605
-  },
-  {
-    "rank": 780,
-    "player": {
-      "id": 8481607,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/DET/8481607.png",
-      "firstName": "Albert",
-      "lastName": "Johansson"
-    },
-    "ridgeAttractivenessScore": 2.628204345703125
-  },
-  {
-    "rank": 781,
-    "player": {
-      "id": 8481161,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8481161.png",
-      "firstName": "Jake",
-      "lastName": "Christiansen"
-    },
-    "ridgeAttractivenessScore": 2.6245617866516113
-  },
-  {
-    "rank": 782,
-    "player": {
-      "id": 8482165,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CGY/8482165.png",
-      "firstName": "Yan",
-      "lastName": "Kuznetsov"
-    },
-    "ridgeAttractivenessScore": 2.6180007457733154
-  },
-  {
-    "rank": 783,
-    "player": {
-      "id": 8479407,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8479407.png",
-      "firstName": "Jesper",
-      "lastName": "Bratt"
-    },
-    "ridgeAttractivenessScore": 2.610527992248535
-  },
-  {
-    "rank": 784,
-    "player": {
-      "id": 8477990,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8477990.png",
-      "firstName": "Brandon",
-      "lastName": "Halverson"
-    },
-    "ridgeAttractivenessScore": 2.6099932193756104
-  },
-  {
-    "rank": 785,
-    "player": {
-      "id": 8477953,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/EDM/8477953.png",
-      "firstName": "Kasperi",
-      "lastName": "Kapanen"
-    },
-    "ridgeAttractivenessScore": 2.60996150970459
-  },
-  {
-    "rank": 786,
-    "player": {
-      "id": 8478550,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8478550.png",
-      "firstName": "Artemi",
-      "lastName": "Panarin"
-    },
-    "ridgeAttractivenessScore": 2.6099512577056885
-  },
-  {
-    "rank": 787,
-    "player": {
-      "id": 8477409,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/FLA/8477409.png",
-      "firstName": "Carter",
-      "lastName": "Verhaeghe"
-    },
-    "ridgeAttractivenessScore": 2.608242988586426
-  },
-  {
-    "rank": 788,
-    "player": {
-      "id": 8477839,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NYR/8477839.png",
-      "firstName": "Conor",
-      "lastName": "Sheary"
-    },
-    "ridgeAttractivenessScore": 2.6082210540771484
-  },
-  {
-    "rank": 789,
-    "player": {
-      "id": 8479385,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/STL/8479385.png",
-      "firstName": "Jordan",
-      "lastName": "Kyrou"
-    },
-    "ridgeAttractivenessScore": 2.6001343727111816
-  },
-  {
-    "rank": 790,
-    "player": {
-      "id": 8480188,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8480188.png",
-      "firstName": "Fabian",
-      "lastName": "Zetterlund"
-    },
-    "ridgeAttractivenessScore": 2.5987727642059326
-  },
-  {
-    "rank": 791,
-    "player": {
-      "id": 8481528,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/OTT/8481528.png",
-      "firstName": "Dylan",
-      "lastName": "Cozens"
-    },
-    "ridgeAttractivenessScore": 2.5965166091918945
-  },
-  {
-    "rank": 792,
-    "player": {
-      "id": 8481605,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8481605.png",
-      "firstName": "Jackson",
-      "lastName": "LaCombe"
-    },
-    "ridgeAttractivenessScore": 2.593031644821167
-  },
-  {
-    "rank": 793,
-    "player": {
-      "id": 8480727,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8480727.png",
-      "firstName": "Zach",
-      "lastName": "Whitecloud"
-    },
-    "ridgeAttractivenessScore": 2.5851149559020996
-  },
-  {
-    "rank": 794,
-    "player": {
-      "id": 8484136,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VAN/8484136.png",
-      "firstName": "Max",
-      "lastName": "Sasson"
-    },
-    "ridgeAttractivenessScore": 2.560194969177246
-  },
-  {
-    "rank": 795,
-    "player": {
-      "id": 8482705,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CBJ/8482705.png",
-      "firstName": "Cole",
-      "lastName": "Sillinger"
-    },
-    "ridgeAttractivenessScore": 2.5328071117401123
-  },
-  {
-    "rank": 796,
-    "player": {
-      "id": 8478970,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8478970.png",
-      "firstName": "Jalen",
-      "lastName": "Chatfield"
-    },
-    "ridgeAttractivenessScore": 2.5182955265045166
-  },
-  {
-    "rank": 797,
-    "player": {
-      "id": 8481563,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/ANA/8481563.png",
-      "firstName": "Drew",
-      "lastName": "Helleson"
-    },
-    "ridgeAttractivenessScore": 2.4963433742523193
-  },
-  {
-    "rank": 798,
-    "player": {
-      "id": 8475200,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/SJS/8475200.png",
-      "firstName": "Dmitry",
-      "lastName": "Orlov"
-    },
-    "ridgeAttractivenessScore": 2.485461950302124
-  },
-  {
-    "rank": 799,
-    "player": {
-      "id": 8478414,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/NJD/8478414.png",
-      "firstName": "Timo",
-      "lastName": "Meier"
-    },
-    "ridgeAttractivenessScore": 2.482001304626465
-  },
-  {
-    "rank": 800,
-    "player": {
-      "id": 8481553,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/PHI/8481553.png",
-      "firstName": "Bobby",
-      "lastName": "Brink"
-    },
-    "ridgeAttractivenessScore": 2.4629855155944824
-  },
-  {
-    "rank": 801,
-    "player": {
-      "id": 8482093,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/CAR/8482093.png",
-      "firstName": "Seth",
-      "lastName": "Jarvis"
-    },
-    "ridgeAttractivenessScore": 2.4552955627441406
-  },
-  {
-    "rank": 802,
-    "player": {
-      "id": 8475149,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/MIN/8475149.png",
-      "firstName": "Marcus",
-      "lastName": "Johansson"
-    },
-    "ridgeAttractivenessScore": 2.4368531703948975
-  },
-  {
-    "rank": 803,
-    "player": {
-      "id": 8475913,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/VGK/8475913.png",
-      "firstName": "Mark",
-      "lastName": "Stone"
-    },
-    "ridgeAttractivenessScore": 2.4307594299316406
-  },
-  {
-    "rank": 804,
-    "player": {
-      "id": 8478178,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8478178.png",
-      "firstName": "Darren",
-      "lastName": "Raddysh"
-    },
-    "ridgeAttractivenessScore": 2.4108684062957764
-  },
-  {
-    "rank": 805,
-    "player": {
-      "id": 8479318,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TOR/8479318.png",
-      "firstName": "Auston",
-      "lastName": "Matthews"
-    },
-    "ridgeAttractivenessScore": 2.3401803970336914
-  },
-  {
-    "rank": 806,
-    "player": {
-      "id": 8482201,
-      "headshot": "https://assets.nhle.com/mugs/nhl/20252026/TBL/8482201.png",
-      "firstName": "Gage",
-      "lastName": "Goncalves"
-    },
-    "ridgeAttractivenessScore": 2.3298563957214355
-  }
-]
\ No newline at end of file
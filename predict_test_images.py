@@ -1,13 +1,15 @@
 """
 Script to predict attractiveness scores for test images (biz.jpg, whit.jpg)
-and rank them against existing NHL players from attractive_players_with_stats.json
+and rank them against existing NHL players from the player store
 """
 
-import json
 from pathlib import Path
 import joblib
 from face_processer import FaceProcesser
-from models import SimpleSpecificPlayerData
+from player_store import PlayerStore
+from league_sources import CURRENT_SEASON as CURRENT_SEASON_ID
+
+CURRENT_SEASON = int(CURRENT_SEASON_ID)
 
 # SVR Model and Scaler paths
 CACHE_DIR = Path("cached-models")
@@ -27,18 +29,9 @@ def load_svr_model_and_scaler():
 
 
 def load_nhl_players():
-    """Load NHL players with stats from attractive_players_with_stats.json"""
-    data_file = Path(__file__).parent / "players" / "attractive_players_with_stats.json"
-    
-    with open(data_file, 'r') as f:
-        data = json.load(f)
-    
-    # Cast each dict to SimpleSpecificPlayerData
-    players = [
-        SimpleSpecificPlayerData(**player_dict) for player_dict in data
-    ]
-    
-    return players
+    """Load scored NHL players with stats from the player store"""
+    with PlayerStore() as store:
+        return store.load_players_with_stats(CURRENT_SEASON)
 
 
 def predict_image_attractiveness(image_path, model, scaler):
@@ -76,7 +69,7 @@ if __name__ == "__main__":
     print("SVR model loaded successfully!\n")
     
     # Load NHL players
-    print("Loading NHL players from attractive_players_with_stats.json...")
+    print("Loading NHL players from the player store...")
     nhl_players = load_nhl_players()
     print(f"Loaded {len(nhl_players)} NHL players\n")
     
@@ -1,13 +1,15 @@
-import json
 from pathlib import Path
 from typing import List, Dict
 from collections import defaultdict
 from models import SimpleSpecificPlayerData
 from nhle_github import NhleGithub
+from player_store import PlayerStore
+from league_sources import CURRENT_SEASON as CURRENT_SEASON_ID
 import numpy as np
 from scipy import stats
 import joblib
 
+CURRENT_SEASON = int(CURRENT_SEASON_ID)
 
 # SVR Model and Scaler paths
 CACHE_DIR = Path("cached-models")
@@ -29,23 +31,13 @@ def load_svr_model_and_scaler():
 
 def load_attractive_players_with_stats() -> List[SimpleSpecificPlayerData]:
     """
-    Load player data from attractive_players_with_stats.json and cast to SimpleSpecificPlayerData
+    Load players with stats and attractiveness scores from the player store
     
     Returns:
         List[SimpleSpecificPlayerData]: List of players with their stats and attractiveness scores
     """
-    # Load the JSON file
-    data_file = Path(__file__).parent / "players" / "attractive_players_with_stats.json"
-    
-    with open(data_file, 'r') as f:
-        data = json.load(f)
-    
-    # Cast each dict to SimpleSpecificPlayerData
-    players: List[SimpleSpecificPlayerData] = [
-        SimpleSpecificPlayerData(**player_dict) for player_dict in data
-    ]
-    
-    return players
+    with PlayerStore() as store:
+        return store.load_players_with_stats(CURRENT_SEASON)
 
 
 def get_position_group(position: str) -> str:
@@ -72,27 +64,18 @@ if __name__ == "__main__":
     print("SVR model loaded successfully!\n")
     
     # Load the data
-    print("Loading player data from attractiveness_analysis.json and stats...")
-    players_file = Path(__file__).parent / "players" / "attractiveness_analysis.json"
-    
-    with open(players_file, 'r') as f:
-        attractiveness_data = json.load(f)
+    print("Loading players with stats and SVR attractiveness scores from the player store...")
+    with PlayerStore() as store:
+        players: List[SimpleSpecificPlayerData] = store.load_players_with_stats(CURRENT_SEASON)
     
-    # Create a map of player ID to SVR attractiveness score
-    svr_scores = {p['player']['id']: p['ridgeAttractivenessScore'] for p in attractiveness_data}
-    
-    # Get players with stats
-    from collect_all_player_data import get_attractive_players_with_stats
-    
-    print("Collecting player stats...")
-    players_with_stats = get_attractive_players_with_stats()
-    
-    # Update with SVR scores
-    players: List[SimpleSpecificPlayerData] = []
-    for player in players_with_stats:
-        if player.player.id in svr_scores:
-            player.ridgeAttractivenessScore = svr_scores[player.player.id]
-            players.append(player)
+    if not players:
+        # Nothing collected for this season yet: fetch stats (collect writes them to the store)
+        from collect_all_player_data import get_attractive_players_with_stats
+        
+        print("No stats stored yet, collecting player stats...")
+        with PlayerStore() as store:
+            store.upsert_player_stats(get_attractive_players_with_stats(), CURRENT_SEASON)
+            players = store.load_players_with_stats(CURRENT_SEASON)
     
     print(f"Loaded {len(players)} players with stats and SVR attractiveness scores\n")
     
@@ -0,0 +1,167 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Sequence, TypeVar
+
+import requests
+from http_client import client_retries_disabled
+from resilience import RETRYABLE_STATUS_CODES, retry_after_seconds
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AdaptiveTokenBucket:
+    """
+    Token bucket whose refill rate adapts to the server's responses.
+
+    The rate is halved on a 429/5xx (and all requests pause for Retry-After
+    when the server sends one), then creeps back up by a small step after each
+    success, so the fetcher settles just under whatever the API actually allows.
+    Throttled responses that arrive within a second (or the Retry-After) of the
+    last decrease belong to the same burst and don't halve the rate again.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst: Optional[int] = None,
+        min_rate: float = 0.5,
+        increase_step: Optional[float] = None,
+    ):
+        """
+        Args:
+            requests_per_second: Starting and maximum refill rate
+            burst: Bucket capacity (defaults to one second's worth of tokens)
+            min_rate: Floor for the rate after repeated throttling
+            increase_step: Rate added back after each successful request
+                           (default: 5% of requests_per_second)
+        """
+        self.max_rate = requests_per_second
+        self.rate = requests_per_second
+        self.min_rate = min(min_rate, requests_per_second)
+        self.increase_step = increase_step or requests_per_second * 0.05
+        self.capacity = burst or max(1, int(requests_per_second))
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        # End of the window in which further throttling is part of the last decrease
+        self.decrease_window_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            await asyncio.sleep(wait)
+
+    def on_success(self):
+        self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_throttled(self, retry_after: Optional[float] = None):
+        now = time.monotonic()
+        self._refill(now)
+        if retry_after:
+            self.paused_until = max(self.paused_until, now + retry_after)
+        if now < self.decrease_window_until:
+            # Requests already in flight when the rate dropped; one halving per burst
+            return
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.decrease_window_until = now + max(1.0, retry_after or 0.0)
+        # Drain the bucket so queued workers don't fire a burst straight back
+        self.tokens = min(self.tokens, 0.0)
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+def _fetch_once(fetch: Callable[[T], R], item: T) -> R:
+    # The limiter owns retries for its items: each attempt is one request, so a
+    # 429 reaches the bucket right away instead of after the client's own retries
+    with client_retries_disabled():
+        return fetch(item)
+
+
+async def fetch_all_rate_limited_async(
+    items: Sequence[T],
+    fetch: Callable[[T], R],
+    requests_per_second: float = 8.0,
+    max_concurrency: int = 8,
+    max_attempts: int = 5,
+    needs_token: Optional[Callable[[T], bool]] = None,
+    on_error: Optional[Callable[[T, Exception], None]] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> list[Optional[R]]:
+    """
+    Run a blocking fetch for every item under a shared requests-per-second budget.
+
+    Args:
+        items: Inputs to fetch, e.g. players
+        fetch: Blocking function doing one request per item (runs in a worker thread)
+        requests_per_second: Request budget; lowered automatically on 429/5xx
+        max_concurrency: Max requests in flight at once
+        max_attempts: Attempts per item before giving up on a retryable error.
+                      These are the only retries: HttpClient requests made by
+                      fetch are sent once (see client_retries_disabled)
+        needs_token: Return False for items that won't hit the network (e.g. cached)
+                     so they skip the rate limiter
+        on_error: Called with (item, exception) for an item that failed for good
+        on_progress: Called with (completed, total) after each item
+
+    Returns:
+        Results in the same order as items, with None where the fetch failed
+    """
+    bucket = AdaptiveTokenBucket(requests_per_second)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_running_loop()
+    completed = 0
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        async def run(item: T) -> Optional[R]:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    for attempt in range(1, max_attempts + 1):
+                        if needs_token is None or needs_token(item):
+                            await bucket.acquire()
+                        try:
+                            result = await loop.run_in_executor(executor, _fetch_once, fetch, item)
+                            bucket.on_success()
+                            return result
+                        except Exception as e:
+                            if not _is_retryable(e) or attempt == max_attempts:
+                                raise
+                            response = getattr(e, "response", None)
+                            bucket.on_throttled(retry_after_seconds(response))
+                except Exception as e:
+                    if on_error is None:
+                        raise
+                    on_error(item, e)
+                    return None
+                finally:
+                    completed += 1
+                    if on_progress is not None:
+                        on_progress(completed, len(items))
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+def fetch_all_rate_limited(items: Sequence[T], fetch: Callable[[T], R], **kwargs) -> list[Optional[R]]:
+    """Blocking wrapper around fetch_all_rate_limited_async (same arguments)"""
+    return asyncio.run(fetch_all_rate_limited_async(items, fetch, **kwargs))
@@ -0,0 +1,71 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one computation.
+
+    The first caller for a key runs the function; callers that arrive while it
+    is in flight wait for and share its result (or exception). With memoize on,
+    successful results are also kept for the lifetime of the object, so each key
+    is computed exactly once per run. Failures are never memoized, so a later
+    call can retry.
+    """
+
+    def __init__(self, memoize: bool = True):
+        """
+        Args:
+            memoize: Keep successful results after the call completes
+        """
+        self.memoize = memoize
+        self._lock = threading.Lock()
+        self._futures: Dict[Hashable, Future] = {}
+        self.stats = {"computed": 0, "shared": 0}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Return fn()'s result for key, running fn at most once at a time per key.
+
+        Args:
+            key: Identity of the work, e.g. ("landing", player_id) or a URL
+            fn: Zero-argument function doing the work
+
+        Returns:
+            The (possibly shared) result of fn
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                self.stats["shared"] += 1
+                owner = False
+            else:
+                future = Future()
+                self._futures[key] = future
+                self.stats["computed"] += 1
+                owner = True
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            with self._lock:
+                self._futures.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        future.set_result(result)
+        if not self.memoize:
+            with self._lock:
+                self._futures.pop(key, None)
+        return result
+
+    def forget(self, key: Hashable):
+        """Drop a memoized result so the next call recomputes it"""
+        with self._lock:
+            self._futures.pop(key, None)
@@ -0,0 +1,157 @@
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+
+# Status codes that mean "slow down / try again" rather than "this request is wrong"
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def retry_after_seconds(response: Optional[requests.Response]) -> Optional[float]:
+    """Seconds requested by a Retry-After header (delta or HTTP date), if any"""
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 10.0) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2^attempt)]"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class RetryBudget:
+    """
+    Process-wide cap on retries, as a fraction of original requests.
+
+    Every original request deposits `ratio` tokens and every retry spends one,
+    so during a brownout retries can add at most ~ratio extra load instead of
+    multiplying traffic by the per-request attempt count. `reserve` tokens are
+    available up front so a quiet client can still retry a few early failures.
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10.0, max_tokens: float = 100.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = reserve
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """
+    Per-host breaker over a rolling window of request outcomes.
+
+    Closed: traffic flows. When at least min_requests of the last `window`
+    outcomes are in and the failure rate reaches error_threshold, the breaker
+    opens and callers pause for `cooldown` seconds. Then it half-opens and lets
+    a single probe through: success closes it, failure re-opens it. Outcomes of
+    requests that were already in flight when the breaker opened are ignored,
+    so only the probe decides when it closes again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        window: int = 50,
+        min_requests: int = 20,
+        error_threshold: float = 0.5,
+        cooldown: float = 15.0,
+    ):
+        self.window = window
+        self.min_requests = min_requests
+        self.error_threshold = error_threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> tuple[float, bool]:
+        """
+        (0, is_probe) if the caller may send a request now, else (seconds to
+        wait before asking again, False)
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return 0.0, False
+            now = time.monotonic()
+            if self.state == self.OPEN:
+                remaining = self.opened_at + self.cooldown - now
+                if remaining > 0:
+                    return remaining, False
+                self.state = self.HALF_OPEN
+            if not self._probe_in_flight:
+                self._probe_in_flight = True
+                return 0.0, True
+            return min(1.0, self.cooldown), False
+
+    def wait_until_allowed(self) -> bool:
+        """
+        Block while the breaker is open (or another caller is probing).
+
+        Returns:
+            True if the caller is the half-open probe; it must then call
+            record(..., probe=True) whatever happens to its request
+        """
+        while True:
+            wait, probe = self._try_acquire()
+            if wait <= 0:
+                return probe
+            time.sleep(wait)
+
+    def record(self, success: bool, probe: bool = False):
+        with self._lock:
+            if probe:
+                self._probe_in_flight = False
+                if success:
+                    self.state = self.CLOSED
+                    self._outcomes.clear()
+                else:
+                    self._open()
+                return
+            if self.state != self.CLOSED:
+                # Sent before the breaker opened; only the probe's outcome counts now
+                return
+
+            self._outcomes.append(success)
+            failures = self._outcomes.count(False)
+            if (
+                len(self._outcomes) >= self.min_requests
+                and failures / len(self._outcomes) >= self.error_threshold
+            ):
+                self._open()
+
+    def _open(self):
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+        self._outcomes.clear()
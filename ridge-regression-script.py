@@ -70,18 +70,14 @@ else:
     else:
         # Generate embeddings
         print(f"\nGenerating embeddings from combined dataset (this may take a while)...")
-        embeddings = []
-        scores = []
-        
-        for i in range(len(df_scut)):
-            try:
-                embedding = processor.get_embedding_from_path(df_scut.loc[i, "path"])
-                embeddings.append(embedding)
-                scores.append(df_scut.loc[i, "score"])
-                if (i + 1) % 100 == 0:
-                    print(f"  Processed {i + 1}/{len(df_scut)} images")
-            except Exception as e:
-                print(f"Error on image {i}: {e}")
+        # Detection per image, recognition batched per chunk of aligned faces
+        batch, ok = processor.get_embeddings_batch(
+            list(df_scut["path"]),
+            on_error=lambda i, e: print(f"Error on image {i}: {e}"),
+            dataset="SCUT",
+        )
+        embeddings = list(batch[ok])
+        scores = list(df_scut["score"][ok])
         
         # Save to cache
         print(f"\nSaving embeddings to cache: {CACHE_FILE}")
@@ -0,0 +1,210 @@
+"""
+Delta-encoded, compressed archive of every TeamRoster fetch.
+
+Each team has one append-only file of gzip members, one JSON record per member:
+a full keyframe every `keyframe_interval` records, and in between only the
+players that were added, changed or removed since the previous fetch. Fetches
+that changed nothing write nothing. A small sidecar index keeps the byte offset
+of every keyframe, so the roster at any date is rebuilt by seeking to the last
+keyframe before it and replaying a handful of deltas.
+
+    python roster_archive.py --team TOR --date 2025-11-01
+"""
+
+import argparse
+import bisect
+import gzip
+import json
+import os
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+from models import TeamRoster
+
+ARCHIVE_DIR = Path(__file__).parent / "nhle" / "roster-archive"
+
+ROSTER_GROUPS = ("forwards", "defensemen", "goalies")
+
+
+def _roster_state(roster: TeamRoster) -> Dict[str, list]:
+    """Player id (as a JSON key) -> [roster group, player fields]"""
+    return {
+        str(player.id): [group, player.model_dump(mode="json", exclude_none=True)]
+        for group in ROSTER_GROUPS
+        for player in getattr(roster, group)
+    }
+
+
+def _state_roster(state: Dict[str, list]) -> TeamRoster:
+    groups: Dict[str, list] = {group: [] for group in ROSTER_GROUPS}
+    for group, player in state.values():
+        groups[group].append(player)
+    return TeamRoster(**groups)
+
+
+class RosterArchive:
+    """
+    Append-only roster history per team, stored as keyframes plus deltas.
+
+    Files live in archive_dir as {TEAM}.gz (records) and {TEAM}.idx.json
+    (keyframe dates and offsets, last record date, records since the keyframe).
+    """
+
+    def __init__(self, archive_dir: Path = ARCHIVE_DIR, keyframe_interval: int = 30):
+        """
+        Args:
+            archive_dir: Directory holding the per-team archives
+            keyframe_interval: Delta records written between full keyframes
+        """
+        self.archive_dir = Path(archive_dir)
+        self.keyframe_interval = keyframe_interval
+        self._last_state: Dict[str, Dict[str, list]] = {}
+        self._lock = threading.Lock()
+
+    def _data_path(self, team_code: str) -> Path:
+        return self.archive_dir / f"{team_code}.gz"
+
+    def _index_path(self, team_code: str) -> Path:
+        return self.archive_dir / f"{team_code}.idx.json"
+
+    def _load_index(self, team_code: str) -> dict:
+        try:
+            with open(self._index_path(team_code), "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"keyframes": [], "lastDate": None, "sinceKeyframe": 0}
+
+    def _save_index(self, team_code: str, index: dict):
+        path = self._index_path(team_code)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, path)
+
+    def _records_from(self, team_code: str, offset: int) -> Iterator[dict]:
+        with open(self._data_path(team_code), "rb") as raw:
+            raw.seek(offset)
+            # Concatenated gzip members read back as one stream of JSON lines
+            with gzip.GzipFile(fileobj=raw) as f:
+                for line in f:
+                    yield json.loads(line)
+
+    def _replay(self, team_code: str, index: dict, on_date: Optional[str]) -> Optional[Dict[str, list]]:
+        keyframes = index["keyframes"]
+        if on_date is None:
+            position = len(keyframes)
+        else:
+            position = bisect.bisect_right([kf_date for kf_date, _ in keyframes], on_date)
+        if position == 0:
+            return None
+
+        state: Dict[str, list] = {}
+        for record in self._records_from(team_code, keyframes[position - 1][1]):
+            if on_date is not None and record["date"] > on_date:
+                break
+            if "keyframe" in record:
+                state = record["keyframe"]
+                continue
+            for player_id in record.get("removed", []):
+                state.pop(player_id, None)
+            state.update(record.get("set", {}))
+        return state
+
+    def record(self, team_code: str, roster: TeamRoster, on_date: Optional[str] = None) -> bool:
+        """
+        Append a roster fetch to the team's archive.
+
+        Args:
+            team_code: Three-letter team code
+            roster: Roster as returned by NhleGithub.get_players_on_team
+            on_date: ISO date of the fetch (defaults to today); must not be
+                     earlier than the last recorded date
+
+        Returns:
+            True if a record was written, False if the roster was unchanged
+        """
+        on_date = on_date or date.today().isoformat()
+        current = _roster_state(roster)
+
+        with self._lock:
+            index = self._load_index(team_code)
+            if index["lastDate"] and on_date < index["lastDate"]:
+                raise ValueError(f"{team_code} archive already has {index['lastDate']}, can't append {on_date}")
+
+            previous = self._last_state.get(team_code)
+            if previous is None:
+                previous = self._replay(team_code, index, None) or {}
+
+            is_keyframe = not index["keyframes"] or index["sinceKeyframe"] >= self.keyframe_interval
+            if is_keyframe:
+                if current == previous and index["keyframes"]:
+                    return False
+                record = {"date": on_date, "keyframe": current}
+            else:
+                changed = {pid: entry for pid, entry in current.items() if previous.get(pid) != entry}
+                removed = [pid for pid in previous if pid not in current]
+                if not changed and not removed:
+                    return False
+                record = {"date": on_date, "set": changed, "removed": removed}
+
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            line = json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+            with open(self._data_path(team_code), "ab") as f:
+                offset = f.tell()
+                f.write(gzip.compress(line.encode("utf-8"), compresslevel=9))
+
+            if is_keyframe:
+                index["keyframes"].append([on_date, offset])
+                index["sinceKeyframe"] = 0
+            else:
+                index["sinceKeyframe"] += 1
+            index["lastDate"] = on_date
+            self._save_index(team_code, index)
+            self._last_state[team_code] = current
+            return True
+
+    def roster_at(self, team_code: str, on_date: str) -> Optional[TeamRoster]:
+        """
+        Team roster as last recorded on or before on_date (ISO date).
+
+        Returns:
+            The reconstructed TeamRoster, or None if nothing was recorded by then
+        """
+        with self._lock:
+            state = self._replay(team_code, self._load_index(team_code), on_date)
+        return _state_roster(state) if state is not None else None
+
+    def league_at(self, on_date: str) -> Dict[str, TeamRoster]:
+        """Every archived team's roster as of on_date"""
+        rosters = {}
+        for index_path in sorted(self.archive_dir.glob("*.idx.json")):
+            team_code = index_path.name.split(".")[0]
+            roster = self.roster_at(team_code, on_date)
+            if roster is not None:
+                rosters[team_code] = roster
+        return rosters
+
+    def size_bytes(self) -> int:
+        if not self.archive_dir.exists():
+            return 0
+        return sum(path.stat().st_size for path in self.archive_dir.iterdir())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild an archived roster as of a date")
+    parser.add_argument("--team", required=True, help="team code, e.g. TOR")
+    parser.add_argument("--date", default=date.today().isoformat(), help="ISO date, e.g. 2025-11-01")
+    args = parser.parse_args()
+
+    archive = RosterArchive()
+    roster = archive.roster_at(args.team, args.date)
+    if roster is None:
+        print(f"No {args.team} roster archived on or before {args.date}")
+    else:
+        for group in ROSTER_GROUPS:
+            players = getattr(roster, group)
+            print(f"{group} ({len(players)}):")
+            for player in players:
+                print(f"  {player.sweaterNumber or '':>2} {player.firstName.default} {player.lastName.default}")
+    print(f"\nArchive size: {archive.size_bytes() / 1024:.1f} KiB")
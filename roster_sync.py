@@ -0,0 +1,87 @@
+from typing import Dict, List
+from models import HeadshotChange, RosterDiff, RosterEntry, RosterTrade, SimplePlayer
+
+
+def roster_entries(players_by_team: Dict[str, List[SimplePlayer]], source: str = "nhl") -> Dict[int, RosterEntry]:
+    """
+    Flatten simplified per-team rosters into one entry per player id.
+
+    Args:
+        players_by_team: Team code -> players with headshots, as built by full_league_script
+        source: League source the rosters were fetched from
+
+    Returns:
+        dict mapping player id to RosterEntry (a player listed twice keeps the last team)
+    """
+    entries = {}
+    for team_code, players in players_by_team.items():
+        for player in players:
+            entries[player.id] = RosterEntry(
+                id=player.id,
+                team=team_code,
+                headshot=player.headshot,
+                firstName=player.firstName.default,
+                lastName=player.lastName.default,
+                source=source,
+            )
+    return entries
+
+
+def diff_rosters(previous: Dict[int, RosterEntry], current: Dict[int, RosterEntry]) -> RosterDiff:
+    """
+    Compare two league-wide roster snapshots.
+
+    Args:
+        previous: Snapshot from the last sync (PlayerStore.load_roster_snapshot)
+        current: Snapshot built from today's rosters
+
+    Returns:
+        RosterDiff with added/removed players, team changes and headshot URL changes.
+        Headshot URLs embed the team, so a traded player usually shows up in both
+        traded and headshotChanged.
+    """
+    diff = RosterDiff()
+    for player_id, entry in current.items():
+        old = previous.get(player_id)
+        if old is None:
+            diff.added.append(entry)
+            continue
+        if old.team != entry.team:
+            diff.traded.append(RosterTrade(player=entry, fromTeam=old.team, toTeam=entry.team))
+        if old.headshot != entry.headshot:
+            diff.headshotChanged.append(
+                HeadshotChange(player=entry, oldHeadshot=old.headshot, newHeadshot=entry.headshot)
+            )
+
+    for player_id, entry in previous.items():
+        if player_id not in current:
+            diff.removed.append(entry)
+
+    return diff
+
+
+def players_to_rescore(diff: RosterDiff) -> set[int]:
+    """Players whose headshot is new or changed, so their embedding/score must be recomputed"""
+    return {e.id for e in diff.added} | {c.player.id for c in diff.headshotChanged}
+
+
+def players_to_refetch(diff: RosterDiff) -> set[int]:
+    """Players whose landing page (team, bio, stats) must be re-fetched"""
+    return {e.id for e in diff.added} | {t.player.id for t in diff.traded}
+
+
+def print_diff(diff: RosterDiff):
+    print("=" * 60)
+    print("ROSTER CHANGES SINCE LAST SYNC")
+    print("=" * 60)
+    print(f"  Added: {len(diff.added)}")
+    for e in diff.added:
+        print(f"    + {e.firstName} {e.lastName} ({e.team})")
+    print(f"  Removed: {len(diff.removed)}")
+    for e in diff.removed:
+        print(f"    - {e.firstName} {e.lastName} ({e.team})")
+    print(f"  Traded: {len(diff.traded)}")
+    for t in diff.traded:
+        print(f"    ~ {t.player.firstName} {t.player.lastName}: {t.fromTeam} -> {t.toTeam}")
+    print(f"  Headshot changed: {len(diff.headshotChanged)}")
+    print("=" * 60)
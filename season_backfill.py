@@ -0,0 +1,167 @@
+"""
+Backfill rosters, headshots and season totals for a range of NHL seasons.
+
+Seasons are ingested concurrently, each one through its own NhleGithub
+(parallel roster fetches + paged bulk stats), and written to the player store.
+Past seasons that finished ingesting are marked complete and skipped on later
+runs; the current season is always refreshed.
+
+    python season_backfill.py --from 20152016 --to 20242025 --score
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+from nhle_github import NhleGithub, CURRENT_SEASON, teams_for_season, unique_players
+from player_store import PlayerStore
+from roster_sync import roster_entries
+
+# Same SVR model and scaler as full_league_script.py
+CACHE_DIR = Path("cached-models")
+MODEL_FILE = CACHE_DIR / "beauty_score_model_male.pkl"
+SCALER_FILE = CACHE_DIR / "beauty_score_model_male_scaler.pkl"
+
+
+def season_range(first: int, last: int) -> List[int]:
+    """Season ids from first to last inclusive, e.g. 20222023 .. 20242025"""
+    seasons = []
+    start_year = first // 10000
+    while start_year <= last // 10000:
+        seasons.append(start_year * 10000 + start_year + 1)
+        start_year += 1
+    return seasons
+
+
+def ingest_season(season: int, store: PlayerStore) -> Dict[str, int]:
+    """
+    Fetch one season's rosters and bulk season totals into the store.
+
+    Returns:
+        Counts for the summary table ({"teams", "players", "withStats", "failedTeams"})
+    """
+    nhle = NhleGithub(season=str(season))
+    failed_teams = []
+
+    rosters = nhle.gat_all_players_on_all_teams(
+        on_error=lambda team_code, e: failed_teams.append(team_code),
+        team_codes=teams_for_season(season),
+    )
+    players_by_team = {
+        team_code: [p for p in unique_players(nhle.simplify_roster(roster)) if p.headshot.strip()]
+        for team_code, roster in rosters.items()
+    }
+    entries = roster_entries(players_by_team)
+    store.upsert_season_roster(season, entries.values())
+
+    bulk = nhle.get_bulk_season_stats(season)
+    store.upsert_bulk_season(season, {pid: b for pid, b in bulk.items() if pid in entries})
+
+    return {
+        "teams": len(rosters),
+        "players": len(entries),
+        "withStats": sum(1 for pid in entries if pid in bulk),
+        "failedTeams": len(failed_teams),
+    }
+
+
+def score_seasons(seasons: List[int], store: PlayerStore, workers: int = 4):
+    """Embed and score every not-yet-scored headshot in the given seasons"""
+    import joblib
+    from face_processer import FaceProcesser
+
+    model = joblib.load(MODEL_FILE)
+    scaler = joblib.load(SCALER_FILE)
+    processor = FaceProcesser()
+
+    def score(headshot: str) -> Optional[float]:
+        try:
+            embedding = processor.get_embedding_from_url(headshot)
+        except Exception as e:
+            print(f"    Could not embed {headshot}: {e}")
+            return None
+        return float(model.predict(scaler.transform(embedding.reshape(1, -1)))[0])
+
+    for season in seasons:
+        entries = store.load_season_roster(season, unscored_only=True)
+        if not entries:
+            continue
+        print(f"  Scoring {len(entries)} headshots for {season}...")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            scores = dict(zip((e.id for e in entries), executor.map(score, (e.headshot for e in entries))))
+        store.set_season_scores(season, {pid: s for pid, s in scores.items() if s is not None})
+
+
+def backfill(
+    seasons: List[int],
+    parallel_seasons: int = 4,
+    force: bool = False,
+    score: bool = False,
+):
+    """
+    Args:
+        seasons: Season ids to ingest
+        parallel_seasons: Seasons ingested at the same time
+        force: Re-ingest seasons already marked complete
+        score: Also embed and score each season's headshots
+    """
+    current_season = int(CURRENT_SEASON)
+
+    with PlayerStore() as store:
+        completed = store.completed_seasons()
+        todo = [s for s in seasons if force or s not in completed]
+        skipped = [s for s in seasons if s not in todo]
+        if skipped:
+            print(f"Skipping {len(skipped)} seasons already stored as complete: {', '.join(map(str, skipped))}")
+
+        print(f"Backfilling {len(todo)} seasons ({parallel_seasons} at a time)...")
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=parallel_seasons) as executor:
+            futures = {executor.submit(ingest_season, season, store): season for season in todo}
+            for future in as_completed(futures):
+                season = futures[future]
+                try:
+                    counts = future.result()
+                except Exception as e:
+                    print(f"  {season}: failed - {e}")
+                    continue
+                print(
+                    f"  {season}: {counts['teams']} teams, {counts['players']} players, "
+                    f"{counts['withStats']} with stats"
+                    + (f", {counts['failedTeams']} teams failed" if counts["failedTeams"] else "")
+                )
+                # A finished past season can't change any more; the current one keeps moving
+                if counts["failedTeams"] == 0 and season < current_season:
+                    store.mark_season(season, complete=True)
+        print(f"Ingested in {time.time() - start:.1f}s\n")
+
+        if score:
+            score_seasons(seasons, store)
+
+        rows = store.load_historical_players(seasons)
+
+    print("=" * 60)
+    print("MOST ATTRACTIVE PLAYER PER SEASON")
+    print("=" * 60)
+    best: Dict[int, dict] = {}
+    for row in rows:
+        if row["score"] is not None and row["season"] not in best:
+            best[row["season"]] = row
+    for season in seasons:
+        row = best.get(season)
+        if row:
+            print(f"{season}  {row['first_name']} {row['last_name']:20s} {row['team']}  {row['score']:.4f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill rosters, headshots and stats for a range of seasons")
+    parser.add_argument("--from", dest="first", type=int, required=True, help="first season, e.g. 20152016")
+    parser.add_argument("--to", dest="last", type=int, default=int(CURRENT_SEASON), help="last season")
+    parser.add_argument("--parallel", type=int, default=4, help="seasons ingested at once")
+    parser.add_argument("--force", action="store_true", help="re-ingest seasons already marked complete")
+    parser.add_argument("--score", action="store_true", help="embed and score each season's headshots")
+    args = parser.parse_args()
+
+    backfill(season_range(args.first, args.last), args.parallel, args.force, args.score)
@@ -0,0 +1,229 @@
+import json
+import os
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Optional
+from http_cache import HttpCache
+from http_client import HttpClient, get_http_client
+
+DEFAULT_STANDINGS_FILE = Path(__file__).parent / "nhle" / "league-standings.json"
+SNAPSHOT_DIR = Path(__file__).parent / "nhle" / "standings"
+STANDINGS_URL = "https://api-web.nhle.com/v1/standings/now"
+
+
+def _team_abbrev(standing: dict) -> Optional[str]:
+    # The standings endpoint nests it as {"default": "TOR"}; older dumps use a plain string
+    abbrev = standing.get("teamAbbrev")
+    if isinstance(abbrev, dict):
+        return abbrev.get("default")
+    return abbrev
+
+
+def index_standings(standings_data: dict) -> dict[str, dict[str, Any]]:
+    """Standings rows keyed by team abbreviation"""
+    return {
+        _team_abbrev(standing): standing
+        for standing in standings_data.get("standings", [])
+        if _team_abbrev(standing)
+    }
+
+
+class _StandingsLookup:
+    """
+    Lookups shared by the standings sources. Subclasses set _by_team and _lock
+    and implement _refresh and get.
+    """
+
+    _by_team: dict[str, dict[str, Any]]
+    _lock: threading.Lock
+
+    def _refresh(self):
+        raise NotImplementedError
+
+    def get(self, team_code: str) -> Optional[dict[str, Any]]:
+        raise NotImplementedError
+
+    def get_field(self, team_code: str, field: str, default: Any = None) -> Any:
+        """Single standings field for a team, or default if the team or field is missing"""
+        standing = self.get(team_code)
+        if standing is None:
+            return default
+        return standing.get(field, default)
+
+    def all(self) -> dict[str, dict[str, Any]]:
+        """Every team's standings row, keyed by team abbreviation"""
+        with self._lock:
+            self._refresh()
+            return dict(self._by_team)
+
+
+class StandingsIndex(_StandingsLookup):
+    """
+    In-memory index of league-standings.json keyed by team abbreviation.
+
+    The file is parsed once and re-read only when its mtime changes, so team
+    lookups are dict hits instead of a re-parse and linear scan per call.
+    """
+
+    def __init__(self, standings_file: Path = DEFAULT_STANDINGS_FILE):
+        """
+        Args:
+            standings_file: JSON dump of the /v1/standings endpoint
+        """
+        self.standings_file = Path(standings_file)
+        self._by_team: dict[str, dict[str, Any]] = {}
+        self._loaded_mtime: Optional[float] = None
+        self._warned_missing = False
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        try:
+            mtime = self.standings_file.stat().st_mtime
+        except FileNotFoundError:
+            if not self._warned_missing:
+                print(f"Warning: league-standings.json not found at {self.standings_file}")
+                self._warned_missing = True
+            self._by_team = {}
+            self._loaded_mtime = None
+            return
+
+        if mtime == self._loaded_mtime:
+            return
+
+        try:
+            with open(self.standings_file, "r") as f:
+                standings_data = json.load(f)
+        except Exception as e:
+            print(f"Error reading league standings: {e}")
+            return
+
+        self._by_team = index_standings(standings_data)
+        self._loaded_mtime = mtime
+        self._warned_missing = False
+
+    def get(self, team_code: str) -> Optional[dict[str, Any]]:
+        """
+        Full standings row for a team (pointPctg, wins, losses, goalDifferential, ...).
+
+        Args:
+            team_code: Three-letter team code (e.g., 'TOR')
+
+        Returns:
+            The raw standings dict, or None if the team (or file) is missing
+        """
+        with self._lock:
+            self._refresh()
+            return self._by_team.get(team_code)
+
+
+class LiveStandings(_StandingsLookup):
+    """
+    Standings pulled from the /v1/standings/now endpoint and served from memory.
+
+    The endpoint is fetched (through the HTTP cache, if given) at most once per ttl, and
+    the newest standings for each date are saved to nhle/standings/{date}.json.
+    If the API is unreachable, the newest saved snapshot is used, then the
+    manually placed league-standings.json as a last resort. Same lookup API as
+    StandingsIndex.
+    """
+
+    def __init__(
+        self,
+        http_client: Optional[HttpClient] = None,
+        cache: Optional[HttpCache] = None,
+        ttl: float = 15 * 60,
+        snapshot_dir: Path = SNAPSHOT_DIR,
+        fallback_file: Path = DEFAULT_STANDINGS_FILE,
+    ):
+        """
+        Args:
+            http_client: Client for the standings request (default: shared client)
+            cache: On-disk HTTP cache, e.g. get_http_cache() (None = fetch directly)
+            ttl: Seconds between refreshes
+            snapshot_dir: Where dated standings snapshots are written
+            fallback_file: Static standings dump used when nothing else is available
+        """
+        self.http = http_client or get_http_client()
+        self.cache = cache
+        self.ttl = ttl
+        self.snapshot_dir = Path(snapshot_dir)
+        self.fallback = StandingsIndex(fallback_file)
+        self.source = None
+        self._by_team: dict[str, dict[str, Any]] = {}
+        self._loaded_at = 0.0
+        self._warned_teams: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _save_snapshot(self, standings_data: dict):
+        rows = standings_data.get("standings", [])
+        snapshot_date = rows[0].get("date") if rows else None
+        snapshot_date = snapshot_date or date.today().isoformat()
+
+        path = self.snapshot_dir / f"{snapshot_date}.json"
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                if json.load(f) == standings_data:
+                    return
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        # Same date but newer results (e.g. a late game finished): keep the latest
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(standings_data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _latest_snapshot(self) -> Optional[dict]:
+        snapshots = sorted(self.snapshot_dir.glob("*.json"))
+        if not snapshots:
+            return None
+        with open(snapshots[-1], "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _fetch(self) -> dict:
+        if self.cache is not None:
+            return self.cache.fetch_json(self.http, STANDINGS_URL, self.ttl)
+        response = self.http.get(STANDINGS_URL)
+        response.raise_for_status()
+        return response.json()
+
+    def _refresh(self):
+        # Also holds when every source failed, so lookups don't refetch on each call
+        if time.time() - self._loaded_at < self.ttl:
+            return
+
+        try:
+            standings_data = self._fetch()
+            self._save_snapshot(standings_data)
+            self.source = "live"
+        except Exception as e:
+            print(f"Warning: could not fetch live standings ({e}), using the latest saved snapshot")
+            standings_data = self._latest_snapshot()
+            self.source = "snapshot"
+
+        if standings_data is not None:
+            self._by_team = index_standings(standings_data)
+        else:
+            self._by_team = self.fallback.all()
+            self.source = "league-standings.json"
+        self._loaded_at = time.time()
+
+    def get(self, team_code: str) -> Optional[dict[str, Any]]:
+        """
+        Full standings row for a team (pointPctg, wins, losses, goalDifferential, ...).
+
+        Args:
+            team_code: Three-letter team code (e.g., 'TOR')
+
+        Returns:
+            The raw standings dict, or None if the team has no standings row
+        """
+        with self._lock:
+            self._refresh()
+            standing = self._by_team.get(team_code)
+            if standing is None and team_code not in self._warned_teams:
+                print(f"Warning: no standings for {team_code} (source: {self.source})")
+                self._warned_teams.add(team_code)
+            return standing
@@ -0,0 +1,118 @@
+"""
+RosterArchive round trips: keyframes plus deltas must rebuild exactly the
+roster recorded on or before any date.
+
+    python -m pytest test_roster_archive.py
+"""
+
+import gzip
+import io
+import json
+import pytest
+from models import Name, Player, TeamRoster
+from roster_archive import RosterArchive
+
+
+def make_player(player_id: int, sweater_number: int = None) -> Player:
+    return Player(
+        id=player_id,
+        headshot=f"https://assets.nhle.com/mugs/nhl/20252026/TOR/{player_id}.png",
+        firstName=Name(default=f"First{player_id}"),
+        lastName=Name(default=f"Last{player_id}"),
+        sweaterNumber=sweater_number,
+        positionCode="C",
+        shootsCatches="L",
+        birthDate="2000-01-01",
+        birthCity=Name(default="Toronto"),
+        birthCountry="CAN",
+    )
+
+
+def make_roster(forwards=(), defensemen=(), goalies=()) -> TeamRoster:
+    return TeamRoster(
+        forwards=[make_player(*p) for p in forwards],
+        defensemen=[make_player(*p) for p in defensemen],
+        goalies=[make_player(*p) for p in goalies],
+    )
+
+
+def summary(roster: TeamRoster) -> dict:
+    """Group -> sorted (id, sweater number), so player order within a group doesn't matter"""
+    return {
+        group: sorted((p.id, p.sweaterNumber) for p in getattr(roster, group))
+        for group in ("forwards", "defensemen", "goalies")
+    }
+
+
+# Dated fetches crossing a keyframe boundary with keyframe_interval=2:
+# keyframe, delta, delta, keyframe, delta, delta
+HISTORY = [
+    ("2025-10-01", make_roster(forwards=[(1, 91), (2, 16)], goalies=[(3, 35)])),
+    ("2025-10-03", make_roster(forwards=[(1, 91), (2, 16), (4, 11)], goalies=[(3, 35)])),        # 4 added
+    ("2025-10-05", make_roster(forwards=[(1, 91), (4, 11)], goalies=[(3, 35)])),                 # 2 removed
+    ("2025-10-08", make_roster(forwards=[(1, 91), (4, 12)], goalies=[(3, 35)])),                 # 4 changed
+    ("2025-10-10", make_roster(forwards=[(1, 91), (4, 12)], defensemen=[(5, 44)], goalies=[(3, 35)])),
+    ("2025-10-12", make_roster(forwards=[(4, 12)], defensemen=[(5, 44), (1, 91)], goalies=[(3, 35)])),  # 1 moved
+]
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = RosterArchive(tmp_path, keyframe_interval=2)
+    for on_date, roster in HISTORY:
+        assert archive.record("TOR", roster, on_date)
+    return archive
+
+
+def test_roster_at_record_dates(archive):
+    for on_date, roster in HISTORY:
+        assert summary(archive.roster_at("TOR", on_date)) == summary(roster)
+
+
+def test_roster_at_between_and_after_records(archive):
+    # A date between two fetches sees the earlier one
+    assert summary(archive.roster_at("TOR", "2025-10-02")) == summary(HISTORY[0][1])
+    assert summary(archive.roster_at("TOR", "2025-10-09")) == summary(HISTORY[3][1])
+    assert summary(archive.roster_at("TOR", "2025-10-11")) == summary(HISTORY[4][1])
+    assert summary(archive.roster_at("TOR", "2026-01-01")) == summary(HISTORY[-1][1])
+
+
+def test_roster_at_before_first_record(archive):
+    assert archive.roster_at("TOR", "2025-09-30") is None
+    assert archive.roster_at("MTL", "2025-10-05") is None
+
+
+def test_fresh_instance_replays_from_disk(archive, tmp_path):
+    reopened = RosterArchive(tmp_path, keyframe_interval=2)
+    assert summary(reopened.roster_at("TOR", "2025-10-06")) == summary(HISTORY[2][1])
+    # Appending after a reopen diffs against the replayed state, not an empty roster
+    changed = make_roster(forwards=[(4, 12), (6, 29)], defensemen=[(5, 44), (1, 91)], goalies=[(3, 35)])
+    assert reopened.record("TOR", changed, "2025-10-14")
+    assert summary(reopened.roster_at("TOR", "2025-10-14")) == summary(changed)
+    assert summary(reopened.roster_at("TOR", "2025-10-13")) == summary(HISTORY[-1][1])
+
+
+def test_unchanged_roster_writes_nothing(archive):
+    size = archive.size_bytes()
+    assert not archive.record("TOR", HISTORY[-1][1], "2025-10-20")
+    assert archive.size_bytes() == size
+
+
+def test_rejects_out_of_order_dates(archive):
+    with pytest.raises(ValueError):
+        archive.record("TOR", HISTORY[0][1], "2025-10-11")
+
+
+def test_index_offsets_point_at_keyframes(archive, tmp_path):
+    with open(tmp_path / "TOR.idx.json") as f:
+        index = json.load(f)
+    assert [kf_date for kf_date, _ in index["keyframes"]] == ["2025-10-01", "2025-10-08"]
+    assert index["lastDate"] == "2025-10-12"
+
+    data = (tmp_path / "TOR.gz").read_bytes()
+    for kf_date, offset in index["keyframes"]:
+        # Each offset starts a gzip member whose first record is that date's keyframe
+        with gzip.GzipFile(fileobj=io.BytesIO(data[offset:])) as f:
+            record = json.loads(f.readline())
+        assert record["date"] == kf_date
+        assert "keyframe" in record